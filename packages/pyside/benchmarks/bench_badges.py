@@ -0,0 +1,130 @@
+"""Construction time and RSS of many VoidBadges.
+
+Compares the shared theme sheet (``VoidBadge[variant=...]`` rules) against
+the former per-instance stylesheets. Each mode runs in a fresh process so
+RSS numbers are not polluted by the other run.
+
+    python benchmarks/bench_badges.py [--count 10000] [--json out.json]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import subprocess
+import sys
+import time
+
+import harness
+
+VARIANTS = ("default", "peach", "moss", "sand", "blush", "lilac", "danger")
+
+
+def _legacy_badge_class():
+    """VoidBadge as it was before variants moved into the theme sheet."""
+    from PySide6.QtCore import Qt
+    from PySide6.QtWidgets import QLabel
+
+    from void_ui.colors import RADIUS, DarkColors
+
+    class LegacyBadge(QLabel):
+        def __init__(self, text="", variant="default", parent=None):
+            super().__init__(text, parent)
+            self._variant = variant
+            c = DarkColors
+            colors_map = {
+                "default": (c.elevated, c.gray, "transparent"),
+                "peach": (c.accent_bg, c.peach, "transparent"),
+                "moss": (c.success_bg, c.moss, "transparent"),
+                "sand": (c.warning_bg, c.sand, "transparent"),
+                "blush": ("rgba(212, 165, 165, 0.15)", c.blush, "transparent"),
+                "lilac": (c.info_bg, c.lilac, "transparent"),
+                "danger": (c.danger_bg, c.danger, "transparent"),
+            }
+            bg, fg, border = colors_map.get(variant, colors_map["default"])
+            self.setStyleSheet(f"""
+                LegacyBadge {{
+                    background: {bg};
+                    color: {fg};
+                    border: 1px solid {border};
+                    border-radius: {RADIUS.sm}px;
+                    padding: 3px 8px;
+                    font-size: 11px;
+                    font-weight: 500;
+                }}
+            """)
+            self.setAlignment(Qt.AlignCenter)
+
+    return LegacyBadge
+
+
+def run_mode(mode: str, count: int) -> dict:
+    from PySide6.QtWidgets import QVBoxLayout, QWidget
+
+    from void_ui import VoidBadge, apply_theme
+
+    app = harness.qapp()
+    apply_theme(app)
+    badge_cls = _legacy_badge_class() if mode == "legacy" else VoidBadge
+
+    root = QWidget()
+    layout = QVBoxLayout(root)
+    rss_before = harness.rss_bytes()
+
+    start = time.perf_counter()
+    badges = [badge_cls(f"job {i}", VARIANTS[i % len(VARIANTS)]) for i in range(count)]
+    construct = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for badge in badges:
+        layout.addWidget(badge)
+    root.show()
+    app.processEvents()
+    polish = time.perf_counter() - start
+
+    return {
+        "mode": mode,
+        "count": count,
+        "construct_s": construct,
+        "show_s": polish,
+        "rss_delta_bytes": harness.rss_bytes() - rss_before,
+        "peak_rss_bytes": harness.peak_rss_bytes(),
+    }
+
+
+def run(quick: bool = False, count: int | None = None) -> dict:
+    count = count or (2_000 if quick else 10_000)
+    results = {}
+    for mode in ("legacy", "shared"):
+        out = subprocess.run(
+            [sys.executable, __file__, "--mode", mode, "--count", str(count)],
+            check=True, capture_output=True, text=True,
+        ).stdout
+        results[mode] = json.loads(out.strip().splitlines()[-1])
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=10_000)
+    parser.add_argument("--json", help="write results to this file")
+    parser.add_argument("--mode", choices=("legacy", "shared"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.mode:
+        print(json.dumps(run_mode(args.mode, args.count)))
+        return
+
+    results = run(count=args.count)
+    print(f"{'mode':<8} {'construct':>10} {'show':>10} {'RSS delta':>12}")
+    for mode, r in results.items():
+        print(
+            f"{mode:<8} {r['construct_s'] * 1e3:>8.1f}ms {r['show_s'] * 1e3:>8.1f}ms"
+            f" {r['rss_delta_bytes'] / 2**20:>9.1f}MiB"
+        )
+    if args.json:
+        harness.write_json(args.json, results)
+
+
+if __name__ == "__main__":
+    main()
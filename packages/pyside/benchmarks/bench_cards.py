@@ -0,0 +1,104 @@
+"""Scrolling a dashboard of elevated VoidCards.
+
+Compares the cached nine-patch shadow (``DropShadow``) against the former
+``QGraphicsDropShadowEffect`` per card: a scroll area holding a grid of
+elevated cards with a label each is scrolled from top to bottom, repainting
+every step.
+
+    python benchmarks/bench_cards.py [--count 200] [--json out.json]
+"""
+
+from __future__ import annotations
+
+import argparse
+
+import harness
+
+
+def _legacy_card_class():
+    """VoidCard as it was before shadows were cached."""
+    from PySide6.QtGui import QColor
+    from PySide6.QtWidgets import QFrame, QGraphicsDropShadowEffect
+
+    from void_ui import VoidCard
+
+    class LegacyCard(VoidCard):
+        def _setup(self):
+            self.setFrameStyle(QFrame.StyledPanel)
+            self.setProperty("variant", self._variant)
+            shadow = QGraphicsDropShadowEffect(self)
+            shadow.setBlurRadius(16)
+            shadow.setOffset(0, 4)
+            shadow.setColor(QColor(0, 0, 0, 120))
+            self.setGraphicsEffect(shadow)
+
+    return LegacyCard
+
+
+def build_dashboard(count: int, legacy: bool):
+    from PySide6.QtWidgets import QGridLayout, QLabel, QScrollArea, QVBoxLayout, QWidget
+
+    from void_ui import VoidCard
+
+    card_cls = _legacy_card_class() if legacy else VoidCard
+    area = QScrollArea()
+    area.setWidgetResizable(True)
+    content = QWidget()
+    grid = QGridLayout(content)
+    grid.setSpacing(24)
+    for i in range(count):
+        card = card_cls(variant="elevated")
+        card.setMinimumSize(200, 120)
+        QVBoxLayout(card).addWidget(QLabel(f"shot {i:04d}"))
+        grid.addWidget(card, i // 4, i % 4)
+    area.setWidget(content)
+    area.resize(1000, 700)
+    area.show()
+    harness.qapp().processEvents()
+    return area
+
+
+def scroll_through(area, steps: int) -> None:
+    bar = area.verticalScrollBar()
+    for step in range(steps + 1):
+        bar.setValue(bar.maximum() * step // steps)
+        area.viewport().repaint()
+
+
+def run(quick: bool = False, count: int | None = None) -> dict:
+    from void_ui import apply_theme
+
+    count = count or (80 if quick else 200)
+    steps = 30 if quick else 100
+
+    app = harness.qapp()
+    apply_theme(app)
+
+    results = {}
+    for legacy in (True, False):
+        key = "effect" if legacy else "cached"
+        area = build_dashboard(count, legacy)
+        r = harness.measure(lambda: scroll_through(area, steps), repeat=3)
+        r["per_frame"] = r["median"] / (steps + 1)
+        r["fps"] = 1.0 / r["per_frame"]
+        results[f"{key}_scroll"] = r
+        area.deleteLater()
+        app.processEvents()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=200)
+    parser.add_argument("--json", help="write results to this file")
+    args = parser.parse_args()
+
+    results = run(count=args.count)
+    for name, r in results.items():
+        print(f"{name:<16} {r['per_frame'] * 1e3:>8.2f}ms/frame  ({r['fps']:.0f} fps)")
+    if args.json:
+        harness.write_json(args.json, results)
+
+
+if __name__ == "__main__":
+    main()
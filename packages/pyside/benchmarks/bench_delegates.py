@@ -0,0 +1,110 @@
+"""Delegate-painted badges/progress vs a VoidBadge + VoidProgress per row.
+
+Fills a job list with a status badge and a progress bar per row, either
+through ``setIndexWidget`` or through ``BadgeDelegate``/``ProgressDelegate``,
+then pages through every row repainting the viewport. Paint times are
+reported per 1000 painted rows; ``plain`` paints the same cells as text,
+the cost of the view itself.
+
+    python benchmarks/bench_delegates.py [--rows 1000] [--json out.json]
+"""
+
+from __future__ import annotations
+
+import argparse
+
+import harness
+
+STATUSES = (("queued", "default"), ("rendering", "peach"), ("done", "moss"), ("failed", "danger"))
+
+
+def build_view(rows: int, mode: str):
+    from PySide6.QtGui import QStandardItem, QStandardItemModel
+    from PySide6.QtWidgets import QTableView
+
+    from void_ui import VoidBadge, VoidProgress
+    from void_ui.delegates import VARIANT_ROLE, BadgeDelegate, ProgressDelegate
+
+    model = QStandardItemModel(rows, 3)
+    for row in range(rows):
+        status, variant = STATUSES[row % len(STATUSES)]
+        model.setItem(row, 0, QStandardItem(f"job {row}"))
+        badge = QStandardItem("" if mode == "widgets" else status)
+        badge.setData(variant, VARIANT_ROLE)
+        model.setItem(row, 1, badge)
+        model.setItem(row, 2, QStandardItem("" if mode == "widgets" else str(row % 101)))
+
+    view = QTableView()
+    view.setModel(model)
+    view.verticalHeader().setDefaultSectionSize(32)
+    view.resize(600, 800)
+    view.setColumnWidth(1, 120)
+    view.setColumnWidth(2, 200)
+    if mode == "delegates":
+        view.setItemDelegateForColumn(1, BadgeDelegate(parent=view))
+        view.setItemDelegateForColumn(2, ProgressDelegate(color="moss", parent=view))
+    elif mode == "widgets":
+        for row in range(rows):
+            status, variant = STATUSES[row % len(STATUSES)]
+            view.setIndexWidget(model.index(row, 1), VoidBadge(status, variant=variant))
+            view.setIndexWidget(model.index(row, 2), VoidProgress(value=row % 101, color="moss"))
+    view.show()
+    harness.qapp().processEvents()
+    return view
+
+
+def page_through(view) -> int:
+    """Repaint every page of the view; return the number of rows painted."""
+    bar = view.verticalScrollBar()
+    visible = view.viewport().height() // view.verticalHeader().defaultSectionSize()
+    painted = 0
+    bar.setValue(0)
+    while True:
+        view.repaint()
+        harness.qapp().processEvents()
+        painted += visible
+        if bar.value() >= bar.maximum():
+            return painted
+        bar.setValue(bar.value() + visible)
+
+
+def run(quick: bool = False, rows: int | None = None) -> dict:
+    from void_ui import apply_theme
+
+    rows = rows or (300 if quick else 1000)
+
+    app = harness.qapp()
+    apply_theme(app)
+
+    results = {}
+    for mode in ("plain", "widgets", "delegates"):
+        results[f"{mode}_setup"] = harness.measure(lambda: build_view(rows, mode).close(), repeat=3)
+        view = build_view(rows, mode)
+        painted = page_through(view)
+        r = harness.measure(lambda: page_through(view), repeat=3)
+        r["per_1000_rows"] = r["median"] * 1000 / painted
+        results[f"{mode}_paint"] = r
+        view.close()
+        view.deleteLater()
+        app.processEvents()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--json", help="write results to this file")
+    args = parser.parse_args()
+
+    results = run(rows=args.rows)
+    for name, r in results.items():
+        line = f"{name:<18} {r['median'] * 1e3:>8.1f}ms"
+        if "per_1000_rows" in r:
+            line += f"  ({r['per_1000_rows'] * 1e3:.1f}ms per 1000 rows)"
+        print(line)
+    if args.json:
+        harness.write_json(args.json, results)
+
+
+if __name__ == "__main__":
+    main()
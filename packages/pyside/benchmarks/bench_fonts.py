@@ -0,0 +1,113 @@
+"""Font stacks as written vs resolved against the font database.
+
+``first_window`` runs fresh interpreters that create the QApplication,
+build a window of labels, buttons, inputs and badges, apply the theme and
+render it once, with ``VOID_UI_RESOLVE_FONTS`` off and on; Qt's font
+caches are per process, so this is the cold path an application pays at
+startup. ``lookup`` times building a token font and measuring text with it,
+uncached vs through ``void_ui.fonts``.
+
+    python benchmarks/bench_fonts.py [--json out.json]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+import harness
+
+_SNIPPET = """
+import time
+start = time.perf_counter()
+from PySide6.QtWidgets import QApplication, QGridLayout, QWidget
+from void_ui import Theme, VoidBadge, VoidButton, VoidInput, VoidLabel
+app = QApplication([])
+window = QWidget()
+grid = QGridLayout(window)
+for i in range(200):
+    grid.addWidget(VoidLabel(f"label {i}"), i, 0)
+    grid.addWidget(VoidButton("open", variant="ghost"), i, 1)
+    grid.addWidget(VoidInput(placeholder="name"), i, 2)
+    grid.addWidget(VoidBadge("ok", variant="moss"), i, 3)
+Theme().apply(app)
+window.show()
+app.processEvents()
+window.grab()
+print(time.perf_counter() - start)
+"""
+
+
+def first_window(resolve: bool, repeat: int) -> dict:
+    env = dict(
+        os.environ,
+        PYTHONPATH=str(harness.SRC),
+        VOID_UI_RESOLVE_FONTS="1" if resolve else "0",
+        VOID_UI_PREWARM="0",
+    )
+    samples = []
+    for _ in range(repeat):
+        out = subprocess.run(
+            [sys.executable, "-c", _SNIPPET],
+            check=True, capture_output=True, text=True, env=env,
+        ).stdout
+        samples.append(float(out.strip().splitlines()[-1]))
+    return {"min": min(samples), "median": statistics.median(samples), "repeat": repeat}
+
+
+def lookup(number: int) -> dict:
+    from PySide6.QtGui import QFont, QFontMetrics
+
+    from void_ui import fonts
+    from void_ui.colors import TYPOGRAPHY
+
+    harness.qapp()
+    text = "shot_0420_comp_v012"
+    families = list(fonts.split_stack(TYPOGRAPHY.font_family))
+
+    def build_font():
+        font = QFont()
+        font.setFamilies(families)
+        font.setPixelSize(TYPOGRAPHY.size_sm)
+        font.setWeight(QFont.Medium)
+        return QFontMetrics(font).horizontalAdvance(text)
+
+    def cached_font():
+        metrics = fonts.metrics(TYPOGRAPHY.font_family, TYPOGRAPHY.size_sm, 500)
+        return metrics.horizontalAdvance(text)
+
+    return {
+        "token_font": harness.measure(build_font, repeat=5, number=number),
+        "token_font_cached": harness.measure(cached_font, repeat=5, number=number),
+    }
+
+
+def run(quick: bool = False) -> dict:
+    repeat = 3 if quick else 7
+    results = {
+        "first_window_stack": first_window(False, repeat),
+        "first_window_resolved": first_window(True, repeat),
+    }
+    results.update(lookup(2_000 if quick else 20_000))
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--json", help="write results to this file")
+    args = parser.parse_args()
+
+    results = run()
+    for key in ("first_window_stack", "first_window_resolved"):
+        print(f"{key:<24} {results[key]['median'] * 1e3:>8.1f}ms")
+    for key in ("token_font", "token_font_cached"):
+        print(f"{key:<24} {results[key]['median'] * 1e6:>8.2f}us")
+    if args.json:
+        harness.write_json(args.json, results)
+
+
+if __name__ == "__main__":
+    main()
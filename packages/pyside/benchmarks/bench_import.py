@@ -0,0 +1,35 @@
+"""Cold import time of void_ui, measured in fresh interpreters."""
+
+from __future__ import annotations
+
+import os
+import statistics
+import subprocess
+import sys
+
+import harness
+
+_SNIPPET = (
+    "import time; start = time.perf_counter(); import {module}; "
+    "print(time.perf_counter() - start)"
+)
+
+
+def cold_import(module: str, repeat: int) -> dict:
+    env = dict(os.environ, PYTHONPATH=str(harness.SRC), PYTHONDONTWRITEBYTECODE="1")
+    samples = []
+    for _ in range(repeat):
+        out = subprocess.run(
+            [sys.executable, "-c", _SNIPPET.format(module=module)],
+            check=True, capture_output=True, text=True, env=env,
+        ).stdout
+        samples.append(float(out.strip().splitlines()[-1]))
+    return {"min": min(samples), "median": statistics.median(samples), "repeat": repeat}
+
+
+def run(quick: bool = False) -> dict:
+    repeat = 3 if quick else 7
+    return {
+        module: cold_import(module, repeat)
+        for module in ("void_ui", "void_ui.colors", "void_ui.theme", "void_ui.widgets")
+    }
@@ -0,0 +1,103 @@
+"""Full vs lean (usage-pruned) stylesheets on a large dashboard.
+
+Builds a scroll area holding a grid of cards with labels, buttons, badges
+and progress bars, and compares ``theme.apply(app)`` against
+``theme.apply(app, lean=True)``: the time to install the sheet (parse and
+polish every widget), and the time per frame to repaint the dashboard
+while scrolling through it.
+
+    python benchmarks/bench_lean.py [--count 400] [--json out.json]
+"""
+
+from __future__ import annotations
+
+import argparse
+
+import harness
+
+
+def build_dashboard(count: int):
+    from PySide6.QtWidgets import QGridLayout, QHBoxLayout, QScrollArea, QVBoxLayout, QWidget
+
+    from void_ui import VoidBadge, VoidButton, VoidCard, VoidLabel, VoidProgress
+
+    area = QScrollArea()
+    area.setWidgetResizable(True)
+    content = QWidget()
+    grid = QGridLayout(content)
+    for i in range(count):
+        card = VoidCard()
+        layout = QVBoxLayout(card)
+        header = QWidget()
+        row = QHBoxLayout(header)
+        row.addWidget(VoidLabel(f"shot {i:04d}", style="white"))
+        row.addWidget(VoidBadge("ok", variant="moss"))
+        layout.addWidget(header)
+        layout.addWidget(VoidProgress(value=i % 100, color="moss"))
+        layout.addWidget(VoidButton("open", variant="ghost"))
+        grid.addWidget(card, i // 4, i % 4)
+    area.setWidget(content)
+    area.resize(1000, 700)
+    area.show()
+    harness.qapp().processEvents()
+    return area
+
+
+def scroll_through(area, steps: int) -> None:
+    bar = area.verticalScrollBar()
+    for step in range(steps + 1):
+        bar.setValue(bar.maximum() * step // steps)
+        area.viewport().repaint()
+
+
+def run(quick: bool = False, count: int | None = None) -> dict:
+    from void_ui.theme import Theme
+
+    count = count or (100 if quick else 400)
+    steps = 30 if quick else 100
+
+    app = harness.qapp()
+    theme = Theme()
+    area = build_dashboard(count)
+
+    results = {}
+    for lean in (False, True):
+        key = "lean" if lean else "full"
+
+        def apply():
+            app.setStyleSheet("")
+            app.processEvents()
+            theme.apply(app, lean=lean)
+            app.processEvents()
+
+        results[f"{key}_apply"] = harness.measure(apply, repeat=3)
+        r = harness.measure(lambda: scroll_through(area, steps), repeat=3)
+        r["per_frame"] = r["median"] / (steps + 1)
+        results[f"{key}_scroll"] = r
+        results[f"{key}_sheet_bytes"] = len(app.styleSheet())
+
+    area.deleteLater()
+    app.processEvents()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=400)
+    parser.add_argument("--json", help="write results to this file")
+    args = parser.parse_args()
+
+    results = run(count=args.count)
+    for key in ("full", "lean"):
+        apply, scroll = results[f"{key}_apply"], results[f"{key}_scroll"]
+        print(
+            f"{key:<5} apply {apply['median'] * 1e3:>8.1f}ms  "
+            f"scroll {scroll['per_frame'] * 1e3:>6.2f}ms/frame  "
+            f"sheet {results[f'{key}_sheet_bytes']} bytes"
+        )
+    if args.json:
+        harness.write_json(args.json, results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+"""Paint time of the QSS path vs the native style backend.
+
+Pages through large item views (a ``QTableView`` over a
+``QStandardItemModel`` and a ``QListView``) and scrolls a dashboard of
+buttons, badges and progress bars, once with ``Theme().apply(app)`` and
+once with ``Theme(native=True).apply(app)``. Paint times are reported per
+1000 painted rows for the views and per frame for the dashboard.
+
+    python benchmarks/bench_native.py [--rows 5000] [--json out.json]
+"""
+
+from __future__ import annotations
+
+import argparse
+
+import harness
+
+COLUMNS = 6
+
+
+def build_table(rows: int):
+    from PySide6.QtGui import QStandardItem, QStandardItemModel
+    from PySide6.QtWidgets import QTableView
+
+    model = QStandardItemModel(rows, COLUMNS)
+    for row in range(rows):
+        for column in range(COLUMNS):
+            model.setItem(row, column, QStandardItem(f"shot_{row:05d}.{column}"))
+    view = QTableView()
+    view.setModel(model)
+    view.verticalHeader().setDefaultSectionSize(28)
+    view.setSelectionBehavior(QTableView.SelectRows)
+    view.selectRow(3)
+    view.resize(900, 800)
+    return view
+
+
+def build_list(rows: int):
+    from PySide6.QtCore import QStringListModel
+    from PySide6.QtWidgets import QListView
+
+    view = QListView()
+    view.setModel(QStringListModel([f"asset {row:05d}" for row in range(rows)], view))
+    view.setUniformItemSizes(True)
+    view.resize(400, 800)
+    return view
+
+
+def build_dashboard(count: int):
+    from PySide6.QtWidgets import QGridLayout, QScrollArea, QVBoxLayout, QWidget
+
+    from void_ui import VoidBadge, VoidButton, VoidCard, VoidLabel, VoidProgress
+
+    area = QScrollArea()
+    area.setWidgetResizable(True)
+    content = QWidget()
+    grid = QGridLayout(content)
+    for i in range(count):
+        card = VoidCard()
+        layout = QVBoxLayout(card)
+        layout.addWidget(VoidLabel(f"shot {i:04d}", style="white"))
+        layout.addWidget(VoidBadge("ok", variant="moss"))
+        layout.addWidget(VoidProgress(value=i % 100, color="moss"))
+        layout.addWidget(VoidButton("open", variant="primary" if i % 2 else "default"))
+        grid.addWidget(card, i // 4, i % 4)
+    area.setWidget(content)
+    area.resize(1000, 700)
+    return area
+
+
+def page_through(view) -> int:
+    """Repaint every page of ``view``; return the number of rows painted."""
+    bar = view.verticalScrollBar()
+    visible = max(1, view.viewport().height() // max(1, view.sizeHintForRow(0)))
+    painted = 0
+    bar.setValue(0)
+    while True:
+        view.viewport().repaint()
+        painted += visible
+        if bar.value() >= bar.maximum():
+            return painted
+        bar.setValue(bar.value() + visible)
+
+
+def scroll_through(area, steps: int) -> None:
+    bar = area.verticalScrollBar()
+    for step in range(steps + 1):
+        bar.setValue(bar.maximum() * step // steps)
+        area.viewport().repaint()
+
+
+def run(quick: bool = False, rows: int | None = None) -> dict:
+    from void_ui.theme import Theme
+
+    rows = rows or (1000 if quick else 5000)
+    cards = 60 if quick else 200
+    steps = 30 if quick else 100
+
+    app = harness.qapp()
+    table, listing, dashboard = build_table(rows), build_list(rows), build_dashboard(cards)
+    for widget in (table, listing, dashboard):
+        widget.show()
+    app.processEvents()
+
+    results = {}
+    for native in (False, True):
+        key = "native" if native else "qss"
+        Theme(native=native).apply(app)
+        app.processEvents()
+        for name, view in (("table", table), ("list", listing)):
+            painted = page_through(view)
+            r = harness.measure(lambda: page_through(view), repeat=3)
+            r["per_1000_rows"] = r["median"] * 1000 / painted
+            results[f"{key}_{name}_paint"] = r
+        r = harness.measure(lambda: scroll_through(dashboard, steps), repeat=3)
+        r["per_frame"] = r["median"] / (steps + 1)
+        results[f"{key}_dashboard_scroll"] = r
+
+    for widget in (table, listing, dashboard):
+        widget.close()
+        widget.deleteLater()
+    app.processEvents()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--json", help="write results to this file")
+    args = parser.parse_args()
+
+    results = run(rows=args.rows)
+    for name, r in results.items():
+        line = f"{name:<24} {r['median'] * 1e3:>8.1f}ms"
+        if "per_1000_rows" in r:
+            line += f"  ({r['per_1000_rows'] * 1e3:.1f}ms per 1000 rows)"
+        if "per_frame" in r:
+            line += f"  ({r['per_frame'] * 1e3:.2f}ms/frame)"
+        print(line)
+    if args.json:
+        harness.write_json(args.json, results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""Repolish cost of bulk variant changes, with and without batch_polish().
+
+Builds a visible panel of VoidButtons, then flips every button through two
+variants, the way a tool refreshes job state.
+
+    python benchmarks/bench_polish.py [--count 500] [--json out.json]
+"""
+
+from __future__ import annotations
+
+import argparse
+
+import harness
+
+
+def build_panel(count: int, batched: bool):
+    from PySide6.QtWidgets import QVBoxLayout, QWidget
+
+    from void_ui import VoidButton, batch_polish
+
+    root = QWidget()
+    layout = QVBoxLayout(root)
+    root.show()
+
+    def build():
+        buttons = [VoidButton(f"job {i}") for i in range(count)]
+        for button in buttons:
+            layout.addWidget(button)
+        return buttons
+
+    if batched:
+        with batch_polish():
+            buttons = build()
+    else:
+        buttons = build()
+    harness.qapp().processEvents()
+    return root, buttons
+
+
+def restyle(buttons, batched: bool) -> None:
+    from void_ui import batch_polish
+
+    def flip():
+        for button in buttons:
+            button.variant = "primary"
+            button.variant = "ghost"
+
+    if batched:
+        with batch_polish():
+            flip()
+    else:
+        flip()
+
+
+def run(quick: bool = False, count: int | None = None) -> dict:
+    from void_ui import apply_theme
+
+    count = count or (100 if quick else 500)
+
+    app = harness.qapp()
+    apply_theme(app)
+
+    results = {}
+    for batched in (False, True):
+        key = "batched" if batched else "immediate"
+        root, buttons = build_panel(count, batched)
+        results[f"construct_{key}"] = harness.measure(
+            lambda: build_panel(count, batched), repeat=3
+        )
+        results[f"restyle_{key}"] = harness.measure(lambda: restyle(buttons, batched), repeat=3)
+        root.deleteLater()
+        app.processEvents()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=500)
+    parser.add_argument("--json", help="write results to this file")
+    args = parser.parse_args()
+
+    results = run(count=args.count)
+    for name, r in results.items():
+        print(f"{name:<22} {r['median'] * 1e3:>8.1f}ms")
+    if args.json:
+        harness.write_json(args.json, results)
+
+
+if __name__ == "__main__":
+    main()
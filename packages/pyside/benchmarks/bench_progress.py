@@ -0,0 +1,86 @@
+"""High-rate VoidProgress updates, stylesheet vs painted mode.
+
+Shows a panel of progress bars and pushes a burst of ``setValue`` calls
+spread over all of them, then runs the event loop until every bar has
+painted its final value, the way a render monitor reports frame progress.
+
+    python benchmarks/bench_progress.py [--bars 300] [--updates 20000] [--json out.json]
+"""
+
+from __future__ import annotations
+
+import argparse
+
+import harness
+
+
+def build_panel(bars: int, painted: bool):
+    from PySide6.QtWidgets import QVBoxLayout, QWidget
+
+    from void_ui import VoidProgress
+
+    root = QWidget()
+    layout = QVBoxLayout(root)
+    layout.setSpacing(2)
+    widgets = [VoidProgress(color="moss", painted=painted) for _ in range(bars)]
+    for widget in widgets:
+        layout.addWidget(widget)
+    root.resize(400, bars * 10)
+    root.show()
+    harness.qapp().processEvents()
+    return root, widgets
+
+
+def burst(widgets, updates: int, offset: int) -> None:
+    from void_ui.clock import frame_clock
+
+    app = harness.qapp()
+    count = len(widgets)
+    for i in range(updates):
+        widgets[i % count].setValue((i // count + offset) % 101)
+        if i % count == count - 1:
+            app.processEvents()
+    clock = frame_clock()
+    while clock.running:
+        app.processEvents()
+    app.processEvents()
+
+
+def run(quick: bool = False, bars: int | None = None, updates: int | None = None) -> dict:
+    from void_ui import apply_theme
+
+    bars = bars or (100 if quick else 300)
+    updates = updates or (5_000 if quick else 20_000)
+
+    app = harness.qapp()
+    apply_theme(app)
+
+    results = {}
+    for painted in (False, True):
+        key = "painted" if painted else "stylesheet"
+        root, widgets = build_panel(bars, painted)
+        offsets = iter(range(1_000_000))
+        r = harness.measure(lambda: burst(widgets, updates, next(offsets)), repeat=3)
+        r["per_update"] = r["median"] / updates
+        results[f"{key}_burst"] = r
+        root.deleteLater()
+        app.processEvents()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--bars", type=int, default=300)
+    parser.add_argument("--updates", type=int, default=20_000)
+    parser.add_argument("--json", help="write results to this file")
+    args = parser.parse_args()
+
+    results = run(bars=args.bars, updates=args.updates)
+    for name, r in results.items():
+        print(f"{name:<18} {r['median'] * 1e3:>8.1f}ms  ({r['per_update'] * 1e6:.1f}us per update)")
+    if args.json:
+        harness.write_json(args.json, results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""VoidTable over large render-farm job tables.
+
+Scrolls a visible table from top to bottom in fixed steps, repainting each
+step, over a NumPy array and an SQLite query, and records the RSS growth.
+
+    python benchmarks/bench_table.py [--rows 1000000] [--json out.json]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sqlite3
+
+import harness
+
+STATUSES = ("queued", "rendering", "done", "failed")
+
+
+def job_array(rows: int):
+    import numpy as np
+
+    jobs = np.zeros(rows, dtype=[
+        ("id", "i8"), ("shot", "U12"), ("frames", "i4"), ("progress", "f4"), ("status", "U10"),
+    ])
+    jobs["id"] = np.arange(rows)
+    jobs["shot"] = np.char.add("sh", (np.arange(rows) % 5000).astype("U5"))
+    jobs["frames"] = 24 + np.arange(rows) % 240
+    jobs["progress"] = (np.arange(rows) % 101) / 100
+    jobs["status"] = np.array(STATUSES)[np.arange(rows) % len(STATUSES)]
+    return jobs
+
+
+def job_database(rows: int) -> sqlite3.Connection:
+    connection = sqlite3.connect(":memory:")
+    connection.execute(
+        "CREATE TABLE jobs (id INTEGER PRIMARY KEY, shot TEXT, frames INTEGER, status TEXT)"
+    )
+    connection.executemany(
+        "INSERT INTO jobs VALUES (?, ?, ?, ?)",
+        ((i, f"sh{i % 5000:04d}", 24 + i % 240, STATUSES[i % 4]) for i in range(rows)),
+    )
+    return connection
+
+
+def scroll_through(table, steps: int) -> None:
+    bar = table.verticalScrollBar()
+    for step in range(steps + 1):
+        bar.setValue(bar.maximum() * step // steps)
+        table.viewport().repaint()
+
+
+def run(quick: bool = False, rows: int | None = None) -> dict:
+    from void_ui import VoidTable, apply_theme
+    from void_ui.table import ArraySource, SqliteSource
+
+    rows = rows or (100_000 if quick else 1_000_000)
+    steps = 50 if quick else 200
+
+    app = harness.qapp()
+    apply_theme(app)
+
+    sources = {
+        "array": lambda: ArraySource(job_array(rows)),
+        "sqlite": lambda: SqliteSource(job_database(rows), "SELECT * FROM jobs ORDER BY id"),
+    }
+    results = {}
+    for name, make in sources.items():
+        source = make()
+        rss_before = harness.rss_bytes()
+
+        def setup():
+            table = VoidTable()
+            table.set_source(source)
+            table.resize(1000, 700)
+            table.show()
+            app.processEvents()
+            return table
+
+        results[f"{name}_setup"] = harness.measure(setup, repeat=3)
+        table = setup()
+        r = harness.measure(lambda: scroll_through(table, steps), repeat=3)
+        r["per_step"] = r["median"] / steps
+        results[f"{name}_scroll"] = r
+        results[f"{name}_rss_growth_bytes"] = harness.rss_bytes() - rss_before
+        table.deleteLater()
+        app.processEvents()
+    results["rows"] = rows
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--json", help="write results to this file")
+    args = parser.parse_args()
+
+    results = run(rows=args.rows)
+    for name, r in results.items():
+        if isinstance(r, dict):
+            print(f"{name:<22} {r['median'] * 1e3:>8.1f}ms")
+        else:
+            print(f"{name:<22} {r:>12}")
+    if args.json:
+        harness.write_json(args.json, results)
+
+
+if __name__ == "__main__":
+    main()
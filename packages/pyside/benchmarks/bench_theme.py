@@ -0,0 +1,166 @@
+"""Theme generation and application.
+
+Times Theme.generate_qss, Theme.apply on widget trees of increasing size,
+toggle + re-apply, the incremental Theme.switch, the first switch of a
+session with and without background pre-warming (Python side only), and theming every panel
+of a tree under a host application sheet: the plain sheet per panel, the
+scoped sheets of the panels (shared on their plain parent), and the scoped
+sheet once on the panels' container.
+"""
+
+from __future__ import annotations
+
+import time
+
+import harness
+
+TREE_SIZES = (1_000, 10_000, 50_000)
+QUICK_TREE_SIZES = (1_000, 10_000)
+
+
+def build_tree(count: int):
+    """A shown window holding ``count`` mixed widgets in nested containers."""
+    from PySide6.QtWidgets import QLineEdit, QMainWindow, QVBoxLayout, QWidget
+
+    from void_ui import VoidBadge, VoidButton, VoidLabel
+
+    window = QMainWindow()
+    central = QWidget()
+    window.setCentralWidget(central)
+    outer = QVBoxLayout(central)
+
+    made = 0
+    while made < count:
+        group = QWidget()
+        layout = QVBoxLayout(group)
+        for i in range(min(9, count - made - 1)):
+            kind = i % 4
+            if kind == 0:
+                layout.addWidget(VoidLabel("status", style="muted"))
+            elif kind == 1:
+                layout.addWidget(VoidButton("run", variant="ghost"))
+            elif kind == 2:
+                layout.addWidget(VoidBadge("ok", variant="moss"))
+            else:
+                layout.addWidget(QLineEdit())
+            made += 1
+        outer.addWidget(group)
+        made += 1
+
+    window.show()
+    harness.qapp().processEvents()
+    return window
+
+
+def run(quick: bool = False) -> dict:
+    from void_ui.theme import Theme, clear_qss_cache
+
+    app = harness.qapp()
+    theme = Theme()
+    results = {}
+
+    def cold_generate():
+        clear_qss_cache()
+        theme.generate_qss()
+
+    results["generate_qss_cold"] = harness.measure(cold_generate, repeat=5, number=20)
+    results["generate_qss_cached"] = harness.measure(theme.generate_qss, repeat=5, number=1000)
+
+    for size in QUICK_TREE_SIZES if quick else TREE_SIZES:
+        window = build_tree(size)
+        repeat = 1 if size >= 50_000 else 3
+
+        def apply():
+            app.setStyleSheet("")
+            theme.apply(app)
+            app.processEvents()
+
+        def toggle():
+            theme.toggle()
+            theme.apply(app)
+            app.processEvents()
+
+        results[f"apply_{size}"] = harness.measure(apply, repeat=repeat)
+        results[f"toggle_apply_{size}"] = harness.measure(toggle, repeat=repeat)
+
+        start = time.perf_counter()
+        theme.apply(app, switchable=True)
+        app.processEvents()
+        results[f"apply_switchable_{size}"] = {"median": time.perf_counter() - start}
+
+        touched = []
+
+        def switch():
+            touched.append(theme.switch(app))
+            app.processEvents()
+
+        results[f"switch_{size}"] = harness.measure(switch, repeat=repeat)
+        results[f"switch_{size}"]["widgets_touched"] = touched[-1]
+
+        window.deleteLater()
+        app.setStyleSheet("")
+        app.processEvents()
+
+    results["first_switch_cold"] = _first_switch(prewarmed=False)
+    results["first_switch_prewarmed"] = _first_switch(prewarmed=True)
+
+    for size in QUICK_TREE_SIZES:
+        results[f"apply_per_panel_{size}"] = _apply_panels(theme, size, "plain")
+        results[f"apply_scoped_{size}"] = _apply_panels(theme, size, "scoped")
+        results[f"apply_scoped_container_{size}"] = _apply_panels(theme, size, "container")
+
+    return results
+
+
+def _first_switch(prewarmed: bool) -> dict:
+    """Python-side cost of the first switch of a fresh theme, caches empty.
+
+    Everything ``switch()`` renders before handing sheets to Qt: the other
+    mode's sheet, the rule diff, and the painted widgets' brushes.
+    """
+    from void_ui import prewarm, widgets
+    from void_ui.theme import Theme, ThemeMode, clear_qss_cache
+
+    app = harness.qapp()
+    clear_qss_cache()
+    widgets._progress_brushes.cache_clear()
+    prewarm.set_enabled(prewarmed)
+    theme = Theme()
+    theme.apply(app)
+    prewarm.wait()
+    prewarm.set_enabled(True)
+
+    start = time.perf_counter()
+    changed = theme.diff(ThemeMode.LIGHT)
+    theme.toggle()
+    theme.generate_qss()
+    theme.generate_switchable_qss()
+    widgets._progress_brushes(theme.colors)
+    elapsed = time.perf_counter() - start
+    app.setStyleSheet("")
+    return {"median": elapsed, "rules_changed": len(changed)}
+
+
+def _apply_panels(theme, size: int, how: str) -> dict:
+    """Theme the panels of a fresh tree under a host application sheet."""
+    from PySide6.QtWidgets import QWidget
+
+    app = harness.qapp()
+    app.setStyleSheet("QPushButton { background: #303030; }")
+    window = build_tree(size)
+    panels = [w for w in window.centralWidget().children() if isinstance(w, QWidget)]
+    start = time.perf_counter()
+    if how == "scoped":
+        theme.apply(panels, scoped=True)
+    elif how == "container":
+        theme.apply(window.centralWidget(), scoped=True)
+    else:
+        sheet = theme.generate_qss()
+        for panel in panels:
+            panel.setStyleSheet(sheet)
+    app.processEvents()
+    elapsed = time.perf_counter() - start
+    window.deleteLater()
+    app.setStyleSheet("")
+    app.processEvents()
+    return {"median": elapsed, "panels": len(panels)}
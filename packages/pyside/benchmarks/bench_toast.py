@@ -0,0 +1,92 @@
+"""Notification bursts, a widget per message vs ToastManager.
+
+Posts a burst of notifications (many of them repeats, as during a batch
+publish) over a window and processes events once, the way a tool reports
+per-item results. The naive variant builds a frame, label and close button
+per message and stacks them; ``ToastManager`` reuses pooled toasts,
+collapses duplicates and rate-limits the rest.
+
+    python benchmarks/bench_toast.py [--messages 500] [--distinct 50] [--json out.json]
+"""
+
+from __future__ import annotations
+
+import argparse
+
+import harness
+
+
+def naive_burst(host, messages: list[str]) -> None:
+    from PySide6.QtWidgets import QFrame, QHBoxLayout, QLabel, QPushButton
+
+    y = host.height() - 24
+    for message in messages:
+        frame = QFrame(host)
+        layout = QHBoxLayout(frame)
+        layout.addWidget(QLabel(message))
+        layout.addWidget(QPushButton("x"))
+        frame.adjustSize()
+        y -= frame.height() + 8
+        frame.move(host.width() - 24 - frame.width(), y)
+        frame.show()
+    harness.qapp().processEvents()
+    for frame in host.findChildren(QFrame):
+        frame.deleteLater()
+    harness.qapp().processEvents()
+
+
+def manager_burst(manager, messages: list[str]) -> None:
+    for message in messages:
+        manager.show(message, "success")
+    harness.qapp().processEvents()
+    manager.clear()
+
+
+def run(quick: bool = False, messages: int | None = None, distinct: int | None = None) -> dict:
+    from PySide6.QtWidgets import QWidget
+
+    from void_ui import ToastManager, apply_theme
+
+    messages = messages or (200 if quick else 500)
+    distinct = distinct or 50
+    texts = [f"Published shot {i % distinct:03d}" for i in range(messages)]
+
+    app = harness.qapp()
+    apply_theme(app)
+    host = QWidget()
+    host.resize(1200, 800)
+    host.show()
+    app.processEvents()
+
+    results = {}
+    r = harness.measure(lambda: naive_burst(host, texts), repeat=3)
+    r["per_message"] = r["median"] / messages
+    results["naive_burst"] = r
+
+    manager = ToastManager(host)
+    r = harness.measure(lambda: manager_burst(manager, texts), repeat=3)
+    r["per_message"] = r["median"] / messages
+    results["manager_burst"] = r
+
+    host.deleteLater()
+    app.processEvents()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--messages", type=int, default=500)
+    parser.add_argument("--distinct", type=int, default=50)
+    parser.add_argument("--json", help="write results to this file")
+    args = parser.parse_args()
+
+    results = run(messages=args.messages, distinct=args.distinct)
+    for name, r in results.items():
+        per_message = r["per_message"] * 1e6
+        print(f"{name:<16} {r['median'] * 1e3:>8.2f}ms  ({per_message:.1f}us per message)")
+    if args.json:
+        harness.write_json(args.json, results)
+
+
+if __name__ == "__main__":
+    main()
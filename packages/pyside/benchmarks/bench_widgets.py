@@ -0,0 +1,47 @@
+"""Construction cost of every widget in void_ui.widgets."""
+
+from __future__ import annotations
+
+import harness
+
+
+def _factories():
+    from void_ui import VoidBadge, VoidButton, VoidCard, VoidInput, VoidLabel, VoidProgress
+
+    return {
+        "VoidButton": lambda: VoidButton("Deploy", variant="primary"),
+        "VoidLabel": lambda: VoidLabel("Pipeline", style="white"),
+        "VoidInput": lambda: VoidInput(placeholder="Name..."),
+        "VoidCard": lambda: VoidCard(),
+        "VoidCard[elevated]": lambda: VoidCard(variant="elevated"),
+        "VoidCard[interactive]": lambda: VoidCard(variant="interactive"),
+        "VoidBadge": lambda: VoidBadge("Active", variant="peach"),
+        "VoidProgress": lambda: VoidProgress(value=50, color="moss"),
+    }
+
+
+def run(quick: bool = False) -> dict:
+    from PySide6.QtWidgets import QVBoxLayout, QWidget
+
+    from void_ui import apply_theme
+
+    app = harness.qapp()
+    apply_theme(app)
+    count = 200 if quick else 1_000
+
+    results = {}
+    for name, factory in _factories().items():
+        def construct():
+            root = QWidget()
+            layout = QVBoxLayout(root)
+            for _ in range(count):
+                layout.addWidget(factory())
+            root.show()
+            app.processEvents()
+            root.deleteLater()
+            app.processEvents()
+
+        r = harness.measure(construct, repeat=3)
+        r["per_widget"] = r["median"] / count
+        results[name] = r
+    return results
@@ -0,0 +1,67 @@
+"""Compare two benchmark reports written by run.py.
+
+    python benchmarks/compare.py baseline.json results.json [--threshold 0.1]
+
+Exits with status 1 when any timing regressed by more than the threshold.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+
+
+def _timings(report: dict) -> dict[str, float]:
+    """Flatten a report into {"suite/metric": seconds}."""
+    flat = {}
+
+    def walk(prefix: str, node) -> None:
+        if not isinstance(node, dict):
+            return
+        if "median" in node:
+            flat[prefix] = node["median"]
+            return
+        for key, value in node.items():
+            walk(f"{prefix}/{key}" if prefix else key, value)
+
+    for suite, data in report["suites"].items():
+        walk(suite, data["results"])
+    return flat
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("baseline")
+    parser.add_argument("current")
+    parser.add_argument("--threshold", type=float, default=0.1,
+                        help="relative slowdown counted as a regression (default: 0.1)")
+    args = parser.parse_args()
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    with open(args.current) as f:
+        current = json.load(f)
+
+    base, head = _timings(baseline), _timings(current)
+    regressions = 0
+    print(f"{'metric':<44} {'baseline':>11} {'current':>11} {'change':>8}")
+    for name in sorted(base.keys() & head.keys()):
+        old, new = base[name], head[name]
+        change = (new - old) / old if old else 0.0
+        flag = ""
+        if change > args.threshold:
+            flag = "  REGRESSION"
+            regressions += 1
+        print(f"{name:<44} {old * 1e3:>9.3f}ms {new * 1e3:>9.3f}ms {change:>+7.1%}{flag}")
+
+    for suite in sorted(baseline["suites"].keys() & current["suites"].keys()):
+        old = baseline["suites"][suite].get("peak_rss_bytes", 0)
+        new = current["suites"][suite].get("peak_rss_bytes", 0)
+        print(f"{suite + '/peak_rss':<44} {old / 2**20:>8.1f}MiB {new / 2**20:>8.1f}MiB")
+
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Shared helpers for the void_ui benchmarks.
+
+Benchmarks run headless: the offscreen Qt platform is selected unless
+QT_QPA_PLATFORM is already set. The on-disk sheet cache goes to a
+temporary directory unless VOID_UI_CACHE_DIR is set, so runs neither read
+nor fill the user's cache.
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+if "VOID_UI_CACHE_DIR" not in os.environ:
+    os.environ["VOID_UI_CACHE_DIR"] = tempfile.mkdtemp(prefix="void-ui-bench-cache-")
+    atexit.register(shutil.rmtree, os.environ["VOID_UI_CACHE_DIR"], ignore_errors=True)
+
+SRC = Path(__file__).resolve().parent.parent / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+
+def qapp():
+    """Return the running QApplication, creating one if needed."""
+    from PySide6.QtWidgets import QApplication
+
+    return QApplication.instance() or QApplication([])
+
+
+def measure(fn: Callable[[], object], repeat: int = 5, number: int = 1) -> dict:
+    """Time ``fn`` and summarize per-call seconds over ``repeat`` rounds."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        samples.append((time.perf_counter() - start) / number)
+    return {
+        "min": min(samples),
+        "median": statistics.median(samples),
+        "mean": statistics.fmean(samples),
+        "repeat": repeat,
+        "number": number,
+    }
+
+
+def rss_bytes() -> int:
+    """Current resident set size of this process."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        return peak_rss_bytes()
+
+
+def peak_rss_bytes() -> int:
+    """Peak resident set size of this process."""
+    import resource
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and kilobytes elsewhere.
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def write_json(path: str | os.PathLike, results: dict) -> None:
+    Path(path).write_text(json.dumps(results, indent=2, sort_keys=True) + "\n")
@@ -0,0 +1,102 @@
+"""Run the void_ui benchmark suite and save the results as JSON.
+
+Each suite runs in its own interpreter, so peak RSS is reported per suite.
+
+    QT_QPA_PLATFORM=offscreen python benchmarks/run.py -o results.json
+    python benchmarks/run.py --quick --suite theme --suite widgets
+    python benchmarks/compare.py baseline.json results.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime
+import importlib
+import json
+import platform
+import subprocess
+import sys
+from pathlib import Path
+
+import harness
+
+SUITES = {
+    "import": "bench_import",
+    "theme": "bench_theme",
+    "widgets": "bench_widgets",
+    "polish": "bench_polish",
+    "badges": "bench_badges",
+    "table": "bench_table",
+    "delegates": "bench_delegates",
+    "progress": "bench_progress",
+    "cards": "bench_cards",
+    "toast": "bench_toast",
+    "lean": "bench_lean",
+    "native": "bench_native",
+    "fonts": "bench_fonts",
+}
+
+HERE = Path(__file__).resolve().parent
+
+
+def run_suite(name: str, quick: bool) -> dict:
+    """Run one suite in this process and return its results."""
+    module = importlib.import_module(SUITES[name])
+    results = module.run(quick=quick)
+    return {"results": results, "peak_rss_bytes": harness.peak_rss_bytes()}
+
+
+def _git_revision() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=HERE, check=True, capture_output=True, text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _metadata() -> dict:
+    import PySide6
+
+    return {
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "revision": _git_revision(),
+        "python": platform.python_version(),
+        "pyside6": PySide6.__version__,
+        "platform": platform.platform(),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-o", "--output", help="write results to this JSON file")
+    parser.add_argument(
+        "--suite", action="append", choices=sorted(SUITES),
+        help="suite to run (repeatable, default: all)",
+    )
+    parser.add_argument("--quick", action="store_true", help="smaller sizes, fewer rounds")
+    parser.add_argument("--in-process", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.in_process:
+        print(json.dumps(run_suite(args.in_process, args.quick)))
+        return
+
+    report = {"meta": _metadata(), "suites": {}}
+    for name in args.suite or SUITES:
+        cmd = [sys.executable, str(HERE / "run.py"), "--in-process", name]
+        if args.quick:
+            cmd.append("--quick")
+        print(f"running {name}...", file=sys.stderr)
+        out = subprocess.run(cmd, check=True, capture_output=True, text=True).stdout
+        report["suites"][name] = json.loads(out.strip().splitlines()[-1])
+
+    if args.output:
+        harness.write_json(args.output, report)
+    else:
+        print(json.dumps(report, indent=2, sort_keys=True))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,20 +1,57 @@
 """Void UI for PySide6.
 
 Cryptic tech aesthetic. Warm void, soft pastels, Japanese and tech vibes.
+
+Design tokens load eagerly; theme and widget symbols are imported on first
+access, so ``import void_ui`` or ``void_ui.colors`` never loads Qt.
 """
 
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING
+
 __version__ = "0.1.0"
 
-from void_ui.theme import Theme, apply_theme
-from void_ui.colors import Colors, DarkColors, LightColors
-from void_ui.widgets import (
-    VoidButton,
-    VoidCard,
-    VoidInput,
-    VoidLabel,
-    VoidBadge,
-    VoidProgress,
-)
+from void_ui.colors import Colors, DarkColors, LightColors, VoidColor
+
+if TYPE_CHECKING:
+    from void_ui.delegates import BadgeDelegate, ProgressDelegate
+    from void_ui.table import VoidTable, VoidTableModel
+    from void_ui.theme import Theme, apply_theme
+    from void_ui.toast import ToastManager, VoidToast
+    from void_ui.widgets import (
+        VoidBadge,
+        VoidButton,
+        VoidCard,
+        VoidInput,
+        VoidLabel,
+        VoidProgress,
+        batch_polish,
+        live_widgets,
+        widget_stats,
+    )
+
+# Public name -> module that defines it, loaded on first attribute access.
+_LAZY_ATTRS = {
+    "Theme": "void_ui.theme",
+    "apply_theme": "void_ui.theme",
+    "VoidButton": "void_ui.widgets",
+    "VoidCard": "void_ui.widgets",
+    "VoidInput": "void_ui.widgets",
+    "VoidLabel": "void_ui.widgets",
+    "VoidBadge": "void_ui.widgets",
+    "VoidProgress": "void_ui.widgets",
+    "VoidTable": "void_ui.table",
+    "VoidTableModel": "void_ui.table",
+    "BadgeDelegate": "void_ui.delegates",
+    "ProgressDelegate": "void_ui.delegates",
+    "VoidToast": "void_ui.toast",
+    "ToastManager": "void_ui.toast",
+    "batch_polish": "void_ui.widgets",
+    "live_widgets": "void_ui.widgets",
+    "widget_stats": "void_ui.widgets",
+}
 
 __all__ = [
     "Theme",
@@ -22,10 +59,33 @@ __all__ = [
     "Colors",
     "DarkColors",
     "LightColors",
+    "VoidColor",
     "VoidButton",
     "VoidCard",
     "VoidInput",
     "VoidLabel",
     "VoidBadge",
     "VoidProgress",
+    "VoidTable",
+    "VoidTableModel",
+    "BadgeDelegate",
+    "ProgressDelegate",
+    "VoidToast",
+    "ToastManager",
+    "batch_polish",
+    "live_widgets",
+    "widget_stats",
 ]
+
+
+def __getattr__(name: str):
+    module = _LAZY_ATTRS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,247 @@
+"""Void UI animation engine.
+
+One ``Animator`` drives every tween of every Void widget from the shared
+frame clock. Tweens are keyed by (owner, key): starting a tween for a key
+that is already animating retargets it from its current value. The clock
+only runs while a tween is active, so widgets that are not animating cost
+nothing.
+
+Numbers interpolate linearly and ``VoidColor`` values per channel on their
+packed RGBA, so painting code can tween between the parsed tokens of a
+``Colors`` scheme without parsing colors per frame.
+
+With reduced motion enabled (``set_reduced_motion(True)``, or the
+``VOID_UI_REDUCED_MOTION`` environment variable) tweens jump to their end
+value immediately.
+
+Usage:
+    from void_ui.animation import animator
+
+    animator().animate(widget, "glow", 0.0, 1.0, 0.15, widget.set_glow)
+    animator().animate(
+        bar, "chunk", colors.color("moss"), colors.color("danger"), 0.2, bar.set_chunk_color
+    )
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from collections.abc import Callable
+from typing import Any
+
+try:
+    import shiboken6
+    from PySide6.QtCore import QCoreApplication, QObject
+    HAS_PYSIDE = True
+except ImportError:
+    HAS_PYSIDE = False
+    QObject = object
+
+from void_ui.clock import frame_clock
+from void_ui.colors import VoidColor
+
+Easing = Callable[[float], float]
+
+
+def linear(t: float) -> float:
+    return t
+
+
+def ease_out_cubic(t: float) -> float:
+    return 1 - (1 - t) ** 3
+
+
+def ease_in_out_cubic(t: float) -> float:
+    return 4 * t * t * t if t < 0.5 else 1 - (-2 * t + 2) ** 3 / 2
+
+
+def lerp_rgba(a: int, b: int, t: float) -> int:
+    """Interpolate two packed ``0xRRGGBBAA`` colors per channel."""
+    result = 0
+    for shift in (24, 16, 8, 0):
+        start = (a >> shift) & 0xFF
+        end = (b >> shift) & 0xFF
+        result |= round(start + (end - start) * t) << shift
+    return result
+
+
+def lerp_color(a: VoidColor, b: VoidColor, t: float) -> VoidColor:
+    """Interpolate two colors; returns ``a`` or ``b`` themselves at the ends."""
+    if t <= 0 or a.rgba == b.rgba:
+        return a
+    if t >= 1:
+        return b
+    return VoidColor(lerp_rgba(a.rgba, b.rgba, t))
+
+
+def _interpolate(start: Any, end: Any, t: float) -> Any:
+    if isinstance(start, VoidColor):
+        return lerp_color(start, end, t)
+    return start + (end - start) * t
+
+
+_reduced_motion = os.environ.get("VOID_UI_REDUCED_MOTION", "").lower() in ("1", "true", "yes")
+
+
+def reduced_motion() -> bool:
+    """Whether Void widgets skip animations."""
+    return _reduced_motion
+
+
+def set_reduced_motion(enabled: bool) -> None:
+    """Switch animations off (or back on) for all Void widgets.
+
+    Tweens already running jump to their end value.
+    """
+    global _reduced_motion
+
+    _reduced_motion = enabled
+    if enabled and _animator is not None and shiboken6.isValid(_animator):
+        _animator.finish_all()
+
+
+class Tween:
+    """A running animation of one value, created by :meth:`Animator.animate`."""
+
+    __slots__ = (
+        "owner", "key", "start", "end", "duration", "easing", "step", "done", "started", "value"
+    )
+
+    def __init__(
+        self,
+        owner: QObject,
+        key: str,
+        start: Any,
+        end: Any,
+        duration: float,
+        easing: Easing,
+        step: Callable[[Any], None],
+        done: Callable[[], None] | None,
+        started: float,
+    ) -> None:
+        self.owner = owner
+        self.key = key
+        self.start = start
+        self.end = end
+        self.duration = duration
+        self.easing = easing
+        self.step = step
+        self.done = done
+        self.started = started
+        self.value = start
+
+    def advance(self, now: float) -> bool:
+        """Step to ``now``; returns False once the end value is reached."""
+        t = (now - self.started) / self.duration
+        if t >= 1:
+            self.value = self.end
+            self.step(self.end)
+            return False
+        self.value = _interpolate(self.start, self.end, self.easing(max(t, 0.0)))
+        self.step(self.value)
+        return True
+
+
+class Animator(QObject):
+    """Ticks all active tweens once per frame from the shared frame clock.
+
+    ``step`` is called with each new value and ``done`` once the tween
+    completes (not when it is cancelled or retargeted). Tweens of deleted
+    owners are dropped.
+    """
+
+    def __init__(self, parent: QObject | None = None) -> None:
+        if not HAS_PYSIDE:
+            raise ImportError("PySide6 is required: pip install void-ui[pyside]")
+
+        super().__init__(parent)
+        self._tweens: dict[tuple[int, str], Tween] = {}
+
+    def animate(
+        self,
+        owner: QObject,
+        key: str,
+        start: Any,
+        end: Any,
+        duration: float,
+        step: Callable[[Any], None],
+        easing: Easing = ease_out_cubic,
+        done: Callable[[], None] | None = None,
+    ) -> None:
+        """Tween ``owner``'s ``key`` from ``start`` to ``end`` over ``duration`` seconds.
+
+        ``start=None`` continues from the value of the running tween for the
+        same key, or jumps to ``end`` if there is none.
+        """
+        slot = (id(owner), key)
+        running = self._tweens.pop(slot, None)
+        if start is None:
+            start = running.value if running is not None else end
+        if duration <= 0 or _reduced_motion or start == end:
+            step(end)
+            if done is not None:
+                done()
+            return
+        self._tweens[slot] = Tween(
+            owner, key, start, end, duration, easing, step, done, time.perf_counter()
+        )
+        frame_clock().add(self._tick)
+
+    def cancel(self, owner: QObject, key: str | None = None) -> None:
+        """Stop ``owner``'s tween for ``key`` (or all of them) where it is."""
+        if key is not None:
+            self._tweens.pop((id(owner), key), None)
+            return
+        for slot in [s for s, tween in self._tweens.items() if tween.owner is owner]:
+            del self._tweens[slot]
+
+    def finish_all(self) -> None:
+        """Jump every running tween to its end value."""
+        tweens, self._tweens = self._tweens, {}
+        for tween in tweens.values():
+            if shiboken6.isValid(tween.owner):
+                tween.step(tween.end)
+                if tween.done is not None:
+                    tween.done()
+
+    def value(self, owner: QObject, key: str) -> Any:
+        """The current value of ``owner``'s tween for ``key``, or None."""
+        tween = self._tweens.get((id(owner), key))
+        return tween.value if tween is not None else None
+
+    def is_animating(self, owner: QObject, key: str | None = None) -> bool:
+        if key is not None:
+            return (id(owner), key) in self._tweens
+        return any(tween.owner is owner for tween in self._tweens.values())
+
+    @property
+    def active(self) -> int:
+        """Number of running tweens."""
+        return len(self._tweens)
+
+    def _tick(self, now: float) -> bool:
+        finished = []
+        for slot, tween in list(self._tweens.items()):
+            if not shiboken6.isValid(tween.owner):
+                self._tweens.pop(slot, None)
+            elif not tween.advance(now):
+                # A step or done callback may have retargeted the slot.
+                if self._tweens.get(slot) is tween:
+                    del self._tweens[slot]
+                finished.append(tween)
+        for tween in finished:
+            if tween.done is not None:
+                tween.done()
+        return bool(self._tweens)
+
+
+_animator: Animator | None = None
+
+
+def animator() -> Animator:
+    """The application-wide animator, created on first use."""
+    global _animator
+    if _animator is None or not shiboken6.isValid(_animator):
+        _animator = Animator(parent=QCoreApplication.instance())
+    return _animator
@@ -0,0 +1,199 @@
+"""Void UI update bus.
+
+Collects widget updates posted from any thread and applies them on the GUI
+thread in one batch per event-loop turn. Updates are keyed by (widget,
+property) and only the latest value per key is applied, so a worker that
+reports progress thousands of times per second costs one ``setValue`` per
+bar per turn.
+
+Usage:
+    from void_ui.bus import update_bus
+
+    bus = update_bus()                      # from any thread
+    bus.post(progress, "value", 42)         # -> progress.setValue(42)
+    bus.post(badge, "variant", "danger")    # -> badge.variant = "danger"
+    bus.post(label, "text", "Rendering")    # -> label.setText("Rendering")
+    print(bus.stats())
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+from typing import Any, NamedTuple
+
+try:
+    import shiboken6
+    from PySide6.QtCore import QCoreApplication, QObject, Qt, Signal
+    HAS_PYSIDE = True
+except ImportError:
+    HAS_PYSIDE = False
+    QObject = object
+
+
+class BusStats(NamedTuple):
+    """Counters of an :class:`UpdateBus`.
+
+    ``coalesced`` counts posts replaced by a later value for the same key
+    before being applied; ``dropped`` counts updates discarded because the
+    widget was deleted, the setter failed or the queue was full. Latencies
+    are seconds from the first post of a key to its application.
+    """
+
+    posted: int
+    applied: int
+    coalesced: int
+    dropped: int
+    batches: int
+    pending: int
+    mean_latency: float
+    max_latency: float
+
+
+# (type, property) -> setter(widget, value)
+_setters: dict[tuple[type, str], Callable[[Any, Any], None]] = {}
+
+
+def _setter(cls: type, prop: str) -> Callable[[Any, Any], None]:
+    """Resolve ``prop`` to a Python property or a Qt ``setProp`` method."""
+    setter = _setters.get((cls, prop))
+    if setter is None:
+        attr = getattr(cls, prop, None)
+        method = getattr(cls, f"set{prop[:1].upper()}{prop[1:]}", None)
+        if isinstance(attr, property) and attr.fset is not None:
+            def setter(widget, value, _prop=prop):
+                setattr(widget, _prop, value)
+        elif method is not None:
+            def setter(widget, value, _method=method):
+                _method(widget, value)
+        else:
+            def setter(widget, value, _prop=prop):
+                widget.setProperty(_prop, value)
+        _setters[(cls, prop)] = setter
+    return setter
+
+
+class UpdateBus(QObject):
+    """Thread-safe, coalescing widget update queue.
+
+    ``post`` may be called from any thread. The bus lives in the GUI thread
+    and applies everything pending in one batch on the next event-loop turn,
+    inside :func:`void_ui.widgets.batch_polish`. ``max_pending`` bounds the
+    number of distinct pending keys; posts for new keys beyond it are
+    dropped.
+    """
+
+    if HAS_PYSIDE:
+        _wake = Signal()
+
+    def __init__(self, max_pending: int | None = None, parent: QObject | None = None) -> None:
+        if not HAS_PYSIDE:
+            raise ImportError("PySide6 is required: pip install void-ui[pyside]")
+
+        super().__init__(parent)
+        self.max_pending = max_pending
+        self._lock = threading.Lock()
+        # (id(widget), prop) -> [widget, prop, value, first_post_time]
+        self._pending: dict[tuple[int, str], list] = {}
+        self._scheduled = False
+        self._posted = self._applied = self._coalesced = self._dropped = self._batches = 0
+        self._latency_total = self._latency_max = 0.0
+        self._wake.connect(self.flush, Qt.QueuedConnection)
+
+    def post(self, widget: QObject, prop: str, value: Any) -> None:
+        """Queue ``widget.<prop> = value``, replacing any pending value."""
+        key = (id(widget), prop)
+        with self._lock:
+            self._posted += 1
+            entry = self._pending.get(key)
+            if entry is not None:
+                entry[2] = value
+                self._coalesced += 1
+                return
+            if self.max_pending is not None and len(self._pending) >= self.max_pending:
+                self._dropped += 1
+                return
+            self._pending[key] = [widget, prop, value, time.perf_counter()]
+            if self._scheduled:
+                return
+            self._scheduled = True
+        self._wake.emit()
+
+    def flush(self) -> int:
+        """Apply pending updates now (GUI thread only). Returns the number applied."""
+        from void_ui.widgets import batch_polish
+
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            self._scheduled = False
+        if not pending:
+            return 0
+
+        now = time.perf_counter()
+        applied = dropped = 0
+        latency_total = latency_max = 0.0
+        with batch_polish():
+            for widget, prop, value, posted_at in pending.values():
+                if not shiboken6.isValid(widget):
+                    dropped += 1
+                    continue
+                try:
+                    _setter(type(widget), prop)(widget, value)
+                except (RuntimeError, TypeError, ValueError):
+                    dropped += 1
+                    continue
+                applied += 1
+                latency = now - posted_at
+                latency_total += latency
+                latency_max = max(latency_max, latency)
+
+        with self._lock:
+            self._applied += applied
+            self._dropped += dropped
+            self._batches += 1
+            self._latency_total += latency_total
+            self._latency_max = max(self._latency_max, latency_max)
+        return applied
+
+    def discard(self, widget: QObject) -> None:
+        """Forget pending updates of ``widget``, e.g. before deleting it."""
+        with self._lock:
+            for key in [k for k in self._pending if k[0] == id(widget)]:
+                del self._pending[key]
+
+    def stats(self) -> BusStats:
+        with self._lock:
+            mean = self._latency_total / self._applied if self._applied else 0.0
+            return BusStats(
+                self._posted,
+                self._applied,
+                self._coalesced,
+                self._dropped,
+                self._batches,
+                len(self._pending),
+                mean,
+                self._latency_max,
+            )
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._posted = self._applied = self._coalesced = self._dropped = self._batches = 0
+            self._latency_total = self._latency_max = 0.0
+
+
+_bus: UpdateBus | None = None
+_bus_lock = threading.Lock()
+
+
+def update_bus() -> UpdateBus:
+    """The application-wide update bus, created on first use from any thread."""
+    global _bus
+    with _bus_lock:
+        if _bus is None or not shiboken6.isValid(_bus):
+            bus = UpdateBus()
+            app = QCoreApplication.instance()
+            if app is not None and bus.thread() is not app.thread():
+                bus.moveToThread(app.thread())
+            _bus = bus
+        return _bus
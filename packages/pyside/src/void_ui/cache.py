@@ -0,0 +1,189 @@
+"""Void UI on-disk stylesheet cache.
+
+Rendered sheets are stored per cache key, a digest of the void_ui version,
+the QSS template and the design tokens, so any change to them starts a
+fresh entry. Entries carry a checksum header; unreadable, corrupt or stale
+files are ignored and rebuilt by the caller.
+
+Lookup order is the pre-rendered sheets shipped as package data (see
+``python -m void_ui.cache build``), then the user cache directory. Set
+``VOID_UI_CACHE_DIR`` to relocate the user cache, or to an empty string to
+disable it. Entries of previous keys are deleted when a new key is stored.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+PACKAGE_DIR = Path(__file__).resolve().parent / "qss"
+
+_HEADER_PREFIX = b"/* void-ui "
+_HEADER_SUFFIX = b" */\n"
+
+
+def digest(*parts: object) -> str:
+    """Stable short digest of the ``repr`` of ``parts``."""
+    h = hashlib.sha256()
+    for part in parts:
+        h.update(repr(part).encode("utf-8"))
+        h.update(b"\0")
+    return h.hexdigest()[:16]
+
+
+def cache_dir() -> Path | None:
+    """The user cache directory, or ``None`` when disabled."""
+    override = os.environ.get("VOID_UI_CACHE_DIR")
+    if override is not None:
+        return Path(override) if override else None
+
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or Path.home() / "AppData" / "Local"
+    elif sys.platform == "darwin":
+        base = Path.home() / "Library" / "Caches"
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "void-ui"
+
+
+def _encode(key: str, text: str) -> bytes:
+    body = text.encode("utf-8")
+    checksum = hashlib.sha256(body).hexdigest()[:16]
+    return _HEADER_PREFIX + f"{key} {checksum}".encode("ascii") + _HEADER_SUFFIX + body
+
+
+def _decode(key: str, data: bytes) -> str | None:
+    header, sep, body = data.partition(_HEADER_SUFFIX)
+    if not sep or not header.startswith(_HEADER_PREFIX):
+        return None
+    try:
+        entry_key, checksum = header[len(_HEADER_PREFIX):].decode("ascii").split()
+    except (UnicodeDecodeError, ValueError):
+        return None
+    if entry_key != key or hashlib.sha256(body).hexdigest()[:16] != checksum:
+        return None
+    return body.decode("utf-8")
+
+
+def _read(path: Path, key: str) -> str | None:
+    try:
+        data = path.read_bytes()
+    except OSError:
+        return None
+    return _decode(key, data)
+
+
+def _write(path: Path, key: str, text: str) -> None:
+    """Atomically replace ``path`` with an encoded entry."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(prefix=path.name, suffix=".tmp", dir=path.parent)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(_encode(key, text))
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def load(key: str, name: str) -> str | None:
+    """Return the cached sheet ``name`` for ``key``, or ``None`` on a miss."""
+    text = _read(PACKAGE_DIR / f"{name}.qss", key)
+    if text is not None:
+        return text
+    directory = cache_dir()
+    if directory is None:
+        return None
+    return _read(directory / key / f"{name}.qss", key)
+
+
+def store(key: str, name: str, text: str) -> None:
+    """Write the sheet ``name`` for ``key`` to the user cache.
+
+    Only the current key is kept: the first store for a key deletes the
+    entries of every other key. Failures (read-only home, full disk) are
+    ignored: the cache is an optimization only.
+    """
+    directory = cache_dir()
+    if directory is None:
+        return
+    fresh = not (directory / key).is_dir()
+    try:
+        _write(directory / key / f"{name}.qss", key, text)
+    except OSError:
+        return
+    if fresh:
+        _prune(directory, key)
+
+
+def _is_key(name: str) -> bool:
+    return len(name) == 16 and all(c in "0123456789abcdef" for c in name)
+
+
+def _prune(directory: Path, keep: str) -> None:
+    """Delete the entries of keys other than ``keep``, e.g. of older versions."""
+    try:
+        stale = [p for p in directory.iterdir() if p.name != keep and _is_key(p.name)]
+    except OSError:
+        return
+    for path in stale:
+        if path.is_dir():
+            shutil.rmtree(path, ignore_errors=True)
+
+
+def build(directory: Path = PACKAGE_DIR) -> list[Path]:
+    """Pre-render the sheet of every mode into ``directory``.
+
+    Run before building a wheel so installs ship ready-made sheets. The
+    sheets name the font stacks as written; they are resolved against the
+    installed families at load time, not on the machine that built them.
+    """
+    from void_ui.colors import RADIUS, SPACING, TYPOGRAPHY
+    from void_ui.theme import (
+        _COMPILED_QSS,
+        ThemeMode,
+        _mode_colors,
+        _render_template,
+        disk_cache_key,
+    )
+
+    key = disk_cache_key()
+    written = []
+    for mode in ThemeMode:
+        path = directory / f"{mode.value}.qss"
+        qss = _render_template(_COMPILED_QSS, _mode_colors(mode), SPACING, RADIUS, TYPOGRAPHY)
+        _write(path, key, qss)
+        written.append(path)
+    return written
+
+
+def main(argv: list[str] | None = None) -> None:
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="python -m void_ui.cache")
+    sub = parser.add_subparsers(dest="command", required=True)
+    build_cmd = sub.add_parser("build", help="pre-render sheets as package data")
+    build_cmd.add_argument("--output", type=Path, default=PACKAGE_DIR)
+    sub.add_parser("info", help="show the cache key and directories")
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        for path in build(args.output):
+            print(path)
+    else:
+        from void_ui.theme import disk_cache_key
+
+        print(f"key:     {disk_cache_key()}")
+        print(f"package: {PACKAGE_DIR}")
+        print(f"user:    {cache_dir() or '(disabled)'}")
+
+
+if __name__ == "__main__":
+    main()
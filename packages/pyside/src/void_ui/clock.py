@@ -0,0 +1,126 @@
+"""Void UI frame clock.
+
+One application-wide timer, ticking once per display frame, that drives
+coalesced repaints and animations of Void widgets. The timer only runs
+while callbacks are registered, so idle widgets cost nothing.
+
+Usage:
+    from void_ui.clock import frame_clock
+
+    clock = frame_clock()
+    clock.call_once(widget.flush)  # next frame, however often it is requested
+    clock.add(widget.animate)      # every frame until it returns False
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+
+try:
+    import shiboken6
+    from PySide6.QtCore import QCoreApplication, QObject, Qt, QTimer
+    from PySide6.QtGui import QGuiApplication
+    HAS_PYSIDE = True
+except ImportError:
+    HAS_PYSIDE = False
+    QObject = object
+
+# Used when the screen refresh rate is unknown.
+DEFAULT_FPS = 60.0
+
+FrameCallback = Callable[[float], bool | None]
+
+
+def _alive(callback: FrameCallback) -> bool:
+    owner = getattr(callback, "__self__", None)
+    return not isinstance(owner, QObject) or shiboken6.isValid(owner)
+
+
+class FrameClock(QObject):
+    """Calls registered callbacks once per frame with the frame time.
+
+    Callbacks receive ``time.perf_counter()`` at the start of the frame.
+    Registrations are keyed by the callback itself, so registering the same
+    bound method twice is a no-op. Callbacks bound to deleted QObjects are
+    dropped.
+    """
+
+    def __init__(self, fps: float | None = None, parent: QObject | None = None) -> None:
+        if not HAS_PYSIDE:
+            raise ImportError("PySide6 is required: pip install void-ui[pyside]")
+
+        super().__init__(parent)
+        if fps is None:
+            screen = QGuiApplication.primaryScreen() if QGuiApplication.instance() else None
+            fps = screen.refreshRate() if screen is not None else 0.0
+        self._interval = 1.0 / (fps if fps > 0 else DEFAULT_FPS)
+        self._once: dict[FrameCallback, None] = {}
+        self._every: dict[FrameCallback, None] = {}
+        self._frames = 0
+        self._timer = QTimer(self)
+        self._timer.setTimerType(Qt.PreciseTimer)
+        self._timer.setInterval(max(1, round(self._interval * 1000)))
+        self._timer.timeout.connect(self._tick)
+
+    @property
+    def interval(self) -> float:
+        """Seconds between frames."""
+        return self._interval
+
+    @property
+    def frames(self) -> int:
+        """Number of frames ticked so far."""
+        return self._frames
+
+    @property
+    def running(self) -> bool:
+        return self._timer.isActive()
+
+    def call_once(self, callback: FrameCallback) -> None:
+        """Call ``callback`` on the next frame."""
+        self._once[callback] = None
+        self._start()
+
+    def add(self, callback: FrameCallback) -> None:
+        """Call ``callback`` every frame until it returns ``False`` or is removed."""
+        self._every[callback] = None
+        self._start()
+
+    def remove(self, callback: FrameCallback) -> None:
+        self._once.pop(callback, None)
+        self._every.pop(callback, None)
+
+    def __contains__(self, callback: FrameCallback) -> bool:
+        return callback in self._once or callback in self._every
+
+    def _start(self) -> None:
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def _tick(self) -> None:
+        now = time.perf_counter()
+        self._frames += 1
+
+        once, self._once = self._once, {}
+        for callback in once:
+            if _alive(callback):
+                callback(now)
+
+        for callback in list(self._every):
+            if not _alive(callback) or callback(now) is False:
+                self._every.pop(callback, None)
+
+        if not self._once and not self._every:
+            self._timer.stop()
+
+
+_clock: FrameClock | None = None
+
+
+def frame_clock() -> FrameClock:
+    """The application-wide frame clock, created on first use."""
+    global _clock
+    if _clock is None or not shiboken6.isValid(_clock):
+        _clock = FrameClock(parent=QCoreApplication.instance())
+    return _clock
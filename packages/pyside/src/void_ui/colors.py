@@ -3,12 +3,164 @@
 All colors match the CSS custom properties from @void-ui/css.
 """
 
-from dataclasses import dataclass
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, fields
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from PySide6.QtGui import QBrush, QColor
+
+_RGB_FUNC_RE = re.compile(
+    r"^rgba?\(\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)\s*(?:,\s*([\d.]+)\s*)?\)$"
+)
+
+
+class VoidColor:
+    """A parsed color token.
+
+    Stores the color as one packed ``0xRRGGBBAA`` integer next to the
+    original token text, which ``str()`` returns unchanged for use in QSS.
+    ``QColor``/``QBrush`` conversions are created once and cached.
+
+    Usage:
+        peach = VoidColor.parse("#e8a87c")
+        peach.rgba          # 0xe8a87cff
+        str(peach)          # "#e8a87c"
+        painter.setBrush(peach.qbrush())
+    """
+
+    __slots__ = ("_rgba", "_text", "_qcolor", "_qbrush")
+
+    def __init__(self, rgba: int, text: str | None = None) -> None:
+        self._rgba = rgba & 0xFFFFFFFF
+        self._text = text
+        self._qcolor = None
+        self._qbrush = None
+
+    @classmethod
+    def from_rgba(cls, r: int, g: int, b: int, a: int = 255) -> VoidColor:
+        return cls((r << 24) | (g << 16) | (b << 8) | a)
+
+    @classmethod
+    def parse(cls, text: str) -> VoidColor:
+        """Parse ``#rgb``, ``#rrggbb``, ``#rrggbbaa``, ``rgb()``/``rgba()`` or
+        ``transparent``. Results are interned per token text."""
+        return _parse(text)
+
+    @property
+    def rgba(self) -> int:
+        return self._rgba
+
+    @property
+    def red(self) -> int:
+        return self._rgba >> 24
+
+    @property
+    def green(self) -> int:
+        return (self._rgba >> 16) & 0xFF
+
+    @property
+    def blue(self) -> int:
+        return (self._rgba >> 8) & 0xFF
+
+    @property
+    def alpha(self) -> int:
+        return self._rgba & 0xFF
+
+    @property
+    def alpha_f(self) -> float:
+        return self.alpha / 255
+
+    def rgb_tuple(self) -> tuple[int, int, int, int]:
+        rgba = self._rgba
+        return rgba >> 24, (rgba >> 16) & 0xFF, (rgba >> 8) & 0xFF, rgba & 0xFF
+
+    def qcolor(self) -> QColor:
+        """The color as a cached ``QColor``. Treat it as read-only."""
+        if self._qcolor is None:
+            from PySide6.QtGui import QColor
+
+            self._qcolor = QColor(*self.rgb_tuple())
+        return self._qcolor
+
+    def qbrush(self) -> QBrush:
+        """A cached solid ``QBrush`` of the color. Treat it as read-only."""
+        if self._qbrush is None:
+            from PySide6.QtGui import QBrush
+
+            self._qbrush = QBrush(self.qcolor())
+        return self._qbrush
+
+    def __str__(self) -> str:
+        if self._text is not None:
+            return self._text
+        r, g, b, a = self.rgb_tuple()
+        if a == 255:
+            return f"#{r:02x}{g:02x}{b:02x}"
+        return f"rgba({r}, {g}, {b}, {round(a / 255, 3)})"
+
+    def __format__(self, spec: str) -> str:
+        return format(str(self), spec)
+
+    def __repr__(self) -> str:
+        return f"VoidColor({str(self)!r})"
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, VoidColor):
+            return NotImplemented
+        return self._rgba == other._rgba
+
+    def __hash__(self) -> int:
+        return hash(self._rgba)
+
+
+# Bounded so generating many candidate schemes does not grow it forever;
+# least recently used tokens go first.
+_PARSED_MAXSIZE = 4096
+
+
+@lru_cache(maxsize=_PARSED_MAXSIZE)
+def _parse(text: str) -> VoidColor:
+    return VoidColor(_parse_rgba(text), text)
+
+
+def _parse_rgba(text: str) -> int:
+    value = text.strip().lower()
+    if value == "transparent":
+        return 0
+    if value.startswith("#"):
+        digits = value[1:]
+        if len(digits) in (3, 4):
+            digits = "".join(ch * 2 for ch in digits)
+        if len(digits) == 6:
+            digits += "ff"
+        if len(digits) == 8:
+            try:
+                return int(digits, 16)
+            except ValueError:
+                pass
+    else:
+        match = _RGB_FUNC_RE.match(value)
+        if match:
+            r, g, b = (min(int(v), 255) for v in match.group(1, 2, 3))
+            alpha = match.group(4)
+            a = 255 if alpha is None else round(min(float(alpha), 1.0) * 255)
+            return (r << 24) | (g << 16) | (b << 8) | a
+    raise ValueError(f"Unsupported color: {text!r}")
 
 
 @dataclass(frozen=True)
 class Colors:
-    """Base color scheme interface."""
+    """Base color scheme interface.
+
+    Fields hold the token strings used in QSS. ``color()`` and ``qcolor()``
+    return the parsed forms for painting code; every field is parsed once
+    when the scheme is created and kept on the instance, so its cached
+    ``QColor``/``QBrush`` objects outlive evictions from the parse cache.
+    """
 
     # Surfaces
     void: str
@@ -51,6 +203,22 @@ class Colors:
     glass_bg: str
     glass_border: str
 
+    def __post_init__(self) -> None:
+        parsed = {field.name: VoidColor.parse(getattr(self, field.name)) for field in fields(self)}
+        object.__setattr__(self, "_parsed", parsed)
+
+    def color(self, name: str) -> VoidColor:
+        """The parsed form of token ``name``."""
+        return self._parsed[name]
+
+    def qcolor(self, name: str) -> QColor:
+        """The cached ``QColor`` of token ``name``."""
+        return self._parsed[name].qcolor()
+
+    def qbrush(self, name: str) -> QBrush:
+        """The cached solid ``QBrush`` of token ``name``."""
+        return self._parsed[name].qbrush()
+
 
 # Dark theme (default)
 DarkColors = Colors(
@@ -0,0 +1,231 @@
+"""Void UI item delegates.
+
+``QStyledItemDelegate`` subclasses that paint ``VoidBadge`` and
+``VoidProgress`` lookalikes straight from model data, for item views with
+too many rows for ``setIndexWidget``. They share the variant tables of the
+widgets (``theme.BADGE_VARIANTS`` / ``theme.PROGRESS_COLORS``), so both
+render identically in either mode.
+
+Without a ``theme`` they follow the colors of the most recently applied or
+switched Theme. Views do not own their delegates: pass the view as
+``parent`` (or keep a reference) so the delegate outlives it.
+
+Usage:
+    delegate = BadgeDelegate(theme, variants={"failed": "danger"}, parent=view)
+    view.setItemDelegateForColumn(3, delegate)
+    view.setItemDelegateForColumn(4, ProgressDelegate(theme, color="moss", parent=view))
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Any
+
+try:
+    from PySide6.QtCore import QModelIndex, QRect, QRectF, QSize, Qt
+    from PySide6.QtGui import QFont, QFontMetrics, QPainter
+    from PySide6.QtWidgets import QStyle, QStyledItemDelegate, QStyleOptionViewItem, QWidget
+    HAS_PYSIDE = True
+except ImportError:
+    HAS_PYSIDE = False
+    QStyledItemDelegate = object
+    Qt = None
+
+from void_ui.colors import RADIUS, SPACING, Colors, VoidColor
+from void_ui.theme import Theme, badge_colors
+from void_ui.widgets import _paint_bar, _progress_brushes, active_colors
+
+# Model roles read by the delegates when set on an index.
+VARIANT_ROLE = Qt.UserRole + 1 if HAS_PYSIDE else None
+VALUE_ROLE = Qt.UserRole + 2 if HAS_PYSIDE else None
+
+# Badge metrics, matching the VoidBadge rules of the shared sheet.
+_BADGE_FONT_SIZE = 11
+_BADGE_PADDING = (8, 3)
+# Badge texts are usually a handful of statuses; sizes are cached per text.
+_SIZE_CACHE_MAXSIZE = 1024
+# VoidProgress height.
+_PROGRESS_HEIGHT = 8
+
+
+@lru_cache(maxsize=8)
+def _badge_palette(colors: Colors) -> dict[str, tuple[Any, Any]]:
+    return {
+        variant: (VoidColor.parse(bg).qbrush(), VoidColor.parse(fg).qcolor())
+        for variant, (bg, fg) in badge_colors(colors).items()
+    }
+
+
+class _VoidDelegate(QStyledItemDelegate):
+    def __init__(self, theme: Theme | None = None, parent: QWidget | None = None) -> None:
+        if not HAS_PYSIDE:
+            raise ImportError("PySide6 is required: pip install void-ui[pyside]")
+
+        super().__init__(parent)
+        self.theme = theme
+
+    @property
+    def colors(self) -> Colors:
+        return self.theme.colors if self.theme is not None else active_colors()
+
+    def _paint_background(self, painter: QPainter, option: QStyleOptionViewItem) -> None:
+        """Paint the hover and selection fills of the item view rules."""
+        state = option.state
+        if state & QStyle.State_Selected:
+            painter.fillRect(option.rect, self.colors.qbrush("accent_bg"))
+        elif state & QStyle.State_MouseOver:
+            painter.fillRect(option.rect, self.colors.qbrush("raised"))
+
+
+class BadgeDelegate(_VoidDelegate):
+    """Paints the display text of an index as a ``VoidBadge``.
+
+    The variant comes from ``VARIANT_ROLE`` when the model sets it, then
+    from ``variants`` (display text -> variant), then ``default``.
+
+    Usage:
+        delegate = BadgeDelegate(theme, variants={"done": "moss", "failed": "danger"}, parent=view)
+        view.setItemDelegateForColumn(status_column, delegate)
+    """
+
+    def __init__(
+        self,
+        theme: Theme | None = None,
+        variants: dict[str, str] | None = None,
+        default: str = "default",
+        parent: QWidget | None = None,
+    ) -> None:
+        super().__init__(theme, parent)
+        self.variants = dict(variants or {})
+        self.default = default
+        self._fonts: dict[str, tuple[str, QFont, QFontMetrics]] = {}
+        self._sizes: dict[tuple[str, str], QSize] = {}
+
+    def _font(self, base: QFont) -> tuple[str, QFont, QFontMetrics]:
+        """The badge font for ``base``, its metrics and the key of ``base``.
+
+        ``QFont.key()`` costs more than the lookups it keys, so it is taken
+        once per paint and reused for the size cache.
+        """
+        key = base.key()
+        cached = self._fonts.get(key)
+        if cached is None:
+            font = QFont(base)
+            font.setPixelSize(_BADGE_FONT_SIZE)
+            font.setWeight(QFont.Medium)
+            cached = self._fonts[key] = (key, font, QFontMetrics(font))
+        return cached
+
+    def _variant(self, index: QModelIndex, text: str) -> str:
+        variant = index.data(VARIANT_ROLE)
+        if variant is None:
+            variant = self.variants.get(text, self.default)
+        return variant
+
+    def _badge_size(self, font_key: str, metrics: QFontMetrics, text: str) -> QSize:
+        key = (font_key, text)
+        size = self._sizes.get(key)
+        if size is None:
+            if len(self._sizes) >= _SIZE_CACHE_MAXSIZE:
+                self._sizes.clear()
+            pad_x, pad_y = _BADGE_PADDING
+            # 1px transparent border on each side, as in the stylesheet.
+            size = self._sizes[key] = QSize(
+                metrics.horizontalAdvance(text) + 2 * pad_x + 2,
+                metrics.height() + 2 * pad_y + 2,
+            )
+        return size
+
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex) -> None:
+        self._paint_background(painter, option)
+        text = index.data(Qt.DisplayRole)
+        if text is None or text == "":
+            return
+        text = str(text)
+
+        font_key, font, metrics = self._font(option.font)
+        palette = _badge_palette(self.colors)
+        background, foreground = palette.get(self._variant(index, text), palette["default"])
+
+        size = self._badge_size(font_key, metrics, text)
+        rect = option.rect
+        badge = QRect(
+            rect.left() + SPACING.sm,
+            rect.top() + (rect.height() - size.height()) // 2,
+            min(size.width(), rect.width() - 2 * SPACING.sm),
+            size.height(),
+        )
+
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(background)
+        painter.drawRoundedRect(badge, RADIUS.sm, RADIUS.sm)
+        painter.setFont(font)
+        painter.setPen(foreground)
+        painter.drawText(badge, Qt.AlignCenter, text)
+        painter.restore()
+
+    def sizeHint(self, option: QStyleOptionViewItem, index: QModelIndex) -> QSize:
+        text = index.data(Qt.DisplayRole)
+        font_key, _, metrics = self._font(option.font)
+        size = self._badge_size(font_key, metrics, "" if text is None else str(text))
+        return QSize(size.width() + 2 * SPACING.sm, size.height() + 2 * SPACING.xs)
+
+
+class ProgressDelegate(_VoidDelegate):
+    """Paints the value of an index as a ``VoidProgress`` bar.
+
+    The value is read from ``VALUE_ROLE`` when set, else from the display
+    data, and scaled by ``maximum`` (use ``maximum=1.0`` for fractions).
+    The color comes from ``VARIANT_ROLE`` when set, else ``color``.
+
+    Usage:
+        delegate = ProgressDelegate(theme, color="moss", parent=view)
+        view.setItemDelegateForColumn(progress_column, delegate)
+    """
+
+    def __init__(
+        self,
+        theme: Theme | None = None,
+        color: str = "peach",
+        maximum: float = 100,
+        parent: QWidget | None = None,
+    ) -> None:
+        super().__init__(theme, parent)
+        self.color = color
+        self.maximum = maximum
+
+    def _fraction(self, index: QModelIndex) -> float | None:
+        value = index.data(VALUE_ROLE)
+        if value is None:
+            value = index.data(Qt.DisplayRole)
+        try:
+            fraction = float(value) / self.maximum
+        except (TypeError, ValueError, ZeroDivisionError):
+            return None
+        return min(max(fraction, 0.0), 1.0)
+
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex) -> None:
+        self._paint_background(painter, option)
+        fraction = self._fraction(index)
+        if fraction is None:
+            return
+
+        groove, chunks = _progress_brushes(self.colors)
+        color = index.data(VARIANT_ROLE) or self.color
+        chunk = chunks.get(color, chunks["peach"])
+
+        rect = option.rect
+        bar = QRectF(
+            rect.left() + SPACING.sm,
+            rect.top() + (rect.height() - _PROGRESS_HEIGHT) // 2,
+            max(0, rect.width() - 2 * SPACING.sm),
+            _PROGRESS_HEIGHT,
+        )
+        painter.save()
+        _paint_bar(painter, bar, 0.0, fraction, groove, chunk)
+        painter.restore()
+
+    def sizeHint(self, option: QStyleOptionViewItem, index: QModelIndex) -> QSize:
+        return QSize(120, _PROGRESS_HEIGHT + 2 * SPACING.sm)
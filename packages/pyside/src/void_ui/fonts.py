@@ -0,0 +1,227 @@
+"""Void UI font preloading and metrics cache.
+
+The ``TYPOGRAPHY`` stacks are CSS font lists ("Inter, -apple-system, ...,
+sans-serif"). Qt matches every family of such a list, for every distinct
+font a widget asks for, before falling back to the next one; most of them
+are not installed anywhere but on one platform. ``resolve_stack`` matches
+a stack once against ``QFontDatabase`` and keeps only the families that
+exist, with the generic ``sans-serif``/``monospace`` (and the Apple system
+aliases) replaced by the platform's general and fixed fonts.
+
+``Theme.apply`` renders its sheets with :func:`resolved_typography`, so
+the generated QSS names installed families only, and the native style
+takes its fonts from :func:`font`. ``QFont`` and ``QFontMetrics`` objects
+are cached per (stack, size, weight).
+
+Bundled fonts are registered with :func:`register_fonts`, which also
+invalidates everything resolved so far. Set ``VOID_UI_RESOLVE_FONTS=0``
+to render the stacks as written.
+
+Usage:
+    from void_ui import fonts
+
+    fonts.register_fonts("assets/fonts")   # .ttf/.otf/.ttc files
+    fonts.preload()                        # e.g. behind a splash screen
+
+    metrics = fonts.metrics(TYPOGRAPHY.font_family, TYPOGRAPHY.size_sm, 500)
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+from collections.abc import Iterable
+from dataclasses import replace
+from functools import cache, lru_cache
+from pathlib import Path
+
+try:
+    from PySide6.QtGui import QFont, QFontDatabase, QFontMetrics, QGuiApplication
+    HAS_PYSIDE = True
+except ImportError:
+    HAS_PYSIDE = False
+
+from void_ui.colors import TYPOGRAPHY, Typography
+
+FONT_SUFFIXES = (".ttf", ".otf", ".ttc")
+
+# Stack entries that stand for a system font rather than a family.
+GENERIC_FAMILIES = {
+    "sans-serif": "general",
+    "system-ui": "general",
+    "-apple-system": "general",
+    "BlinkMacSystemFont": "general",
+    "monospace": "fixed",
+    "ui-monospace": "fixed",
+}
+
+# Typography fields holding a font stack.
+STACK_FIELDS = ("font_family", "font_mono", "font_jp", "font_tech")
+
+_enabled = os.environ.get("VOID_UI_RESOLVE_FONTS", "1").lower() not in ("0", "false", "no")
+
+# Families added by register_fonts(), in registration order.
+_registered: list[str] = []
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def set_enabled(enabled: bool) -> None:
+    """Turn resolving the stacks for ``Theme.apply`` on or off."""
+    global _enabled
+
+    _enabled = enabled
+
+
+def split_stack(stack: str) -> tuple[str, ...]:
+    """The family names of a CSS font stack, unquoted."""
+    return tuple(
+        name for name in (part.strip().strip("'\"") for part in stack.split(",")) if name
+    )
+
+
+def css_stack(families: Iterable[str]) -> str:
+    """A CSS font stack of ``families``, quoting names with spaces."""
+    return ", ".join(f"'{name}'" if " " in name else name for name in families)
+
+
+@cache
+def _installed() -> frozenset[str]:
+    return frozenset(QFontDatabase.families())
+
+
+@cache
+def _system_family(kind: str) -> str:
+    role = QFontDatabase.GeneralFont if kind == "general" else QFontDatabase.FixedFont
+    return QFontDatabase.systemFont(role).family()
+
+
+@lru_cache(maxsize=32)
+def resolve_stack(stack: str) -> tuple[str, ...]:
+    """The installed families of ``stack``, in order and without duplicates.
+
+    Generic entries become the system font of their kind. Never empty: a
+    stack with nothing installed resolves to the general system font.
+    Requires a QGuiApplication.
+    """
+    installed = _installed()
+    families: list[str] = []
+    for name in split_stack(stack):
+        kind = GENERIC_FAMILIES.get(name)
+        if kind is not None:
+            name = _system_family(kind)
+        elif name not in installed:
+            continue
+        if name not in families:
+            families.append(name)
+    return tuple(families) or (_system_family("general"),)
+
+
+def _can_resolve() -> bool:
+    # Resolving needs the font database, i.e. a QGuiApplication; do not
+    # import PySide6.QtGui just to find out there is none.
+    if not HAS_PYSIDE or "PySide6.QtGui" not in sys.modules:
+        return False
+    return QGuiApplication.instance() is not None
+
+
+@lru_cache(maxsize=8)
+def _resolve_typography(typography: Typography) -> Typography:
+    resolved = replace(typography, **{
+        name: css_stack(resolve_stack(getattr(typography, name))) for name in STACK_FIELDS
+    })
+    # Keep the identity when nothing changed, so built-in sheets stay built-in.
+    return typography if resolved == typography else resolved
+
+
+def resolved_typography(typography: Typography = TYPOGRAPHY) -> Typography:
+    """``typography`` with every stack resolved to installed families.
+
+    Returns ``typography`` itself when resolving is disabled or there is no
+    QGuiApplication yet.
+    """
+    if not _enabled or not _can_resolve():
+        return typography
+    return _resolve_typography(typography)
+
+
+@lru_cache(maxsize=256)
+def font(stack: str, size: int, weight: int = 400) -> QFont:
+    """A cached font of ``stack`` at ``size`` pixels. Do not modify it."""
+    result = QFont()
+    result.setFamilies(list(resolve_stack(stack)))
+    result.setPixelSize(size)
+    result.setWeight(QFont.Weight(weight))
+    return result
+
+
+@lru_cache(maxsize=256)
+def metrics(stack: str, size: int, weight: int = 400) -> QFontMetrics:
+    """Cached metrics of :func:`font`."""
+    return QFontMetrics(font(stack, size, weight))
+
+
+def _sizes(typography: Typography) -> tuple[int, ...]:
+    return tuple(sorted({
+        getattr(typography, name) for name in typography.__dataclass_fields__
+        if name.startswith("size_")
+    }))
+
+
+def preload(
+    typography: Typography = TYPOGRAPHY,
+    weights: Iterable[int] = (400, 500),
+) -> None:
+    """Resolve every stack of ``typography`` and load its fonts.
+
+    Builds the metrics of the body stack at every token size and weight,
+    which loads the font engines, so the first window does not pay for it.
+    Requires a QGuiApplication.
+    """
+    for name in STACK_FIELDS:
+        resolve_stack(getattr(typography, name))
+    _resolve_typography(typography)
+    for size in _sizes(typography):
+        for weight in weights:
+            metrics(typography.font_family, size, weight).height()
+
+
+def register_fonts(*paths: str | os.PathLike) -> list[str]:
+    """Register font files with Qt and return the families they add.
+
+    ``paths`` are font files or directories, searched for
+    ``FONT_SUFFIXES`` (not recursively). Files Qt cannot load are skipped.
+    Requires a QGuiApplication.
+    """
+    files: list[Path] = []
+    for path in map(Path, paths):
+        if path.is_dir():
+            files.extend(sorted(p for p in path.iterdir() if p.suffix.lower() in FONT_SUFFIXES))
+        else:
+            files.append(path)
+
+    added: list[str] = []
+    for file in files:
+        font_id = QFontDatabase.addApplicationFont(str(file))
+        if font_id < 0:
+            continue
+        for family in QFontDatabase.applicationFontFamilies(font_id):
+            if family not in added:
+                added.append(family)
+    if added:
+        _registered.extend(name for name in added if name not in _registered)
+        clear_cache()
+    return added
+
+
+def registered_families() -> list[str]:
+    """Families added by :func:`register_fonts`."""
+    return list(_registered)
+
+
+def clear_cache() -> None:
+    """Forget resolved stacks, fonts and metrics, e.g. after installing fonts."""
+    for cached in (_installed, _system_family, resolve_stack, _resolve_typography, font, metrics):
+        cached.cache_clear()
@@ -0,0 +1,332 @@
+"""Void UI palette engine.
+
+Derives complete ``Colors`` schemes from a few seed colors and checks WCAG
+contrast, batched with NumPy in the OKLab/OKLCH perceptual space.
+
+Derived tokens keep their perceptual relation to the seeds in a base
+scheme (``DarkColors`` or ``LightColors``): surfaces and borders keep their
+OKLab offset from ``void``, secondary text keeps its lightness position
+between ``void`` and ``white`` and ``accent_hover`` keeps its OKLCH shift
+from ``accent``. Opaque tokens equal to the base ``accent`` (``peach``,
+which fills primary buttons and selections) take the new accent. Deriving
+from the base scheme's own seeds reproduces it.
+
+Usage:
+    from void_ui.palette import derive_colors, contrast_failures
+
+    colors = derive_colors("#7cb8e8")
+    assert not contrast_failures(colors)
+    Theme(colors=colors).apply(app)
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import fields, replace
+from typing import NamedTuple
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+from void_ui.colors import Colors, DarkColors, VoidColor
+
+# Tokens placed by their OKLab offset from ``void``.
+SURFACE_OFFSET_TOKENS = ("surface", "raised", "elevated", "border", "border_light")
+# Tokens placed by their lightness between ``void`` (0) and ``white`` (1).
+TEXT_MIX_TOKENS = ("gray", "muted", "faint")
+# Translucent tokens and the opaque tokens they may be a tint of. A tint
+# follows the first candidate sharing its RGB in the base scheme and keeps
+# its alpha; otherwise the base value is kept.
+ALPHA_TOKENS = {
+    "accent_bg": ("accent",),
+    "success_bg": ("success",),
+    "warning_bg": ("warning",),
+    "danger_bg": ("danger",),
+    "info_bg": ("info",),
+    "glass_bg": ("void", "surface"),
+    "glass_border": ("accent",),
+}
+
+# Foreground and background tokens checked by contrast_ratios().
+TEXT_TOKENS = ("white", "gray", "muted", "accent", "success", "warning", "danger", "info")
+SURFACE_TOKENS = ("void", "surface", "raised", "elevated")
+
+# Minimum WCAG contrast per foreground token over every surface: body text
+# (AAA for ``white``, AA for ``gray``) and the danger color. ``muted`` is
+# decorative hint text, and the pastels are tuned for dark surfaces; add
+# them explicitly, e.g. ``{**DEFAULT_MINIMUMS, "accent": 3.0}``.
+DEFAULT_MINIMUMS = {
+    "white": 7.0,
+    "gray": 4.5,
+    "danger": 3.0,
+}
+
+# Minimum WCAG contrast per (text, fill) pair of filled controls: the text
+# of primary buttons and selections (AA body text). The built-in light
+# scheme keeps the dark scheme's pastel ``peach`` and fails it.
+DEFAULT_FILL_MINIMUMS = {
+    ("void", "peach"): 4.5,
+}
+
+
+class ContrastFailure(NamedTuple):
+    text: str
+    surface: str
+    ratio: float
+    minimum: float
+
+
+def _require_numpy() -> None:
+    if not HAS_NUMPY:
+        raise ImportError("NumPy is required: pip install void-ui[palette]")
+
+
+# -- Color space conversion (arrays of shape (..., 3), sRGB in 0..1) --
+
+def srgb_to_linear(rgb):
+    return np.where(rgb <= 0.04045, rgb / 12.92, ((rgb + 0.055) / 1.055) ** 2.4)
+
+
+def linear_to_srgb(rgb):
+    rgb = np.clip(rgb, 0.0, 1.0)
+    return np.where(rgb <= 0.0031308, rgb * 12.92, 1.055 * rgb ** (1 / 2.4) - 0.055)
+
+
+_MATRICES = None
+
+
+def _matrices():
+    """OKLab matrices (linear sRGB -> LMS, LMS' -> Lab) and their inverses."""
+    global _MATRICES
+    if _MATRICES is None:
+        lms = np.array([
+            [0.4122214708, 0.5363325363, 0.0514459929],
+            [0.2119034982, 0.6806995451, 0.1073969566],
+            [0.0883024619, 0.2817188376, 0.6299787005],
+        ])
+        lab = np.array([
+            [0.2104542553, 0.7936177850, -0.0040720468],
+            [1.9779984951, -2.4285922050, 0.4505937099],
+            [0.0259040371, 0.7827717662, -0.8086757660],
+        ])
+        _MATRICES = (lms.T, lab.T, np.linalg.inv(lms).T, np.linalg.inv(lab).T)
+    return _MATRICES
+
+
+def srgb_to_oklab(rgb):
+    """Convert sRGB (0..1) to OKLab."""
+    to_lms, to_lab, _, _ = _matrices()
+    return np.cbrt(srgb_to_linear(rgb) @ to_lms) @ to_lab
+
+
+def oklab_to_srgb(lab):
+    """Convert OKLab to sRGB (0..1), clipped to the gamut."""
+    _, _, from_lms, from_lab = _matrices()
+    return linear_to_srgb(((lab @ from_lab) ** 3) @ from_lms)
+
+
+def oklab_to_oklch(lab):
+    lightness, a, b = lab[..., 0], lab[..., 1], lab[..., 2]
+    return np.stack([lightness, np.hypot(a, b), np.arctan2(b, a)], axis=-1)
+
+
+def oklch_to_oklab(lch):
+    lightness, chroma, hue = lch[..., 0], lch[..., 1], lch[..., 2]
+    return np.stack([lightness, chroma * np.cos(hue), chroma * np.sin(hue)], axis=-1)
+
+
+def _rgba_array(values: Sequence[str | VoidColor]):
+    packed = np.array(
+        [(v if isinstance(v, VoidColor) else VoidColor.parse(v)).rgba for v in values],
+        dtype=np.uint32,
+    )
+    shifts = np.array([24, 16, 8, 0], dtype=np.uint32)
+    return ((packed[..., None] >> shifts) & 0xFF).astype(np.float64) / 255.0
+
+
+def _hex(rgb) -> list[str]:
+    ints = np.rint(np.clip(rgb, 0.0, 1.0) * 255).astype(np.int64).reshape(-1, 3)
+    return [f"#{r:02x}{g:02x}{b:02x}" for r, g, b in ints.tolist()]
+
+
+def _rgba_text(rgb, alpha: float) -> list[str]:
+    ints = np.rint(np.clip(rgb, 0.0, 1.0) * 255).astype(np.int64).reshape(-1, 3)
+    a = round(alpha, 2)
+    return [f"rgba({r}, {g}, {b}, {a})" for r, g, b in ints.tolist()]
+
+
+# -- Derivation --
+
+def _lab(colors: Colors, names: Sequence[str]):
+    return srgb_to_oklab(_rgba_array([getattr(colors, n) for n in names])[:, :3])
+
+
+def derive_palettes(
+    accents: Sequence[str],
+    voids: Sequence[str] | None = None,
+    whites: Sequence[str] | None = None,
+    base: Colors = DarkColors,
+) -> list[Colors]:
+    """Derive one ``Colors`` per seed set, in a single batched pass.
+
+    ``voids`` and ``whites`` default to the base scheme's background and
+    text colors. Tokens not derived from the seeds (pastels, semantic
+    colors) are taken from ``base``.
+    """
+    _require_numpy()
+    n = len(accents)
+    voids = voids if voids is not None else [base.void] * n
+    whites = whites if whites is not None else [base.white] * n
+
+    accent = srgb_to_oklab(_rgba_array(accents)[:, :3])
+    void = srgb_to_oklab(_rgba_array(voids)[:, :3])
+    white = srgb_to_oklab(_rgba_array(whites)[:, :3])
+
+    # Relations measured on the base scheme.
+    base_void, base_white, base_accent = _lab(base, ("void", "white", "accent"))
+    surface_offsets = _lab(base, SURFACE_OFFSET_TOKENS) - base_void
+    base_text = _lab(base, TEXT_MIX_TOKENS)
+    span = base_white[0] - base_void[0]
+    mix = (base_text[:, 0] - base_void[0]) / (span or 1.0)
+    # Tint of each text token beyond the plain void -> white mix.
+    text_residual = base_text - (base_void + mix[:, None] * (base_white - base_void))
+    hover_shift = oklab_to_oklch(_lab(base, ("accent_hover",))[0]) - oklab_to_oklch(base_accent)
+
+    surfaces = oklab_to_srgb(void[:, None, :] + surface_offsets[None, :, :])
+    texts = oklab_to_srgb(
+        void[:, None, :]
+        + mix[None, :, None] * (white - void)[:, None, :]
+        + text_residual[None, :, :]
+    )
+    hover = oklab_to_srgb(oklch_to_oklab(oklab_to_oklch(accent) + hover_shift))
+
+    opaque = {
+        "accent": oklab_to_srgb(accent),
+        "void": oklab_to_srgb(void),
+        "accent_hover": hover,
+    }
+    opaque.update((name, surfaces[:, i]) for i, name in enumerate(SURFACE_OFFSET_TOKENS))
+    opaque.update((name, texts[:, i]) for i, name in enumerate(TEXT_MIX_TOKENS))
+
+    derived = {name: _hex(rgb) for name, rgb in opaque.items()}
+    derived["accent"] = [str(a) for a in accents]
+    derived["void"] = [str(v) for v in voids]
+    derived["white"] = [str(w) for w in whites]
+
+    # Opaque tokens sharing the base accent's RGB are the accent.
+    base_rgb = base.color("accent").rgba >> 8
+    for field in fields(base):
+        color = base.color(field.name)
+        if field.name not in derived and color.alpha == 255 and color.rgba >> 8 == base_rgb:
+            derived[field.name] = derived["accent"]
+
+    for name, candidates in ALPHA_TOKENS.items():
+        tint = base.color(name)
+        for source in candidates:
+            if base.color(source).rgba >> 8 == tint.rgba >> 8:
+                if source in opaque:
+                    derived[name] = _rgba_text(opaque[source], tint.alpha_f)
+                break
+
+    return [replace(base, **{k: v[i] for k, v in derived.items()}) for i in range(n)]
+
+
+def derive_colors(
+    accent: str,
+    void: str | None = None,
+    white: str | None = None,
+    base: Colors = DarkColors,
+) -> Colors:
+    """Derive a complete ``Colors`` scheme from seed colors.
+
+    See :func:`derive_palettes`.
+    """
+    return derive_palettes(
+        [accent],
+        None if void is None else [void],
+        None if white is None else [white],
+        base=base,
+    )[0]
+
+
+# -- Contrast --
+
+def _luminance(rgba, backdrop):
+    """WCAG relative luminance, compositing translucent colors over ``backdrop``."""
+    alpha = rgba[..., 3:4]
+    rgb = rgba[..., :3] * alpha + backdrop * (1.0 - alpha)
+    linear = srgb_to_linear(rgb)
+    return linear @ np.array([0.2126, 0.7152, 0.0722])
+
+
+def contrast_ratios(palettes: Sequence[Colors]):
+    """WCAG contrast of every TEXT_TOKENS/SURFACE_TOKENS pair.
+
+    Returns an array of shape ``(len(palettes), len(TEXT_TOKENS),
+    len(SURFACE_TOKENS))``. Translucent colors are composited over ``void``.
+    """
+    _require_numpy()
+    names = TEXT_TOKENS + SURFACE_TOKENS
+    rgba = _rgba_array([getattr(p, name) for p in palettes for name in names])
+    rgba = rgba.reshape(len(palettes), len(names), 4)
+    backdrop = rgba[:, names.index("void"), None, :3]
+
+    lum = _luminance(rgba, backdrop)
+    text = lum[:, : len(TEXT_TOKENS), None]
+    surface = lum[:, None, len(TEXT_TOKENS):]
+    high = np.maximum(text, surface)
+    low = np.minimum(text, surface)
+    return (high + 0.05) / (low + 0.05)
+
+
+def fill_contrast_ratios(palettes: Sequence[Colors], pairs: Sequence[tuple[str, str]]):
+    """WCAG contrast of each (text, fill) token pair.
+
+    Returns an array of shape ``(len(palettes), len(pairs))``. Translucent
+    colors are composited over ``void``.
+    """
+    _require_numpy()
+    names = ("void",) + tuple(name for pair in pairs for name in pair)
+    rgba = _rgba_array([getattr(p, name) for p in palettes for name in names])
+    rgba = rgba.reshape(len(palettes), len(names), 4)
+    backdrop = rgba[:, 0, None, :3]
+
+    lum = _luminance(rgba, backdrop)
+    text, fill = lum[:, 1::2], lum[:, 2::2]
+    return (np.maximum(text, fill) + 0.05) / (np.minimum(text, fill) + 0.05)
+
+
+def contrast_failures(
+    palettes: Colors | Sequence[Colors],
+    minimums: dict[str, float] = DEFAULT_MINIMUMS,
+    fill_minimums: dict[tuple[str, str], float] = DEFAULT_FILL_MINIMUMS,
+) -> list[ContrastFailure] | list[list[ContrastFailure]]:
+    """List text/surface and text/fill pairs below their minimum contrast.
+
+    Accepts one scheme (returns one list) or a sequence (one list each).
+    """
+    single = isinstance(palettes, Colors)
+    batch = [palettes] if single else list(palettes)
+    ratios = contrast_ratios(batch)
+
+    required = np.array([minimums.get(name, 0.0) for name in TEXT_TOKENS])
+    failing = ratios < required[None, :, None]
+    results: list[list[ContrastFailure]] = [[] for _ in batch]
+    for p, t, s in zip(*np.nonzero(failing)):
+        results[p].append(ContrastFailure(
+            TEXT_TOKENS[t], SURFACE_TOKENS[s], float(ratios[p, t, s]), float(required[t])
+        ))
+
+    pairs = list(fill_minimums)
+    if pairs:
+        ratios = fill_contrast_ratios(batch, pairs)
+        required = np.array([fill_minimums[pair] for pair in pairs])
+        for p, i in zip(*np.nonzero(ratios < required[None, :])):
+            text, fill = pairs[i]
+            results[p].append(
+                ContrastFailure(text, fill, float(ratios[p, i]), float(required[i]))
+            )
+    return results[0] if single else results
@@ -0,0 +1,170 @@
+"""Void UI background pre-warming of theme modes.
+
+The first ``Theme.apply`` hands the theme's state to a worker thread that
+renders everything a mode change needs, for both modes: the plain,
+switchable, scoped and lean sheets, the rule diffs ``switch()`` uses, and
+the parsed badge, progress and toast colors. The first ``toggle()`` +
+``apply()`` or ``switch()`` then only pays for Qt's ``setStyleSheet``.
+
+The worker only fills pure-Python caches, which are locked or thread-safe.
+Its results reach the GUI thread through a queued signal, and the
+``QColor``/``QBrush`` objects painted widgets use are created there.
+
+Set ``VOID_UI_PREWARM=0`` to disable.
+
+Usage:
+    from void_ui import prewarm
+
+    theme.apply(app)     # starts pre-warming
+    prewarm.wait()       # e.g. in tests and benchmarks
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import threading
+from dataclasses import fields
+from typing import TYPE_CHECKING
+
+try:
+    import shiboken6
+    from PySide6.QtCore import QCoreApplication, QObject, Qt, Signal
+    HAS_PYSIDE = True
+except ImportError:
+    HAS_PYSIDE = False
+    QObject = object
+
+if TYPE_CHECKING:
+    from void_ui.colors import Colors
+    from void_ui.theme import Theme, ThemeMode
+
+_enabled = os.environ.get("VOID_UI_PREWARM", "1").lower() not in ("0", "false", "no")
+
+
+def _warm(
+    mode: ThemeMode,
+    colors: Colors,
+    other_colors: Colors,
+    lean: tuple[frozenset[str], tuple[str, ...]] | None,
+) -> None:
+    """Render the caches of both modes. Runs on the worker thread."""
+    from void_ui import theme
+    from void_ui.widgets import _progress_chunk_colors
+
+    other = theme.ThemeMode.LIGHT if mode == theme.ThemeMode.DARK else theme.ThemeMode.DARK
+    sheets = []
+    for m, c in ((mode, colors), (other, other_colors)):
+        sheets.append(theme._cached_qss(m, c, theme.SPACING, theme.RADIUS, theme._typography))
+        theme._cached_scoped_qss(m, c)
+        if lean is not None:
+            theme._cached_lean_qss(m, c, *lean)
+        theme.badge_colors(c)
+        _progress_chunk_colors(c)
+        toast = sys.modules.get("void_ui.toast")
+        if toast is not None:
+            for variant in toast.TOAST_BORDERS:
+                toast._border_color(c, variant)
+    theme._cached_switchable_qss(mode, colors, other_colors)
+    theme._cached_switchable_qss(other, other_colors, colors)
+    theme._cached_diff(sheets[0], sheets[1])
+    theme._cached_diff(sheets[1], sheets[0])
+
+
+class _Prewarmer(QObject):
+    """Runs :func:`_warm` on a worker thread and finishes on the GUI thread."""
+
+    if HAS_PYSIDE:
+        _ready = Signal(object)
+
+    def __init__(self, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self._lock = threading.Lock()
+        self._threads: list[threading.Thread] = []
+        self._ready.connect(self._hand_over, Qt.QueuedConnection)
+
+    def start(self, mode: ThemeMode, colors: Colors, other_colors: Colors, lean) -> None:
+        thread = threading.Thread(
+            target=self._run,
+            args=(mode, colors, other_colors, lean),
+            name="void-ui-prewarm",
+            daemon=True,
+        )
+        with self._lock:
+            self._threads = [t for t in self._threads if t.is_alive()]
+            self._threads.append(thread)
+        thread.start()
+
+    def _run(self, mode: ThemeMode, colors: Colors, other_colors: Colors, lean) -> None:
+        _warm(mode, colors, other_colors, lean)
+        # The application may have quit meanwhile.
+        if shiboken6.isValid(self):
+            self._ready.emit((colors, other_colors))
+
+    def _hand_over(self, schemes: tuple[Colors, ...]) -> None:
+        """Create the Qt color objects of the warmed schemes (GUI thread)."""
+        from void_ui.widgets import _progress_brushes
+
+        delegates = sys.modules.get("void_ui.delegates")
+        for colors in schemes:
+            for field in fields(colors):
+                colors.qbrush(field.name)
+            _progress_brushes(colors)
+            if delegates is not None:
+                delegates._badge_palette(colors)
+
+    def wait(self, timeout: float | None = None) -> bool:
+        with self._lock:
+            threads = list(self._threads)
+        for thread in threads:
+            thread.join(timeout)
+            if thread.is_alive():
+                return False
+        QCoreApplication.sendPostedEvents(self)
+        return True
+
+
+_prewarmer: _Prewarmer | None = None
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def set_enabled(enabled: bool) -> None:
+    """Turn pre-warming on the first ``Theme.apply`` on or off."""
+    global _enabled
+
+    _enabled = enabled
+
+
+def prewarm(theme: Theme) -> bool:
+    """Start rendering both modes of ``theme`` in the background.
+
+    Called by the first ``Theme.apply``. Returns False when disabled or
+    without a QApplication to hand the results to.
+    """
+    global _prewarmer
+
+    app = QCoreApplication.instance() if HAS_PYSIDE else None
+    if not _enabled or app is None:
+        return False
+    if _prewarmer is None or not shiboken6.isValid(_prewarmer):
+        _prewarmer = _Prewarmer(parent=app)
+
+    from void_ui.theme import ThemeMode
+
+    other = ThemeMode.LIGHT if theme.mode == ThemeMode.DARK else ThemeMode.DARK
+    _prewarmer.start(theme.mode, theme.colors, theme._colors_for(other), theme._lean)
+    return True
+
+
+def wait(timeout: float | None = None) -> bool:
+    """Wait for running pre-warm threads and take over their results.
+
+    Call on the GUI thread. Returns False if a thread is still running
+    after ``timeout`` seconds.
+    """
+    if _prewarmer is None or not shiboken6.isValid(_prewarmer):
+        return True
+    return _prewarmer.wait(timeout)
@@ -0,0 +1,205 @@
+"""Void UI stylesheet utilities.
+
+Small, Qt-free helpers for working with generated QSS: splitting a sheet
+into rules, diffing two sheets and scoping selectors behind a property.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import NamedTuple
+
+_COMMENT_RE = re.compile(r"/\*.*?\*/", re.DOTALL)
+_ATTRIBUTE_RE = re.compile(r'\[\s*([\w-]+)\s*=\s*"([^"]*)"\s*\]')
+_TYPE_RE = re.compile(r"^[A-Za-z_*][\w]*")
+
+
+class QssRule(NamedTuple):
+    """A single QSS rule: its comma-separated selectors and raw body."""
+
+    selectors: tuple[str, ...]
+    body: str
+
+    def __str__(self) -> str:
+        return f"{', '.join(self.selectors)} {{{self.body}}}"
+
+
+class SelectorTarget(NamedTuple):
+    """The widgets a selector applies to.
+
+    ``type_name`` is the Qt class of the selector subject (``"*"`` for the
+    universal selector) and ``attributes`` the ``[name="value"]`` property
+    constraints on it, e.g. ``("class", "primary")``.
+    """
+
+    type_name: str
+    attributes: tuple[tuple[str, str], ...] = ()
+
+    @property
+    def universal(self) -> bool:
+        return self.type_name in ("*", "QWidget") and not self.attributes
+
+
+def _split_outside_brackets(text: str, separators: str) -> list[str]:
+    parts: list[str] = []
+    depth = 0
+    current = []
+    for ch in text:
+        if ch == "[":
+            depth += 1
+        elif ch == "]":
+            depth -= 1
+        if depth == 0 and ch in separators:
+            parts.append("".join(current))
+            current = []
+        else:
+            current.append(ch)
+    parts.append("".join(current))
+    return [part.strip() for part in parts if part.strip()]
+
+
+def parse_rules(qss: str) -> list[QssRule]:
+    """Split a stylesheet into its rules, dropping comments."""
+    text = _COMMENT_RE.sub("", qss)
+    rules = []
+    pos = 0
+    while True:
+        start = text.find("{", pos)
+        if start == -1:
+            break
+        end = text.find("}", start)
+        if end == -1:
+            raise ValueError("Unbalanced braces in stylesheet")
+        selectors = tuple(_split_outside_brackets(text[pos:start], ","))
+        rules.append(QssRule(selectors, text[start + 1:end]))
+        pos = end + 1
+    return rules
+
+
+def diff_rules(old: str, new: str) -> list[QssRule]:
+    """Return the rules of ``new`` that differ from ``old``.
+
+    Rules are matched by their selector list, in order when a selector
+    list repeats. Rules that only exist in ``old`` are returned as well,
+    since widgets they selected must be restyled when the sheet is swapped.
+    """
+    old_rules: dict[tuple[str, ...], list[str]] = {}
+    for rule in parse_rules(old):
+        old_rules.setdefault(rule.selectors, []).append(rule.body)
+    changed = []
+    for rule in parse_rules(new):
+        bodies = old_rules.get(rule.selectors)
+        body = bodies.pop(0) if bodies else None
+        if _normalize(body) != _normalize(rule.body):
+            changed.append(rule)
+    changed.extend(
+        QssRule(selectors, body) for selectors, bodies in old_rules.items() for body in bodies
+    )
+    return changed
+
+
+def _normalize(body: str | None) -> str | None:
+    if body is None:
+        return None
+    return " ".join(body.split())
+
+
+def selector_target(selector: str) -> SelectorTarget:
+    """Describe the widgets selected by the subject of ``selector``.
+
+    Sub-controls and pseudo-states are ignored: ``QScrollBar::handle:hover``
+    targets ``QScrollBar`` widgets.
+    """
+    subject = _split_outside_brackets(selector, " >")[-1]
+    subject = _strip_pseudo(subject)
+    match = _TYPE_RE.match(subject)
+    type_name = match.group(0) if match else "*"
+    return SelectorTarget(type_name, tuple(_ATTRIBUTE_RE.findall(subject)))
+
+
+def rule_targets(rules: list[QssRule]) -> set[SelectorTarget]:
+    """Collect the selector targets of every rule in ``rules``."""
+    return {selector_target(sel) for rule in rules for sel in rule.selectors}
+
+
+def _strip_pseudo(compound: str) -> str:
+    depth = 0
+    for index, ch in enumerate(compound):
+        if ch == "[":
+            depth += 1
+        elif ch == "]":
+            depth -= 1
+        elif ch == ":" and depth == 0:
+            return compound[:index]
+    return compound
+
+
+def scope_selector(selector: str, name: str, value: str) -> list[str]:
+    """Restrict ``selector`` to widgets inside one carrying ``name=value``.
+
+    Returns the descendant form and, for single-compound selectors, the form
+    matching the tagged widget itself.
+    """
+    attribute = f'[{name}="{value}"]'
+    scoped = [f"*{attribute} {selector}"]
+    if len(_split_outside_brackets(selector, " >")) == 1:
+        head = _strip_pseudo(selector)
+        scoped.append(f"{head}{attribute}{selector[len(head):]}")
+    return scoped
+
+
+def scope_qss(qss: str, name: str, value: str) -> str:
+    """Scope every rule of ``qss`` with :func:`scope_selector`."""
+    return "\n".join(
+        str(QssRule(
+            tuple(s for sel in rule.selectors for s in scope_selector(sel, name, value)),
+            rule.body,
+        ))
+        for rule in parse_rules(qss)
+    )
+
+
+def selector_types(selector: str) -> set[str]:
+    """The type names of every compound in ``selector``, without ``*``."""
+    types = set()
+    for compound in _split_outside_brackets(selector, " >"):
+        match = _TYPE_RE.match(_strip_pseudo(compound))
+        if match and match.group(0) != "*":
+            types.add(match.group(0))
+    return types
+
+
+def prune_qss(qss: str, available: set[str], universal: tuple[str, ...]) -> str:
+    """Keep the selectors of ``qss`` whose types are all in ``available``.
+
+    Rules selecting every widget (``*`` or a bare ``QWidget``) are
+    retargeted at the ``universal`` type names instead; rules left without
+    selectors are dropped.
+    """
+    rules = []
+    for rule in parse_rules(qss):
+        selectors: list[str] = []
+        for selector in rule.selectors:
+            compounds = _split_outside_brackets(selector, " >")
+            if len(compounds) == 1 and selector_target(selector).universal:
+                head = _strip_pseudo(selector)
+                selectors.extend(f"{name}{selector[len(head):]}" for name in universal)
+            elif selector_types(selector) <= available:
+                selectors.append(selector)
+        if selectors:
+            rules.append(QssRule(tuple(selectors), rule.body))
+    return "\n".join(str(rule) for rule in rules)
+
+
+def minify_qss(qss: str) -> str:
+    """Drop comments and redundant whitespace."""
+    out = []
+    for rule in parse_rules(qss):
+        declarations = []
+        for declaration in rule.body.split(";"):
+            name, sep, value = declaration.partition(":")
+            if sep:
+                declarations.append(f"{name.strip()}:{' '.join(value.split())}")
+        selectors = ",".join(" ".join(s.split()) for s in rule.selectors)
+        out.append(f"{selectors}{{{';'.join(declarations)}}}")
+    return "".join(out)
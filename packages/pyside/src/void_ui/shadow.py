@@ -0,0 +1,194 @@
+"""Void UI cached drop shadows.
+
+Renders the shadow of a rounded rectangle once per (blur, color, corner
+radius, device pixel ratio) with ``QGraphicsDropShadowEffect`` itself, and
+caches it as a nine-patch pixmap. ``DropShadow`` paints that pixmap under a
+target widget, so shadows match the effect (to rounding) without the
+per-widget offscreen rendering and re-blurring the effect does on every
+repaint.
+
+Usage:
+    shadow = DropShadow(card, ShadowSpec(blur=16, offset=(0, 4), radius=12))
+"""
+
+from __future__ import annotations
+
+import math
+from functools import lru_cache
+from typing import NamedTuple
+
+try:
+    from PySide6.QtCore import QEvent, QObject, QPoint, QRect, QRectF, Qt
+    from PySide6.QtGui import QBrush, QImage, QPainter, QPainterPath, QPixmap
+    from PySide6.QtWidgets import (
+        QGraphicsDropShadowEffect,
+        QGraphicsPathItem,
+        QGraphicsScene,
+        QWidget,
+    )
+    HAS_PYSIDE = True
+except ImportError:
+    HAS_PYSIDE = False
+    QWidget = object
+
+from void_ui.colors import VoidColor
+
+
+class ShadowSpec(NamedTuple):
+    """Drop shadow parameters, as for ``QGraphicsDropShadowEffect``.
+
+    ``radius`` is the corner radius of the shadowed widget.
+    """
+
+    blur: float = 16
+    offset: tuple[int, int] = (0, 4)
+    color: str = "rgba(0, 0, 0, 0.47)"
+    radius: float = 12
+
+
+class NinePatch(NamedTuple):
+    """A shadow pixmap and its geometry, in logical pixels.
+
+    ``margin`` is how far the shadow extends beyond the widget and
+    ``corner`` the size of the fixed corner slices.
+    """
+
+    pixmap: QPixmap
+    margin: int
+    corner: int
+
+
+@lru_cache(maxsize=32)
+def shadow_patch(blur: float, color: VoidColor, radius: float, dpr: float = 1.0) -> NinePatch:
+    """Render and cache the nine-patch shadow of a rounded rectangle."""
+    if not HAS_PYSIDE:
+        raise ImportError("PySide6 is required: pip install void-ui[pyside]")
+
+    margin = math.ceil(blur)
+    # Slices must reach past the blurred corners so the middle is uniform.
+    corner = margin + math.ceil(radius + blur)
+    inner = 2 * (corner - margin) + 1
+    size = inner + 2 * margin
+
+    path = QPainterPath()
+    path.addRoundedRect(QRectF(0, 0, inner, inner), radius, radius)
+    item = QGraphicsPathItem(path)
+    item.setPen(Qt.NoPen)
+    item.setBrush(QBrush(Qt.black))
+
+    # Offset the shadow clear of its source and crop it, so the pixels are
+    # exactly the effect's shadow without the source painted over it.
+    effect = QGraphicsDropShadowEffect()
+    effect.setBlurRadius(blur)
+    effect.setColor(color.qcolor())
+    effect.setOffset(size, 0)
+    item.setGraphicsEffect(effect)
+    scene = QGraphicsScene()
+    scene.addItem(item)
+
+    device = math.ceil(size * dpr)
+    image = QImage(2 * device, device, QImage.Format_ARGB32_Premultiplied)
+    image.setDevicePixelRatio(dpr)
+    image.fill(Qt.transparent)
+    painter = QPainter(image)
+    scene.render(painter, QRectF(0, 0, 2 * size, size), QRectF(-margin, -margin, 2 * size, size))
+    painter.end()
+
+    pixmap = QPixmap.fromImage(image.copy(QRect(device, 0, device, device)))
+    pixmap.setDevicePixelRatio(dpr)
+    return NinePatch(pixmap, margin, corner)
+
+
+def paint_nine_patch(painter: QPainter, target: QRect, patch: NinePatch) -> None:
+    """Paint ``patch`` stretched over ``target`` (logical pixels)."""
+    pixmap = patch.pixmap
+    dpr = pixmap.devicePixelRatio()
+    size = pixmap.width()
+    # Shrink the corners for targets smaller than two of them.
+    corner = min(patch.corner, target.width() // 2, target.height() // 2)
+    source_corner = round(corner * dpr)
+    middle = size - 2 * source_corner
+
+    xs = (target.left(), target.left() + corner, target.right() + 1 - corner, target.right() + 1)
+    ys = (target.top(), target.top() + corner, target.bottom() + 1 - corner, target.bottom() + 1)
+    sxs = (0, source_corner, size - source_corner, size)
+    for row in range(3):
+        for col in range(3):
+            width, height = xs[col + 1] - xs[col], ys[row + 1] - ys[row]
+            if width <= 0 or height <= 0:
+                continue
+            source = QRect(
+                sxs[col],
+                sxs[row],
+                middle if col == 1 else source_corner,
+                middle if row == 1 else source_corner,
+            )
+            painter.drawPixmap(QRect(xs[col], ys[row], width, height), pixmap, source)
+
+
+class DropShadow(QWidget):
+    """Paints a cached drop shadow under ``target``.
+
+    The shadow is a sibling of the target, stacked just below it, and
+    follows its geometry, visibility and parent. It is transparent to
+    input and deleted with the target.
+    """
+
+    def __init__(self, target: QWidget, spec: ShadowSpec = ShadowSpec()) -> None:
+        if not HAS_PYSIDE:
+            raise ImportError("PySide6 is required: pip install void-ui[pyside]")
+
+        super().__init__(target.parentWidget())
+        self._target = target
+        self._spec = spec
+        self._color = VoidColor.parse(spec.color)
+        self.setAttribute(Qt.WA_TransparentForMouseEvents)
+        self.setFocusPolicy(Qt.NoFocus)
+        target.installEventFilter(self)
+        target.destroyed.connect(self.deleteLater)
+        self._sync()
+
+    @property
+    def spec(self) -> ShadowSpec:
+        return self._spec
+
+    def _patch(self) -> NinePatch:
+        spec = self._spec
+        return shadow_patch(spec.blur, self._color, spec.radius, self.devicePixelRatioF())
+
+    def _sync(self) -> None:
+        target = self._target
+        parent = target.parentWidget()
+        if parent is not self.parentWidget():
+            self.setParent(parent)
+        if parent is None or target.isHidden():
+            self.hide()
+            return
+        margin = math.ceil(self._spec.blur)
+        dx, dy = self._spec.offset
+        self.setGeometry(
+            target.geometry().translated(QPoint(dx, dy)).adjusted(-margin, -margin, margin, margin)
+        )
+        self.stackUnder(target)
+        self.show()
+
+    def eventFilter(self, watched: QObject, event: QEvent) -> bool:
+        if watched is self._target and event.type() in _TRACKED_EVENTS:
+            self._sync()
+        return False
+
+    def paintEvent(self, event) -> None:
+        painter = QPainter(self)
+        paint_nine_patch(painter, self.rect(), self._patch())
+        painter.end()
+
+
+if HAS_PYSIDE:
+    _TRACKED_EVENTS = frozenset((
+        QEvent.Move,
+        QEvent.Resize,
+        QEvent.Show,
+        QEvent.Hide,
+        QEvent.ParentChange,
+        QEvent.ZOrderChange,
+    ))
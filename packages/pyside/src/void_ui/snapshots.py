@@ -0,0 +1,432 @@
+"""Void UI snapshot runner: visual regression and paint timing.
+
+Renders every variant of ``VoidButton``, ``VoidLabel``, ``VoidBadge``,
+``VoidCard`` and ``VoidProgress`` in both theme modes to a ``QImage`` on
+the offscreen platform, compares each image with its golden PNG and
+records how long the widget took to build and to paint.
+
+The matrix runs in a worker process with its own QApplication, or is
+split into shards over a pool of them with ``jobs``. Images are compared perceptually: a pixel
+differs when its YIQ color distance exceeds ``threshold`` (0..1, as in
+pixelmatch), and a case fails when more than ``tolerance`` of its pixels
+differ, which absorbs anti-aliasing noise but not a changed color or
+shape. Failing cases get ``<case>.actual.png`` and ``<case>.diff.png``
+(differing pixels in red over the faded golden) in the output directory,
+next to ``report.json``.
+
+Usage:
+    python -m void_ui.snapshots --golden tests/snapshots --update   # record
+    python -m void_ui.snapshots --golden tests/snapshots            # compare
+    python -m void_ui.snapshots --jobs 4                             # in 4 processes
+
+Golden images depend on the installed fonts; record and compare them on
+the same machine image. Timings are only comparable between runs with
+one job, the default.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import statistics
+import sys
+import time
+from array import array
+from collections.abc import Callable, Iterable
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from pathlib import Path
+from typing import NamedTuple
+
+try:
+    from PySide6.QtGui import QColor, QImage, QPainter
+    HAS_PYSIDE = True
+except ImportError:
+    HAS_PYSIDE = False
+
+from void_ui.theme import BADGE_VARIANTS, PROGRESS_COLORS, ThemeMode
+
+# Widget class -> variants rendered for it.
+VARIANTS: dict[str, tuple[str, ...]] = {
+    "VoidButton": ("default", "primary", "ghost", "danger"),
+    "VoidLabel": ("default", "white", "muted", "accent"),
+    "VoidBadge": tuple(BADGE_VARIANTS),
+    "VoidCard": ("default", "elevated", "interactive"),
+    "VoidProgress": (*PROGRESS_COLORS, *(f"{color}-painted" for color in PROGRESS_COLORS)),
+}
+
+# Widget class -> size of the host the widget is laid out in. The margin
+# leaves room for card shadows.
+HOST_SIZES: dict[str, tuple[int, int]] = {
+    "VoidButton": (200, 68),
+    "VoidLabel": (200, 52),
+    "VoidBadge": (120, 52),
+    "VoidCard": (260, 150),
+    "VoidProgress": (240, 40),
+}
+HOST_MARGIN = 16
+
+DEFAULT_THRESHOLD = 0.1
+DEFAULT_TOLERANCE = 0.001
+DEFAULT_REPEAT = 10
+
+# Largest YIQ distance between two colors.
+_MAX_DELTA = 35215.0
+
+
+class Case(NamedTuple):
+    """One widget/variant/mode combination."""
+
+    widget: str
+    variant: str
+    mode: ThemeMode
+
+    @property
+    def name(self) -> str:
+        return f"{self.widget}-{self.variant}-{self.mode.value}"
+
+
+class DiffResult(NamedTuple):
+    """Perceptual difference of two images."""
+
+    pixels: int
+    fraction: float
+    image: QImage | None
+
+
+class SnapshotResult(NamedTuple):
+    """Outcome of one case. Times in seconds.
+
+    ``status`` is ``"match"``, ``"mismatch"``, ``"missing"`` (no golden)
+    or ``"updated"`` (golden written).
+    """
+
+    name: str
+    widget: str
+    variant: str
+    mode: str
+    status: str
+    diff_fraction: float
+    build: float
+    paint: float
+    width: int
+    height: int
+
+
+def cases(
+    widgets: Iterable[str] | None = None,
+    modes: Iterable[ThemeMode] | None = None,
+) -> list[Case]:
+    """The snapshot matrix, optionally limited to some widgets or modes."""
+    widgets = list(widgets) if widgets is not None else list(VARIANTS)
+    unknown = [name for name in widgets if name not in VARIANTS]
+    if unknown:
+        raise ValueError(f"no snapshots for {', '.join(unknown)}")
+    modes = list(modes) if modes is not None else list(ThemeMode)
+    return [
+        Case(widget, variant, mode)
+        for mode in modes
+        for widget in widgets
+        for variant in VARIANTS[widget]
+    ]
+
+
+def _factories() -> dict[str, Callable[[str], object]]:
+    from PySide6.QtWidgets import QVBoxLayout
+
+    from void_ui.widgets import VoidBadge, VoidButton, VoidCard, VoidLabel, VoidProgress
+
+    def card(variant: str) -> VoidCard:
+        widget = VoidCard(variant)
+        layout = QVBoxLayout(widget)
+        layout.addWidget(VoidLabel("Card title", style="white"))
+        layout.addWidget(VoidLabel("Secondary text"))
+        return widget
+
+    def progress(variant: str) -> VoidProgress:
+        color, _, painted = variant.partition("-")
+        return VoidProgress(value=60, color=color, painted=bool(painted))
+
+    return {
+        "VoidButton": lambda variant: VoidButton("Button", variant=variant),
+        "VoidLabel": lambda variant: VoidLabel("Label text", style=variant),
+        "VoidBadge": lambda variant: VoidBadge(variant, variant=variant),
+        "VoidCard": card,
+        "VoidProgress": progress,
+    }
+
+
+def render(case: Case, repeat: int = DEFAULT_REPEAT) -> tuple[QImage, float, float]:
+    """Render ``case`` with the theme of its mode already applied.
+
+    Returns the image and the build time (construction, polish and layout)
+    and median paint time (``QWidget.render`` of the host), in seconds.
+    Requires a QApplication.
+    """
+    from PySide6.QtWidgets import QApplication, QVBoxLayout, QWidget
+
+    from void_ui.widgets import active_colors
+
+    app = QApplication.instance()
+    width, height = HOST_SIZES[case.widget]
+    factory = _factories()[case.widget]
+
+    start = time.perf_counter()
+    host = QWidget()
+    host.setFixedSize(width, height)
+    layout = QVBoxLayout(host)
+    layout.setContentsMargins(HOST_MARGIN, HOST_MARGIN, HOST_MARGIN, HOST_MARGIN)
+    layout.addWidget(factory(case.variant))
+    host.show()
+    app.processEvents()
+    build = time.perf_counter() - start
+
+    # The sheet keeps plain widgets transparent; paint on the window color.
+    background = active_colors().qcolor("void")
+    image = QImage(width, height, QImage.Format_RGB32)
+    samples = []
+    for _ in range(max(1, repeat)):
+        image.fill(background)
+        start = time.perf_counter()
+        host.render(image)
+        samples.append(time.perf_counter() - start)
+
+    host.close()
+    host.deleteLater()
+    return image, build, statistics.median(samples)
+
+
+def _pixels(image: QImage) -> array:
+    image = image.convertToFormat(QImage.Format_RGB32)
+    # 32-bit scan lines are never padded.
+    return array("I", bytes(image.constBits())[: image.width() * image.height() * 4])
+
+
+def _delta(a: int, b: int) -> float:
+    """Squared YIQ distance of two 0xAARRGGBB pixels."""
+    dr = ((a >> 16) & 255) - ((b >> 16) & 255)
+    dg = ((a >> 8) & 255) - ((b >> 8) & 255)
+    db = (a & 255) - (b & 255)
+    y = dr * 0.29889531 + dg * 0.58662247 + db * 0.11448223
+    i = dr * 0.59597799 - dg * 0.27417610 - db * 0.32180189
+    q = dr * 0.21147017 - dg * 0.52261711 + db * 0.31114694
+    return 0.5053 * y * y + 0.299 * i * i + 0.1957 * q * q
+
+
+def perceptual_diff(
+    actual: QImage,
+    golden: QImage,
+    threshold: float = DEFAULT_THRESHOLD,
+    diff_image: bool = True,
+) -> DiffResult:
+    """Count the pixels of ``actual`` that visibly differ from ``golden``.
+
+    Images of different sizes differ in every pixel. With ``diff_image``
+    the result holds the golden, faded to gray, with differing pixels in
+    red (``None`` when nothing differs).
+    """
+    width, height = actual.width(), actual.height()
+    total = max(1, width * height)
+    if golden.size() != actual.size():
+        return DiffResult(total, 1.0, actual.copy() if diff_image else None)
+
+    limit = _MAX_DELTA * threshold * threshold
+    different = [
+        index
+        for index, (a, b) in enumerate(zip(_pixels(actual), _pixels(golden)))
+        if a != b and _delta(a, b) > limit
+    ]
+    if not different or not diff_image:
+        return DiffResult(len(different), len(different) / total, None)
+
+    image = golden.convertToFormat(QImage.Format_Grayscale8).convertToFormat(QImage.Format_RGB32)
+    painter = QPainter(image)
+    painter.fillRect(image.rect(), QColor(255, 255, 255, 180))
+    painter.end()
+    red = QColor(255, 0, 0).rgb()
+    for index in different:
+        image.setPixel(index % width, index // width, red)
+    return DiffResult(len(different), len(different) / total, image)
+
+
+# The worker's QApplication, created on its first shard.
+_app = None
+
+
+def _render_shard(
+    shard: list[Case],
+    golden: str,
+    output: str,
+    update: bool,
+    threshold: float,
+    tolerance: float,
+    repeat: int,
+) -> list[SnapshotResult]:
+    """Render and check the cases of one shard. Runs in a worker process."""
+    global _app
+
+    os.environ["QT_QPA_PLATFORM"] = "offscreen"
+    # Sheets for both modes are rendered here anyway.
+    os.environ.setdefault("VOID_UI_PREWARM", "0")
+    # Render the sheets rather than read or fill the user's sheet cache.
+    os.environ.setdefault("VOID_UI_CACHE_DIR", "")
+    from PySide6.QtWidgets import QApplication
+
+    from void_ui.theme import Theme
+
+    if _app is None:
+        _app = QApplication.instance() or QApplication([])
+    golden_dir, output_dir = Path(golden), Path(output)
+
+    results = []
+    mode = None
+    for case in sorted(shard, key=lambda c: c.mode.value):
+        if case.mode != mode:
+            mode = case.mode
+            Theme(mode).apply(_app)
+        image, build, paint = render(case, repeat)
+
+        path = golden_dir / f"{case.name}.png"
+        fraction = 0.0
+        if update:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            image.save(str(path))
+            status = "updated"
+        elif not path.exists():
+            status = "missing"
+            image.save(str(output_dir / f"{case.name}.actual.png"))
+        else:
+            diff = perceptual_diff(image, QImage(str(path)), threshold)
+            fraction = diff.fraction
+            status = "match" if fraction <= tolerance else "mismatch"
+            if status == "mismatch":
+                image.save(str(output_dir / f"{case.name}.actual.png"))
+                diff.image.save(str(output_dir / f"{case.name}.diff.png"))
+        results.append(SnapshotResult(
+            case.name, case.widget, case.variant, case.mode.value,
+            status, fraction, build, paint, image.width(), image.height(),
+        ))
+    return results
+
+
+def _shards(matrix: list[Case], jobs: int) -> list[list[Case]]:
+    # Contiguous chunks keep each worker mostly on one mode.
+    size = -(-len(matrix) // jobs)
+    return [matrix[i:i + size] for i in range(0, len(matrix), size)]
+
+
+def run(
+    golden: str | os.PathLike = "snapshots",
+    output: str | os.PathLike = "snapshot-report",
+    update: bool = False,
+    widgets: Iterable[str] | None = None,
+    modes: Iterable[ThemeMode] | None = None,
+    jobs: int = 1,
+    threshold: float = DEFAULT_THRESHOLD,
+    tolerance: float = DEFAULT_TOLERANCE,
+    repeat: int = DEFAULT_REPEAT,
+) -> list[SnapshotResult]:
+    """Render the matrix in ``jobs`` worker processes and check it.
+
+    With ``update`` the goldens are (re)written instead of compared. The
+    report and the images of failing cases go to ``output``.
+    """
+    if not HAS_PYSIDE:
+        raise ImportError("PySide6 is required: pip install void-ui[pyside]")
+
+    matrix = cases(widgets, modes)
+    jobs = max(1, min(jobs, len(matrix)))
+    output_dir = Path(output)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    args = (str(golden), str(output_dir), update, threshold, tolerance, repeat)
+    # Qt does not survive fork(); start clean interpreters.
+    with ProcessPoolExecutor(jobs, mp_context=get_context("spawn")) as pool:
+        futures = [pool.submit(_render_shard, shard, *args) for shard in _shards(matrix, jobs)]
+        results = [result for future in futures for result in future.result()]
+
+    order = {case.name: index for index, case in enumerate(matrix)}
+    results.sort(key=lambda result: order[result.name])
+    import PySide6
+
+    write_report(
+        output_dir / "report.json",
+        results,
+        pyside6=PySide6.__version__,
+        jobs=jobs,
+        repeat=repeat,
+        threshold=threshold,
+        tolerance=tolerance,
+    )
+    return results
+
+
+def write_report(path: str | os.PathLike, results: list[SnapshotResult], **meta: object) -> None:
+    """Write ``results`` and per-widget paint timings as JSON."""
+    widgets: dict[str, list[SnapshotResult]] = {}
+    for result in results:
+        widgets.setdefault(result.widget, []).append(result)
+    report = {
+        "meta": {"platform": sys.platform, **meta},
+        "widgets": {
+            name: {
+                "cases": len(group),
+                "build_median": statistics.median(r.build for r in group),
+                "paint_median": statistics.median(r.paint for r in group),
+                "paint_max": max(r.paint for r in group),
+            }
+            for name, group in widgets.items()
+        },
+        "results": [result._asdict() for result in results],
+    }
+    Path(path).write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+
+
+def main(argv: list[str] | None = None) -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog="python -m void_ui.snapshots", description=__doc__.splitlines()[0]
+    )
+    parser.add_argument("--golden", type=Path, default=Path("snapshots"),
+                        help="directory of golden PNGs")
+    parser.add_argument("--output", type=Path, default=Path("snapshot-report"),
+                        help="directory for report.json and failing images")
+    parser.add_argument("--update", action="store_true", help="write goldens instead of comparing")
+    parser.add_argument("--widget", action="append", choices=list(VARIANTS),
+                        help="only these widget classes (repeatable)")
+    parser.add_argument("--mode", action="append", choices=[m.value for m in ThemeMode],
+                        help="only these modes (repeatable)")
+    parser.add_argument("--jobs", type=int, default=1, help="worker processes (default: 1)")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="per-pixel color distance, 0..1")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="fraction of differing pixels allowed per case")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT,
+                        help="paints per case for the timing median")
+    args = parser.parse_args(argv)
+
+    results = run(
+        golden=args.golden,
+        output=args.output,
+        update=args.update,
+        widgets=args.widget,
+        modes=[ThemeMode(m) for m in args.mode] if args.mode else None,
+        jobs=args.jobs,
+        threshold=args.threshold,
+        tolerance=args.tolerance,
+        repeat=args.repeat,
+    )
+    for r in results:
+        diff = f"{r.diff_fraction * 100:6.2f}%" if r.status == "mismatch" else ""
+        print(
+            f"{r.name:<34} {r.status:<8} build {r.build * 1e3:6.2f}ms  "
+            f"paint {r.paint * 1e3:6.3f}ms  {diff}"
+        )
+    failed = [r for r in results if r.status in ("mismatch", "missing")]
+    print(f"{len(results)} cases, {len(failed)} failed; report in {args.output / 'report.json'}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
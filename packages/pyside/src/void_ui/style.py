@@ -0,0 +1,491 @@
+"""Void UI native style backend.
+
+A stylesheet-free rendering path. ``void_palette`` maps the color tokens
+onto ``QPalette`` roles, and ``VoidStyle``, a ``QProxyStyle`` over Fusion,
+draws what the palette cannot express: rounded buttons per variant,
+inputs, thin scroll bars, progress bars, item view rows and headers,
+cards and badges, using the ``RADIUS`` and ``SPACING`` tokens.
+
+Qt's stylesheet style resolves rules for every widget it paints; a native
+style paints straight from the palette, which is much cheaper for large
+item views and dashboards. The look follows the generated QSS closely but
+not to the pixel: widgets the style does not handle are drawn by Fusion
+in the Void palette.
+
+Usage:
+    theme = Theme(native=True)
+    theme.apply(app)
+
+    # or directly
+    from void_ui.style import apply_native
+    apply_native(app, DarkColors)
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+
+try:
+    from PySide6.QtCore import QRect, QRectF, QSize, Qt
+    from PySide6.QtGui import QFont, QPainter, QPalette, QPen
+    from PySide6.QtWidgets import (
+        QAbstractItemView,
+        QAbstractScrollArea,
+        QApplication,
+        QLabel,
+        QListView,
+        QProxyStyle,
+        QPushButton,
+        QStyle,
+        QStyleFactory,
+        QStyleOptionHeader,
+        QWidget,
+    )
+    HAS_PYSIDE = True
+except ImportError:
+    HAS_PYSIDE = False
+    QProxyStyle = object
+
+from void_ui import fonts as _fonts
+from void_ui.colors import RADIUS, SPACING, TYPOGRAPHY, Colors
+
+# Palette role -> color token. Text on plain widgets is gray, as the
+# QLabel/QCheckBox rules of the sheet; inputs and views use Text (white).
+PALETTE_ROLES = {
+    "Window": "void",
+    "WindowText": "gray",
+    "Base": "surface",
+    "AlternateBase": "raised",
+    "Text": "white",
+    "Button": "surface",
+    "ButtonText": "gray",
+    "BrightText": "white",
+    "Highlight": "peach",
+    "HighlightedText": "void",
+    "ToolTipBase": "white",
+    "ToolTipText": "void",
+    "PlaceholderText": "muted",
+    "Link": "peach",
+    "LinkVisited": "accent_hover",
+    "Light": "elevated",
+    "Midlight": "raised",
+    "Mid": "border",
+    "Dark": "border",
+    "Shadow": "void",
+}
+
+# VoidButton variant -> (background, border, text) for normal and hover.
+# None is no fill / no border.
+BUTTON_COLORS = {
+    "": (("surface", "border", "gray"), ("raised", "elevated", "white")),
+    "primary": (("peach", None, "void"), ("accent_hover", None, "void")),
+    "danger": (("danger", None, "white"), ("danger", None, "white")),
+    "ghost": ((None, None, "gray"), ("surface", None, "white")),
+}
+
+# VoidLabel class -> text color; plain labels use WindowText.
+LABEL_COLORS = {"white": "white", "muted": "muted", "accent": "accent"}
+
+SCROLLBAR_EXTENT = 6
+SCROLLBAR_SLIDER_MIN = 40
+BUTTON_MIN_HEIGHT = 32
+BADGE_PADDING = (8, 3)
+
+
+@lru_cache(maxsize=8)
+def void_palette(colors: Colors) -> QPalette:
+    """The ``QPalette`` of a color scheme. Treat it as read-only."""
+    palette = QPalette()
+    for role, name in PALETTE_ROLES.items():
+        palette.setColor(getattr(QPalette, role), colors.qcolor(name))
+    for role in (QPalette.WindowText, QPalette.Text, QPalette.ButtonText):
+        palette.setColor(QPalette.Disabled, role, colors.qcolor("muted"))
+    return palette
+
+
+def void_font(size: int, weight: int = 400) -> QFont:
+    """A font of the token font stack at ``size`` pixels.
+
+    The stack is resolved to installed families and the font is shared,
+    see :func:`void_ui.fonts.font`; copy it before modifying it.
+    """
+    return _fonts.font(TYPOGRAPHY.font_family, size, weight)
+
+
+def _class_fonts() -> dict[str | None, QFont]:
+    """Fonts per widget class name, as the font rules of the sheet."""
+    return {
+        None: void_font(TYPOGRAPHY.size_base),
+        "QPushButton": void_font(TYPOGRAPHY.size_sm, 500),
+        "QHeaderView": void_font(TYPOGRAPHY.size_xs, 500),
+        "QTipLabel": void_font(TYPOGRAPHY.size_xs),
+        "VoidBadge": void_font(11, 500),
+    }
+
+
+class VoidStyle(QProxyStyle):
+    """Fusion with the Void look for buttons, inputs, scroll bars, progress
+    bars, item views, cards and badges, drawn in ``colors``."""
+
+    def __init__(self, colors: Colors) -> None:
+        if not HAS_PYSIDE:
+            raise ImportError("PySide6 is required: pip install void-ui[pyside]")
+
+        super().__init__(QStyleFactory.create("Fusion"))
+        self.colors = colors
+        self._views = QStyleFactory.create("Fusion")
+        self._views.setParent(self)
+        self._released = False
+
+    # -- Polish --
+
+    def polish(self, target) -> None:
+        super().polish(target)
+        if not isinstance(target, QWidget):
+            return
+        name = target.metaObject().className()
+        if name == "VoidBadge":
+            palette = _badge_colors(self.colors)
+            _, fg = palette.get(target.property("variant"), palette["default"])
+            target.setContentsMargins(*BADGE_PADDING, *BADGE_PADDING)
+            _set_text_color(target, fg)
+        elif name == "VoidCard":
+            target.setContentsMargins(*(SPACING.lg,) * 4)
+        elif isinstance(target, QLabel) and name != "QTipLabel":
+            color = LABEL_COLORS.get(target.property("class"))
+            if color is not None:
+                _set_text_color(target, self.colors.qcolor(color))
+        elif isinstance(target, QAbstractItemView) and not self._released:
+            # Items are painted by a plain Fusion style in the view's
+            # palette: a Python override called per painted item costs more
+            # than the stylesheet does. Headers and scroll bars are child
+            # widgets and stay on this style.
+            target.setStyle(self._views)
+            target.setPalette(_view_palette(self.colors, isinstance(target, QListView)))
+
+    def unpolish(self, target) -> None:
+        if isinstance(target, QWidget):
+            name = target.metaObject().className()
+            if name in ("VoidBadge", "VoidCard"):
+                target.setContentsMargins(0, 0, 0, 0)
+            if isinstance(target, QLabel) and target.property("voidTextColor"):
+                target.setProperty("voidTextColor", None)
+                target.setPalette(QPalette())
+        super().unpolish(target)
+
+    def release_views(self) -> None:
+        """Hand the item views given the Fusion style back to their
+        parent's style, before this style is replaced."""
+        self._released = True
+        for widget in QApplication.allWidgets():
+            if widget.style() is self._views:
+                widget.setStyle(None)
+                widget.setPalette(QPalette())
+
+    # -- Metrics --
+
+    def pixelMetric(self, metric, option=None, widget=None) -> int:
+        if metric == QStyle.PM_ScrollBarExtent:
+            return SCROLLBAR_EXTENT
+        if metric == QStyle.PM_ScrollBarSliderMin:
+            return SCROLLBAR_SLIDER_MIN
+        return super().pixelMetric(metric, option, widget)
+
+    def sizeFromContents(self, kind, option, size, widget=None) -> QSize:
+        if kind == QStyle.CT_PushButton:
+            return QSize(
+                size.width() + 2 * SPACING.lg + 2,
+                max(BUTTON_MIN_HEIGHT, size.height() + 2 * SPACING.sm + 2),
+            )
+        if kind == QStyle.CT_LineEdit:
+            return QSize(size.width() + 2 * SPACING.md + 2, size.height() + 2 * SPACING.sm + 2)
+        return super().sizeFromContents(kind, option, size, widget)
+
+    def subElementRect(self, element, option, widget=None) -> QRect:
+        if element == QStyle.SE_LineEditContents:
+            return option.rect.adjusted(SPACING.md + 1, 1, -SPACING.md - 1, -1)
+        return super().subElementRect(element, option, widget)
+
+    def subControlRect(self, control, option, sub, widget=None) -> QRect:
+        if control == QStyle.CC_ScrollBar:
+            return _scrollbar_rect(option, sub)
+        return super().subControlRect(control, option, sub, widget)
+
+    # -- Drawing --
+
+    def drawPrimitive(self, element, option, painter, widget=None) -> None:
+        colors = self.colors
+        if element == QStyle.PE_PanelLineEdit:
+            if option.lineWidth > 0:
+                focused = bool(option.state & QStyle.State_HasFocus)
+                _rounded(
+                    painter,
+                    option.rect,
+                    RADIUS.md,
+                    colors.qcolor("raised" if focused else "surface"),
+                    colors.qcolor("peach" if focused else "border"),
+                )
+            return
+        if element == QStyle.PE_FrameLineEdit:
+            return
+        if element == QStyle.PE_FrameFocusRect and isinstance(widget, QPushButton):
+            return
+        super().drawPrimitive(element, option, painter, widget)
+
+    def drawControl(self, element, option, painter, widget=None) -> None:
+        colors = self.colors
+        if element == QStyle.CE_PushButtonBevel:
+            background, border, _ = _button_colors(option, widget)
+            _rounded(
+                painter,
+                option.rect,
+                RADIUS.md,
+                colors.qcolor(background) if background else None,
+                colors.qcolor(border) if border else None,
+            )
+            if option.state & QStyle.State_Sunken and background is not None:
+                _rounded(painter, option.rect, RADIUS.md, colors.qcolor("elevated"), None)
+            return
+        if element == QStyle.CE_PushButtonLabel:
+            _, _, text = _button_colors(option, widget)
+            option = type(option)(option)
+            if not option.state & QStyle.State_Enabled:
+                text = "muted"
+            option.palette.setColor(QPalette.ButtonText, colors.qcolor(text))
+            super().drawControl(element, option, painter, widget)
+            return
+        if element == QStyle.CE_ProgressBar:
+            if option.minimum == option.maximum:
+                super().drawControl(element, option, painter, widget)
+                return
+            self._draw_progress(option, painter, widget)
+            return
+        if element == QStyle.CE_Header and option.sortIndicator == QStyleOptionHeader.None_:
+            # One call per section: vertical headers paint one per row.
+            rect = option.rect
+            painter.fillRect(rect, colors.qbrush("surface"))
+            painter.fillRect(rect.left(), rect.bottom(), rect.width(), 1, colors.qbrush("border"))
+            if option.text:
+                painter.setPen(colors.qcolor("gray"))
+                painter.drawText(
+                    rect.adjusted(SPACING.xs, 0, -SPACING.xs, 0),
+                    option.textAlignment,
+                    option.text.upper(),
+                )
+            return
+        if element == QStyle.CE_ShapedFrame and self._draw_frame(option, painter, widget):
+            return
+        super().drawControl(element, option, painter, widget)
+
+    def drawComplexControl(self, control, option, painter, widget=None) -> None:
+        if control == QStyle.CC_ScrollBar:
+            slider = _scrollbar_rect(option, QStyle.SC_ScrollBarSlider)
+            hovered = (
+                option.state & QStyle.State_MouseOver
+                and option.activeSubControls & QStyle.SC_ScrollBarSlider
+            )
+            radius = SCROLLBAR_EXTENT / 2
+            _rounded(
+                painter, slider, radius, self.colors.qcolor("muted" if hovered else "border"), None
+            )
+            return
+        super().drawComplexControl(control, option, painter, widget)
+
+    def _draw_frame(self, option, painter: QPainter, widget: QWidget | None) -> bool:
+        """Cards, badges and scroll area frames; False to let Fusion draw."""
+        colors = self.colors
+        name = widget.metaObject().className() if widget is not None else ""
+        # The padding of cards and badges is in their contents margins,
+        # which the frame rect excludes.
+        if name == "VoidCard":
+            if widget.property("variant") == "elevated":
+                _rounded(painter, widget.rect(), RADIUS.xl, colors.qcolor("raised"), None)
+            else:
+                _rounded(
+                    painter, widget.rect(), RADIUS.xl,
+                    colors.qcolor("surface"), colors.qcolor("border"),
+                )
+            return True
+        if name == "VoidBadge":
+            palette = _badge_colors(colors)
+            bg, _ = palette.get(widget.property("variant"), palette["default"])
+            _rounded(painter, widget.rect(), RADIUS.sm, bg, None)
+            return True
+        if isinstance(widget, QAbstractScrollArea) and option.frameShape:
+            border = "border_light" if isinstance(widget, QAbstractItemView) else "border"
+            _rounded(painter, option.rect, RADIUS.md, None, colors.qcolor(border))
+            return True
+        return False
+
+    def _draw_progress(self, option, painter: QPainter, widget: QWidget | None) -> None:
+        from void_ui.widgets import _paint_bar, _progress_brushes
+
+        groove, chunks = _progress_brushes(self.colors)
+        variant = widget.property("variant") if widget is not None else None
+        span = option.maximum - option.minimum
+        end = (option.progress - option.minimum) / span
+        _paint_bar(
+            painter,
+            QRectF(option.rect),
+            0.0,
+            max(0.0, min(end, 1.0)),
+            groove,
+            chunks.get(variant, chunks["peach"]),
+        )
+        if option.textVisible and option.text:
+            painter.setPen(self.colors.qcolor("white"))
+            painter.drawText(option.rect, Qt.AlignCenter, option.text)
+
+
+@lru_cache(maxsize=8)
+def _view_palette(colors: Colors, single_fill: bool) -> QPalette:
+    """Item view palette selecting in ``accent_bg`` and ``accent``.
+
+    Table and tree views fill a selected item twice, as row and as item,
+    so there Highlight carries the alpha whose double fill composites to
+    ``accent_bg``.
+    """
+    from void_ui.colors import VoidColor
+
+    accent_bg = colors.color("accent_bg")
+    alpha = accent_bg.alpha if single_fill else round((1 - (1 - accent_bg.alpha_f) ** 0.5) * 255)
+    highlight = VoidColor.from_rgba(accent_bg.red, accent_bg.green, accent_bg.blue, alpha)
+    palette = QPalette(void_palette(colors))
+    palette.setColor(QPalette.Highlight, highlight.qcolor())
+    palette.setColor(QPalette.HighlightedText, colors.qcolor("accent"))
+    return palette
+
+
+@lru_cache(maxsize=8)
+def _badge_colors(colors: Colors) -> dict[str, tuple]:
+    from void_ui.colors import VoidColor
+    from void_ui.theme import badge_colors
+
+    return {
+        variant: (VoidColor.parse(bg).qcolor(), VoidColor.parse(fg).qcolor())
+        for variant, (bg, fg) in badge_colors(colors).items()
+    }
+
+
+def _button_colors(option, widget: QWidget | None) -> tuple[str | None, str | None, str]:
+    variant = widget.property("class") if widget is not None else None
+    normal, hover = BUTTON_COLORS.get(variant or "", BUTTON_COLORS[""])
+    return hover if option.state & QStyle.State_MouseOver else normal
+
+
+def _set_text_color(label: QLabel, color) -> None:
+    palette = label.palette()
+    palette.setColor(QPalette.WindowText, color)
+    label.setPalette(palette)
+    label.setProperty("voidTextColor", True)
+
+
+def _rounded(painter: QPainter, rect: QRect, radius: float, fill, border) -> None:
+    """Fill and/or outline ``rect`` with rounded corners, inside ``rect``."""
+    if fill is None and border is None:
+        return
+    painter.save()
+    painter.setRenderHint(QPainter.Antialiasing)
+    painter.setBrush(fill if fill is not None else Qt.NoBrush)
+    if border is not None:
+        painter.setPen(QPen(border, 1))
+        area = QRectF(rect).adjusted(0.5, 0.5, -0.5, -0.5)
+    else:
+        painter.setPen(Qt.NoPen)
+        area = QRectF(rect)
+    painter.drawRoundedRect(area, radius, radius)
+    painter.restore()
+
+
+def _scrollbar_rect(option, sub) -> QRect:
+    """Sub-control rects of a scroll bar without arrow buttons."""
+    rect = option.rect
+    horizontal = option.orientation == Qt.Horizontal
+    length = rect.width() if horizontal else rect.height()
+    span = option.maximum - option.minimum
+    if span <= 0:
+        slider_length = length
+    else:
+        slider_length = max(
+            SCROLLBAR_SLIDER_MIN, length * option.pageStep // (span + option.pageStep)
+        )
+    slider_length = min(slider_length, length)
+    start = QStyle.sliderPositionFromValue(
+        option.minimum, option.maximum, option.sliderPosition,
+        length - slider_length, option.upsideDown,
+    )
+
+    if sub == QStyle.SC_ScrollBarSlider:
+        first, size = start, slider_length
+    elif sub == QStyle.SC_ScrollBarSubPage:
+        first, size = 0, start
+    elif sub == QStyle.SC_ScrollBarAddPage:
+        first, size = start + slider_length, length - start - slider_length
+    elif sub == QStyle.SC_ScrollBarGroove:
+        first, size = 0, length
+    else:
+        return QRect()
+    if horizontal:
+        return QRect(rect.left() + first, rect.top(), size, rect.height())
+    return QRect(rect.left(), rect.top() + first, rect.width(), size)
+
+
+# Name of the application style replaced by apply_native().
+_app_style_name: str | None = None
+
+
+def apply_native(widget: QWidget | QApplication, colors: Colors) -> VoidStyle:
+    """Style ``widget`` with the palette and ``VoidStyle`` of ``colors``.
+
+    Removes ``widget``'s stylesheet. On a QApplication the style, palette
+    and per-class fonts are application-wide. On a widget they are set on
+    the widget and its current descendants only.
+    """
+    style = VoidStyle(colors)
+    palette = void_palette(colors)
+    fonts = _class_fonts()
+    widget.setStyleSheet("")
+    previous = widget.style()
+    if isinstance(previous, VoidStyle):
+        previous.release_views()
+
+    if isinstance(widget, QApplication):
+        global _app_style_name
+
+        if not isinstance(previous, VoidStyle):
+            _app_style_name = previous.name()
+        widget.setStyle(style)
+        widget.setPalette(palette)
+        for class_name, font in fonts.items():
+            if class_name is None:
+                widget.setFont(font)
+            else:
+                widget.setFont(font, class_name)
+        return style
+
+    # QWidget.setStyle does not take ownership.
+    style.setParent(widget)
+    for child in [widget, *widget.findChildren(QWidget)]:
+        child.setStyle(style)
+    if isinstance(previous, VoidStyle):
+        previous.deleteLater()
+    widget.setPalette(palette)
+    widget.setFont(fonts[None])
+    return style
+
+
+def restore_style(widget: QWidget | QApplication) -> None:
+    """Undo :func:`apply_native` before a stylesheet is installed."""
+    style = widget.style()
+    if not isinstance(style, VoidStyle):
+        return
+    style.release_views()
+    if isinstance(widget, QApplication):
+        previous = QStyleFactory.create(_app_style_name or "Fusion")
+        widget.setStyle(previous)
+        widget.setPalette(previous.standardPalette())
+        return
+    for child in [widget, *widget.findChildren(QWidget)]:
+        child.setStyle(None)
+    widget.setPalette(QPalette())
+    style.deleteLater()
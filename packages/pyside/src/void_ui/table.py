@@ -0,0 +1,330 @@
+"""Void UI virtualized table.
+
+``VoidTable`` is a styled ``QTableView`` over ``VoidTableModel``, which
+reads rows lazily from a chunked data source. Random-access sources (NumPy
+arrays, SQLite queries) keep only a bounded LRU of chunks in memory, so
+millions of rows scroll at a constant footprint. Streaming sources
+(generators, SQLite cursors) are pulled through ``canFetchMore`` /
+``fetchMore`` as the view scrolls; they cannot be read twice, so every row
+pulled so far stays in memory. Use ``ArraySource`` or ``SqliteSource`` for
+data sets too large to hold.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from collections import OrderedDict
+from collections.abc import Iterable, Sequence
+from itertools import islice
+from numbers import Number
+from typing import Any, Protocol
+
+try:
+    from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
+    from PySide6.QtWidgets import QAbstractItemView, QHeaderView, QTableView, QWidget
+    HAS_PYSIDE = True
+except ImportError:
+    HAS_PYSIDE = False
+    QAbstractTableModel = object
+    QTableView = object
+
+from void_ui.widgets import _track
+
+
+class TableSource(Protocol):
+    """Chunked row source for :class:`VoidTableModel`.
+
+    ``row_count()`` returns the total number of rows, or ``None`` for
+    streaming sources whose length is unknown. ``fetch(start, count)``
+    returns up to ``count`` rows beginning at ``start``; streaming sources
+    are only ever asked for the rows following the last fetch.
+    """
+
+    columns: Sequence[str]
+
+    def row_count(self) -> int | None: ...
+
+    def fetch(self, start: int, count: int) -> Sequence[Sequence[Any]]: ...
+
+
+class IterableSource:
+    """Streaming source over any iterable of rows, e.g. a generator."""
+
+    def __init__(self, rows: Iterable[Sequence[Any]], columns: Sequence[str]) -> None:
+        self.columns = list(columns)
+        self._rows = iter(rows)
+
+    def row_count(self) -> None:
+        return None
+
+    def fetch(self, start: int, count: int) -> list[Sequence[Any]]:
+        return list(islice(self._rows, count))
+
+
+class CursorSource:
+    """Streaming source over an executed DB-API cursor (e.g. sqlite3)."""
+
+    def __init__(self, cursor: Any, columns: Sequence[str] | None = None) -> None:
+        self.columns = list(columns or (d[0] for d in cursor.description))
+        self._cursor = cursor
+
+    def row_count(self) -> None:
+        return None
+
+    def fetch(self, start: int, count: int) -> list[Sequence[Any]]:
+        return self._cursor.fetchmany(count)
+
+
+class ArraySource:
+    """Random-access source over a 2-D or structured NumPy array.
+
+    Any object with ``len()``, slicing and ``tolist()`` rows works too.
+    """
+
+    def __init__(self, array: Any, columns: Sequence[str] | None = None) -> None:
+        names = getattr(getattr(array, "dtype", None), "names", None)
+        if columns is None:
+            columns = names or [str(i) for i in range(array.shape[1])]
+        self.columns = list(columns)
+        self._array = array
+        self._structured = names is not None
+
+    def row_count(self) -> int:
+        return len(self._array)
+
+    def fetch(self, start: int, count: int) -> list[Sequence[Any]]:
+        rows = self._array[start:start + count]
+        if self._structured:
+            return [tuple(row) for row in rows.tolist()]
+        return rows.tolist()
+
+
+class SqliteSource:
+    """Random-access source over an SQLite query, paged with LIMIT/OFFSET.
+
+    For large tables, order the query by an indexed column so that pages
+    deep into the result stay cheap.
+    """
+
+    def __init__(
+        self,
+        connection: sqlite3.Connection,
+        query: str,
+        params: Sequence[Any] = (),
+    ) -> None:
+        self._connection = connection
+        self._query = query
+        self._params = tuple(params)
+        cursor = connection.execute(f"SELECT * FROM ({query}) LIMIT 0", self._params)
+        self.columns = [d[0] for d in cursor.description]
+        self._count: int | None = None
+
+    def row_count(self) -> int:
+        if self._count is None:
+            self._count = self._connection.execute(
+                f"SELECT COUNT(*) FROM ({self._query})", self._params
+            ).fetchone()[0]
+        return self._count
+
+    def fetch(self, start: int, count: int) -> list[Sequence[Any]]:
+        return self._connection.execute(
+            f"SELECT * FROM ({self._query}) LIMIT ? OFFSET ?", (*self._params, count, start)
+        ).fetchall()
+
+
+def as_source(data: Any, columns: Sequence[str] | None = None) -> TableSource:
+    """Wrap arrays, cursors and iterables in the matching source."""
+    if hasattr(data, "fetch") and hasattr(data, "row_count"):
+        return data
+    if hasattr(data, "fetchmany") and hasattr(data, "description"):
+        return CursorSource(data, columns)
+    if hasattr(data, "shape") and hasattr(data, "tolist"):
+        return ArraySource(data, columns)
+    if columns is None:
+        raise ValueError("columns are required for iterable sources")
+    return IterableSource(data, columns)
+
+
+class VoidTableModel(QAbstractTableModel):
+    """Lazy table model over a :class:`TableSource`.
+
+    Rows are fetched in chunks of ``chunk_size``. For random-access sources
+    at most ``max_chunks`` chunks are cached (least recently used first out).
+    Streaming sources are unbounded: they keep every row fetched so far, as
+    rows cannot be fetched again once evicted.
+    """
+
+    def __init__(
+        self,
+        source: TableSource,
+        chunk_size: int = 256,
+        max_chunks: int = 64,
+        parent: QWidget | None = None,
+    ) -> None:
+        if not HAS_PYSIDE:
+            raise ImportError("PySide6 is required: pip install void-ui[pyside]")
+
+        super().__init__(parent)
+        self._source = source
+        self._columns = list(source.columns)
+        self._chunk_size = chunk_size
+        self._max_chunks = max_chunks
+        self._total = source.row_count()
+        self._chunks: OrderedDict[int, Sequence[Sequence[Any]]] = OrderedDict()
+        self._streamed: list[Sequence[Any]] = []
+        self._exhausted = False
+
+    @property
+    def source(self) -> TableSource:
+        return self._source
+
+    @property
+    def streaming(self) -> bool:
+        return self._total is None
+
+    def row(self, index: int) -> Sequence[Any] | None:
+        """Row ``index`` of the loaded data, fetching its chunk if needed."""
+        if self._total is None:
+            return self._streamed[index] if index < len(self._streamed) else None
+
+        chunk_index, offset = divmod(index, self._chunk_size)
+        chunk = self._chunks.get(chunk_index)
+        if chunk is None:
+            chunk = self._source.fetch(chunk_index * self._chunk_size, self._chunk_size)
+            self._chunks[chunk_index] = chunk
+            if len(self._chunks) > self._max_chunks:
+                self._chunks.popitem(last=False)
+        else:
+            self._chunks.move_to_end(chunk_index)
+        return chunk[offset] if offset < len(chunk) else None
+
+    def sample_rows(self, count: int) -> list[Sequence[Any]]:
+        """Up to ``count`` rows spread evenly over the rows fetched so far.
+
+        Fetches the first chunk when nothing is loaded yet, never more, so
+        sampling costs at most one query however large the source is.
+        """
+        if self._total is None:
+            rows = self._streamed
+        else:
+            if not self._chunks and self._total:
+                self.row(0)
+            rows = [row for chunk in self._chunks.values() for row in chunk]
+        step = max(1, len(rows) // max(count, 1))
+        return rows[::step][:count]
+
+    # -- Qt model interface --
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self._streamed) if self._total is None else self._total
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._columns)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        if role == Qt.DisplayRole:
+            row = self.row(index.row())
+            if row is None:
+                return None
+            value = row[index.column()]
+            return "" if value is None else str(value)
+        if role == Qt.TextAlignmentRole:
+            row = self.row(index.row())
+            if row is not None and isinstance(row[index.column()], Number):
+                return int(Qt.AlignRight | Qt.AlignVCenter)
+            return int(Qt.AlignLeft | Qt.AlignVCenter)
+        return None
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self._columns[section]
+        return None
+
+    def canFetchMore(self, parent: QModelIndex = QModelIndex()) -> bool:
+        return self._total is None and not self._exhausted and not parent.isValid()
+
+    def fetchMore(self, parent: QModelIndex = QModelIndex()) -> None:
+        if not self.canFetchMore(parent):
+            return
+        rows = self._source.fetch(len(self._streamed), self._chunk_size)
+        if len(rows) < self._chunk_size:
+            self._exhausted = True
+        if rows:
+            first = len(self._streamed)
+            self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+            self._streamed.extend(rows)
+            self.endInsertRows()
+
+
+class VoidTable(QTableView if HAS_PYSIDE else object):
+    """Void UI virtualized table view.
+
+    Rows have a fixed height and columns are sized from a sample of rows,
+    so neither layout nor resizing ever scans the whole data set.
+
+    Usage:
+        table = VoidTable(jobs_array, columns=["id", "shot", "frames", "status"])
+        table = VoidTable(sqlite_connection.execute("SELECT * FROM jobs"))
+        table.set_source(SqliteSource(connection, "SELECT * FROM jobs ORDER BY id"))
+    """
+
+    def __init__(
+        self,
+        data: Any = None,
+        columns: Sequence[str] | None = None,
+        sample_size: int = 200,
+        parent: QWidget | None = None,
+    ) -> None:
+        if not HAS_PYSIDE:
+            raise ImportError("PySide6 is required: pip install void-ui[pyside]")
+
+        super().__init__(parent)
+        _track(self)
+        self._sample_size = sample_size
+
+        self.setShowGrid(False)
+        self.setWordWrap(False)
+        self.setAlternatingRowColors(False)
+        self.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.setHorizontalScrollMode(QAbstractItemView.ScrollPerPixel)
+
+        vertical = self.verticalHeader()
+        vertical.setVisible(False)
+        vertical.setSectionResizeMode(QHeaderView.Fixed)
+        vertical.setDefaultSectionSize(self.fontMetrics().height() + 12)
+
+        horizontal = self.horizontalHeader()
+        horizontal.setSectionResizeMode(QHeaderView.Interactive)
+        horizontal.setStretchLastSection(True)
+        horizontal.setHighlightSections(False)
+
+        if data is not None:
+            self.set_source(as_source(data, columns))
+
+    def set_source(self, source: TableSource, chunk_size: int = 256) -> VoidTableModel:
+        """Show ``source`` in the table and size its columns."""
+        model = VoidTableModel(source, chunk_size=chunk_size, parent=self)
+        self.setModel(model)
+        if model.streaming:
+            model.fetchMore()
+        self.fit_columns()
+        return model
+
+    def fit_columns(self, sample_size: int | None = None, max_width: int = 480) -> None:
+        """Size columns to the header and a sample of rows."""
+        model = self.model()
+        if not isinstance(model, VoidTableModel):
+            return
+        rows = model.sample_rows(sample_size or self._sample_size)
+        metrics = self.fontMetrics()
+        header_metrics = self.horizontalHeader().fontMetrics()
+        padding = 32
+        for column in range(model.columnCount()):
+            width = header_metrics.horizontalAdvance(str(model.headerData(column, Qt.Horizontal)))
+            for row in rows:
+                value = row[column]
+                width = max(width, metrics.horizontalAdvance("" if value is None else str(value)))
+            self.setColumnWidth(column, min(width + padding, max_width))
@@ -5,9 +5,16 @@ Generates Qt stylesheets matching the CSS design system.
 
 from __future__ import annotations
 
+import sys
+import threading
+from collections.abc import Iterable
 from enum import Enum
-from typing import TYPE_CHECKING
+from functools import cache, lru_cache
+from string import Formatter
+from typing import TYPE_CHECKING, NamedTuple
 
+from void_ui import cache as _cache
+from void_ui import qss as _qss
 from void_ui.colors import (
     Colors,
     DarkColors,
@@ -15,6 +22,9 @@ from void_ui.colors import (
     RADIUS,
     SPACING,
     TYPOGRAPHY,
+    Radius,
+    Spacing,
+    Typography,
 )
 
 if TYPE_CHECKING:
@@ -26,39 +36,42 @@ class ThemeMode(Enum):
     LIGHT = "light"
 
 
-class Theme:
-    """Void UI theme manager.
-
-    Usage:
-        theme = Theme()  # Dark by default
-        theme.apply(app)
-
-        # Or light mode
-        theme = Theme(ThemeMode.LIGHT)
-        theme.apply(app)
-    """
-
-    def __init__(self, mode: ThemeMode = ThemeMode.DARK) -> None:
-        self.mode = mode
-        self._colors = DarkColors if mode == ThemeMode.DARK else LightColors
-
-    @property
-    def colors(self) -> Colors:
-        return self._colors
-
-    def toggle(self) -> None:
-        """Toggle between dark and light mode."""
-        self.mode = ThemeMode.LIGHT if self.mode == ThemeMode.DARK else ThemeMode.DARK
-        self._colors = DarkColors if self.mode == ThemeMode.DARK else LightColors
-
-    def generate_qss(self) -> str:
-        """Generate complete Qt stylesheet."""
-        c = self._colors
-        r = RADIUS
-        s = SPACING
-        t = TYPOGRAPHY
-
-        return f'''
+# Dynamic property carrying the active mode on the root(s) of a switchable
+# sheet. See Theme.switch().
+MODE_PROPERTY = "voidMode"
+
+# Dynamic property naming the scoped sheet that styles a subtree. See
+# Theme.apply(scoped=True).
+SCOPE_PROPERTY = "voidScope"
+
+# Variant tables for the Void widgets, written in QSS template syntax. They
+# render into property-selector rules of the shared sheet and, through
+# badge_colors()/progress_colors(), into plain color maps for painting.
+
+# VoidBadge variant -> (background, foreground)
+BADGE_VARIANTS: dict[str, tuple[str, str]] = {
+    "default": ("{c.elevated}", "{c.gray}"),
+    "peach": ("{c.accent_bg}", "{c.peach}"),
+    "moss": ("{c.success_bg}", "{c.moss}"),
+    "sand": ("{c.warning_bg}", "{c.sand}"),
+    "blush": ("rgba(212, 165, 165, 0.15)", "{c.blush}"),
+    "lilac": ("{c.info_bg}", "{c.lilac}"),
+    "danger": ("{c.danger_bg}", "{c.danger}"),
+}
+
+# VoidProgress color -> chunk color
+PROGRESS_COLORS: dict[str, str] = {
+    "peach": "{c.peach}",
+    "moss": "{c.moss}",
+    "sand": "{c.sand}",
+    "danger": "{c.danger}",
+}
+
+
+# Qt stylesheet template. Tokens are ``{ns.field}`` references into the design
+# tokens: ``c`` (Colors), ``s`` (Spacing), ``r`` (Radius) and ``t`` (Typography).
+# Literal braces are doubled, as in str.format().
+_QSS_TEMPLATE = '''
 /* ==========================================================================
    VOID UI -- Qt Stylesheet
    Generated from @void-ui design tokens
@@ -68,10 +81,17 @@ class Theme:
 QWidget {{
     font-family: {t.font_family};
     font-size: {t.size_base}px;
-    color: {c.white};
     background: transparent;
 }}
 
+/* Text color per class rather than on QWidget: the universal rule is the
+   same in both modes, so switching modes leaves plain containers alone. */
+QAbstractButton, QAbstractSpinBox, QComboBox, QLineEdit, QTextEdit,
+QPlainTextEdit, QAbstractItemView, QHeaderView, QGroupBox, QTabBar,
+QMenu, QMenuBar, QStatusBar, QToolTip, QProgressBar, QDockWidget {{
+    color: {c.white};
+}}
+
 QMainWindow, QDialog {{
     background: {c.void};
 }}
@@ -449,20 +469,887 @@ QStatusBar {{
     color: {c.gray};
     border-top: 1px solid {c.border_light};
 }}
+
+/* -- VoidCard -- */
+VoidCard {{
+    background: {c.surface};
+    border: 1px solid {c.border};
+    border-radius: {r.xl}px;
+    padding: {s.lg}px;
+}}
+
+VoidCard[variant="elevated"] {{
+    background: {c.raised};
+    border: none;
+}}
+
+/* -- VoidBadge -- */
+VoidBadge {{
+    border: 1px solid transparent;
+    border-radius: {r.sm}px;
+    padding: 3px 8px;
+    font-size: 11px;
+    font-weight: 500;
+}}
+'''
+
+
+def _variant_selector(widget: str, variant: str, default: str, sub: str = "") -> str:
+    """Selector of one variant; the default variant styles the bare class."""
+    if variant == default:
+        return f"{widget}{sub}"
+    return f'{widget}[variant="{variant}"]{sub}'
+
+
+# Variant rules are generated from the tables above; their values are
+# template tokens themselves, so the braces around them are doubled twice.
+_QSS_TEMPLATE += "".join(
+    f'''
+{_variant_selector("VoidBadge", variant, "default")} {{{{
+    background: {bg};
+    color: {fg};
+}}}}
+'''
+    for variant, (bg, fg) in BADGE_VARIANTS.items()
+)
+
+_QSS_TEMPLATE += '''
+/* -- VoidProgress -- */
+VoidProgress {{
+    background: {c.elevated};
+    border: none;
+    border-radius: {r.sm}px;
+}}
+
+VoidProgress::chunk {{
+    border-radius: {r.sm}px;
+}}
+'''
+
+_QSS_TEMPLATE += "".join(
+    f'''
+{_variant_selector("VoidProgress", variant, "peach", "::chunk")} {{{{
+    background: {color};
+}}}}
 '''
+    for variant, color in PROGRESS_COLORS.items()
+)
+
+_QSS_TEMPLATE += '''
+/* -- VoidTable -- */
+VoidTable {{
+    gridline-color: {c.border};
+    selection-background-color: {c.accent_bg};
+    selection-color: {c.accent};
+}}
+
+VoidTable::item {{
+    padding: 0 {s.md}px;
+    border: none;
+}}
+
+VoidTable::item:hover {{
+    background: {c.raised};
+}}
+
+VoidTable::item:selected {{
+    background: {c.accent_bg};
+    color: {c.accent};
+}}
+'''
+
+_TOKEN_TYPES = {"c": Colors, "s": Spacing, "r": Radius, "t": Typography}
+
+# A compiled slot is either a literal string or a (namespace, field) token.
+_Slot = str | tuple[str, str]
+
+
+def _compile_template(template: str) -> tuple[_Slot, ...]:
+    """Parse a QSS template once into a flat tuple of literal/token slots.
+
+    Adjacent literals are merged, and every token is validated against the
+    token dataclasses so a typo fails at import instead of at render time.
+    """
+    slots: list[_Slot] = []
+    for literal, field, spec, conversion in Formatter().parse(template):
+        if literal:
+            if slots and isinstance(slots[-1], str):
+                slots[-1] += literal
+            else:
+                slots.append(literal)
+        if field is None:
+            continue
+        if spec or conversion:
+            raise ValueError(f"Unsupported QSS template token: {{{field}}}")
+        ns, _, name = field.partition(".")
+        token_type = _TOKEN_TYPES.get(ns)
+        if token_type is None or name not in token_type.__dataclass_fields__:
+            raise ValueError(f"Unknown QSS template token: {{{field}}}")
+        slots.append((ns, name))
+    return tuple(slots)
+
+
+def _render_template(
+    slots: tuple[_Slot, ...],
+    colors: Colors,
+    spacing: Spacing,
+    radius: Radius,
+    typography: Typography,
+) -> str:
+    ns = {"c": colors, "s": spacing, "r": radius, "t": typography}
+    return "".join(
+        slot if isinstance(slot, str) else str(getattr(ns[slot[0]], slot[1]))
+        for slot in slots
+    )
+
+
+_COMPILED_QSS = _compile_template(_QSS_TEMPLATE)
+
+
+def _render_token(value: str, colors: Colors) -> str:
+    return _render_template(_compile_template(value), colors, SPACING, RADIUS, TYPOGRAPHY)
+
+
+@lru_cache(maxsize=8)
+def badge_colors(colors: Colors = DarkColors) -> dict[str, tuple[str, str]]:
+    """Resolve BADGE_VARIANTS to (background, foreground) colors."""
+    return {
+        variant: (_render_token(bg, colors), _render_token(fg, colors))
+        for variant, (bg, fg) in BADGE_VARIANTS.items()
+    }
+
+
+@lru_cache(maxsize=8)
+def progress_colors(colors: Colors = DarkColors) -> dict[str, str]:
+    """Resolve PROGRESS_COLORS to chunk colors."""
+    return {variant: _render_token(color, colors) for variant, color in PROGRESS_COLORS.items()}
+
+
+class QssCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+_QSS_CACHE_MAXSIZE = 32
+_qss_cache: dict[tuple, str] = {}
+_qss_cache_hits = 0
+_qss_cache_misses = 0
+# Sheets are also rendered by the pre-warming thread, see void_ui.prewarm.
+_qss_cache_lock = threading.RLock()
+# The typography sheets are rendered with: TYPOGRAPHY, or a copy with the
+# stacks resolved to installed families, see void_ui.fonts.
+_typography: Typography = TYPOGRAPHY
+
+
+def _cached_qss(
+    mode: ThemeMode,
+    colors: Colors,
+    spacing: Spacing,
+    radius: Radius,
+    typography: Typography,
+) -> str:
+    global _qss_cache_hits, _qss_cache_misses
+
+    key = (mode, colors, spacing, radius, typography)
+    with _qss_cache_lock:
+        qss = _qss_cache.get(key)
+        if qss is not None:
+            _qss_cache_hits += 1
+            return qss
+
+        _qss_cache_misses += 1
+        builtin = (
+            colors is _mode_colors(mode)
+            and spacing is SPACING
+            and radius is RADIUS
+            and (typography is TYPOGRAPHY or typography is _typography)
+        )
+        qss = _cache.load(disk_cache_key(), mode.value) if builtin else None
+        if qss is None:
+            qss = _render_template(
+                _COMPILED_QSS, colors, spacing, radius, TYPOGRAPHY if builtin else typography
+            )
+            if builtin:
+                _cache.store(disk_cache_key(), mode.value, qss)
+        if builtin and typography is not TYPOGRAPHY:
+            # The cached sheets name the stacks as written.
+            qss = _with_fonts(qss, typography)
+        return _store_qss(key, qss)
+
+
+def _with_fonts(qss: str, typography: Typography) -> str:
+    """``qss`` of the built-in tokens with the font stacks of ``typography``."""
+    from void_ui.fonts import STACK_FIELDS
+
+    for name in STACK_FIELDS:
+        qss = qss.replace(
+            f"font-family: {getattr(TYPOGRAPHY, name)};",
+            f"font-family: {getattr(typography, name)};",
+        )
+    return qss
+
+
+def _cached_lean_qss(
+    mode: ThemeMode,
+    colors: Colors,
+    available: frozenset[str],
+    universal: tuple[str, ...],
+) -> str:
+    """The pruned, minified sheet for widgets of the ``available`` classes."""
+    global _qss_cache_hits, _qss_cache_misses
+
+    key = (mode, colors, SPACING, RADIUS, _typography, available, universal)
+    with _qss_cache_lock:
+        qss = _qss_cache.get(key)
+        if qss is not None:
+            _qss_cache_hits += 1
+            return qss
+
+        full = _cached_qss(mode, colors, SPACING, RADIUS, _typography)
+        _qss_cache_misses += 1
+        return _store_qss(
+            key, _qss.minify_qss(_qss.prune_qss(full, set(available), universal))
+        )
+
+
+def _resolve_fonts() -> None:
+    """Render with the stacks resolved against the font database, once there is one."""
+    global _typography
+
+    # No font database without PySide6.QtGui; keep theme importable without it.
+    if "PySide6.QtGui" not in sys.modules:
+        return
+    from void_ui.fonts import resolved_typography
+
+    typography = resolved_typography()
+    if typography is not _typography:
+        with _qss_cache_lock:
+            _typography = typography
+            _cached_switchable_qss.cache_clear()
+
+
+def _store_qss(key: tuple, qss: str) -> str:
+    qss = sys.intern(qss)
+    if len(_qss_cache) >= _QSS_CACHE_MAXSIZE:
+        del _qss_cache[next(iter(_qss_cache))]
+    _qss_cache[key] = qss
+    return qss
+
+
+def _scope_key(mode: ThemeMode, colors: Colors) -> str:
+    return f"{mode.value}-{_cache.digest(colors, SPACING, RADIUS, _typography)[:8]}"
+
+
+def _cached_scoped_qss(mode: ThemeMode, colors: Colors) -> str:
+    key = _scope_key(mode, colors)
+    with _qss_cache_lock:
+        qss = _scoped_qss_cache.get(key)
+        if qss is None:
+            full = _cached_qss(mode, colors, SPACING, RADIUS, _typography)
+            qss = sys.intern(_qss.scope_qss(full, SCOPE_PROPERTY, key))
+            if len(_scoped_qss_cache) >= _QSS_CACHE_MAXSIZE:
+                del _scoped_qss_cache[next(iter(_scoped_qss_cache))]
+            _scoped_qss_cache[key] = qss
+        return qss
+
+
+@lru_cache(maxsize=8)
+def _cached_switchable_qss(base: ThemeMode, base_colors: Colors, other_colors: Colors) -> str:
+    other = ThemeMode.LIGHT if base == ThemeMode.DARK else ThemeMode.DARK
+    return sys.intern(
+        _cached_qss(base, base_colors, SPACING, RADIUS, _typography)
+        + "\n"
+        + _qss.scope_qss(
+            _cached_qss(other, other_colors, SPACING, RADIUS, _typography),
+            MODE_PROPERTY,
+            other.value,
+        )
+    )
+
+
+@lru_cache(maxsize=8)
+def _cached_diff(old: str, new: str) -> tuple[_qss.QssRule, ...]:
+    return tuple(_qss.diff_rules(old, new))
+
+
+@cache
+def disk_cache_key() -> str:
+    """Key of the on-disk sheets for the built-in tokens.
+
+    Covers the package version, the QSS template and every token set, so
+    editing any of them invalidates previously cached sheets.
+    """
+    from void_ui import __version__
+
+    return _cache.digest(
+        __version__, _QSS_TEMPLATE, DarkColors, LightColors, SPACING, RADIUS, TYPOGRAPHY
+    )
+
+
+def qss_cache_info() -> QssCacheInfo:
+    """Report hit/miss statistics of the rendered stylesheet cache."""
+    return QssCacheInfo(_qss_cache_hits, _qss_cache_misses, _QSS_CACHE_MAXSIZE, len(_qss_cache))
+
+
+def clear_qss_cache() -> None:
+    """Drop all rendered stylesheets and reset the statistics.
+
+    Call this after changing custom tokens in place; token instances that
+    compare equal otherwise keep returning the previously rendered sheet.
+    """
+    global _qss_cache_hits, _qss_cache_misses
+
+    with _qss_cache_lock:
+        _qss_cache.clear()
+        _scoped_qss_cache.clear()
+        _qss_cache_hits = 0
+        _qss_cache_misses = 0
+    _cached_switchable_qss.cache_clear()
+    _cached_diff.cache_clear()
+
+
+class Theme:
+    """Void UI theme manager.
+
+    Usage:
+        theme = Theme()  # Dark by default
+        theme.apply(app)
+
+        # Or light mode
+        theme = Theme(ThemeMode.LIGHT)
+        theme.apply(app)
+    """
+
+    def __init__(
+        self,
+        mode: ThemeMode = ThemeMode.DARK,
+        colors: Colors | None = None,
+        native: bool = False,
+    ) -> None:
+        self.mode = mode
+        # Render with void_ui.style.VoidStyle and a palette instead of QSS.
+        self.native = native
+        # Custom schemes per mode, e.g. from void_ui.palette.derive_colors().
+        self._custom: dict[ThemeMode, Colors] = {mode: colors} if colors is not None else {}
+        self._colors = self._colors_for(mode)
+        # Mode whose rules are unscoped in the installed switchable sheet.
+        self._switch_base: ThemeMode | None = None
+        # Classes of the installed lean sheet, see apply(lean=True).
+        self._lean: tuple[frozenset[str], tuple[str, ...]] | None = None
+        # Whether the installed sheet is scoped, see apply(scoped=True).
+        self._scoped = False
+        self._prewarmed = False
+
+    @property
+    def colors(self) -> Colors:
+        return self._colors
+
+    def set_colors(self, colors: Colors, mode: ThemeMode | None = None) -> None:
+        """Use a custom scheme for ``mode`` (the current mode by default)."""
+        mode = mode or self.mode
+        self._custom[mode] = colors
+        if mode == self.mode:
+            self._colors = colors
+
+    def _colors_for(self, mode: ThemeMode) -> Colors:
+        return self._custom.get(mode) or _mode_colors(mode)
+
+    def toggle(self) -> None:
+        """Toggle between dark and light mode."""
+        self.mode = ThemeMode.LIGHT if self.mode == ThemeMode.DARK else ThemeMode.DARK
+        self._colors = self._colors_for(self.mode)
+
+    def generate_qss(self) -> str:
+        """Generate complete Qt stylesheet.
+
+        The template is compiled once at import and the rendered sheet is
+        memoized per mode and token set, so repeated calls (e.g. every
+        ``toggle()`` + ``apply()``) return the same interned string.
+
+        Once a QGuiApplication exists, the font stacks are resolved to the
+        installed families (see :mod:`void_ui.fonts`).
+        """
+        _resolve_fonts()
+        return _cached_qss(self.mode, self._colors, SPACING, RADIUS, _typography)
+
+    def generate_switchable_qss(self, base: ThemeMode | None = None) -> str:
+        """Generate a stylesheet holding both modes.
+
+        Rules of ``base`` (the current mode by default) are emitted as-is;
+        the other mode follows, scoped to widgets under a root whose
+        ``voidMode`` property names it. Switching modes then only needs a
+        property change and a repolish of the affected widgets.
+        """
+        base = base or self.mode
+        other = ThemeMode.LIGHT if base == ThemeMode.DARK else ThemeMode.DARK
+        return _cached_switchable_qss(base, self._colors_for(base), self._colors_for(other))
+
+    def diff(self, mode: ThemeMode) -> list[_qss.QssRule]:
+        """Return the rules that change when switching to ``mode``."""
+        return list(_cached_diff(
+            self.generate_qss(),
+            _cached_qss(mode, self._colors_for(mode), SPACING, RADIUS, _typography),
+        ))
+
+    def generate_lean_qss(
+        self, source: QWidget | QApplication | Iterable[type | str]
+    ) -> str:
+        """Generate a minified sheet with only the rules that can apply.
+
+        ``source`` is a widget tree to scan (a widget and its descendants,
+        or every widget of a QApplication) or the widget classes to style,
+        as types or Qt class names. The universal ``QWidget`` rule is
+        retargeted at the classes found, so plain containers and other
+        widgets are not styled through the sheet at all.
+        """
+        available, universal = _lean_classes(source)
+        return _cached_lean_qss(self.mode, self._colors, available, universal)
+
+    def scope_key(self) -> str:
+        """Identifies the scoped sheet of the current mode and tokens."""
+        return _scope_key(self.mode, self._colors)
+
+    def generate_scoped_qss(self) -> str:
+        """The sheet of :meth:`generate_qss` limited to subtrees whose root
+        carries ``voidScope`` = :meth:`scope_key`."""
+        return _cached_scoped_qss(self.mode, self._colors)
+
+    def apply(
+        self,
+        widget: QWidget | QApplication | list[QWidget],
+        switchable: bool = False,
+        scoped: bool = False,
+        lean: bool = False,
+        classes: Iterable[type | str] | None = None,
+    ) -> None:
+        """Apply theme to a widget or application.
+
+        With ``switchable=True`` the sheet of :meth:`generate_switchable_qss`
+        is installed, so later :meth:`switch` calls avoid a full restyle.
+
+        With ``scoped=True`` ``widget`` is a root panel embedded in a host
+        application, or a list of them: the application's sheet and the
+        host's widgets are left alone and each panel is styled by
+        :meth:`generate_scoped_qss`, appended to the panel's own stylesheet.
+        Panels given together share one copy on their parent when it has no
+        stylesheet of its own, and panels inside a panel themed alike use
+        its sheet. Re-applying replaces the scoped sheet.
+
+        With ``lean=True`` the sheet of :meth:`generate_lean_qss` is
+        installed, for the classes in ``widget``'s tree or the given
+        ``classes``. Widgets of other classes created later are not styled;
+        apply again, or list their classes up front.
+
+        A theme created with ``native=True`` installs the palette and
+        :class:`void_ui.style.VoidStyle` instead of a stylesheet; the sheet
+        options do not apply to it.
+
+        The sheets name the font families of the ``TYPOGRAPHY`` stacks that
+        are installed (see :mod:`void_ui.fonts`).
+
+        The first call starts rendering the other mode's sheets and colors
+        on a worker thread (see :mod:`void_ui.prewarm`), so the first
+        toggle or :meth:`switch` does not stall on them.
+        """
+        _resolve_fonts()
+        self._install(widget, switchable, scoped, lean, classes)
+        if not self._prewarmed:
+            from void_ui.prewarm import prewarm
+
+            self._prewarmed = True
+            prewarm(self)
+
+    def _install(
+        self,
+        widget: QWidget | QApplication | list[QWidget],
+        switchable: bool,
+        scoped: bool,
+        lean: bool,
+        classes: Iterable[type | str] | None,
+    ) -> None:
+        from void_ui.widgets import _set_active_colors
+
+        _set_active_colors(self._colors)
+        if self.native:
+            from void_ui.style import apply_native
+
+            self._switch_base = self._lean = None
+            self._scoped = False
+            apply_native(widget, self._colors)
+            return
+        self._scoped = scoped and not lean
+        if not scoped:
+            from void_ui.style import restore_style
+
+            restore_style(widget)
+        if lean:
+            self._switch_base = None
+            self._lean = _lean_classes(widget if classes is None else classes)
+            _set_sheet(widget, _cached_lean_qss(self.mode, self._colors, *self._lean))
+            return
+        self._lean = None
+        if scoped:
+            roots = list(widget) if isinstance(widget, (list, tuple)) else [widget]
+            _apply_scoped(roots, self.scope_key(), self.generate_scoped_qss())
+            return
+        if not switchable:
+            self._switch_base = None
+            _set_sheet(widget, self.generate_qss())
+            return
+
+        self._switch_base = self.mode
+        _set_sheet(widget, self.generate_switchable_qss())
+        for root in _switch_roots(widget):
+            root.setProperty(MODE_PROPERTY, self.mode.value)
+
+    def switch(self, widget: QWidget | QApplication, mode: ThemeMode | None = None) -> int:
+        """Switch to ``mode`` (the other mode by default), restyling incrementally.
+
+        Only widgets selected by rules whose tokens differ between the two
+        modes are repolished; with the built-in tokens that leaves plain
+        containers alone. The first call on a widget that was not applied
+        with ``switchable=True`` installs the switchable sheet, even when
+        ``mode`` is the current mode, which is a full restyle; so is a
+        switch between custom schemes that differ in a rule selecting every
+        widget. After ``apply(lean=True)`` the lean sheet of the new mode is
+        installed, for the same classes.
+
+        Parentless windows created after the switchable sheet is installed
+        should be passed to :meth:`tag_window`.
+
+        Returns the number of widgets restyled.
+        """
+        from PySide6.QtWidgets import QWidget
+
+        if mode is None:
+            mode = ThemeMode.LIGHT if self.mode == ThemeMode.DARK else ThemeMode.DARK
+        installed = self.native or self._lean is not None or self._switch_base is not None
+        if mode == self.mode and installed:
+            return 0
+
+        widgets = _widgets_of(widget)
+
+        # Native and lean themes reinstall everything; only diff a full sheet.
+        diffed = not self.native and self._lean is None
+        targets = _qss.rule_targets(self.diff(mode)) if diffed else set()
+        self.mode = mode
+        self._colors = self._colors_for(mode)
+
+        if self.native:
+            self._install(widget, False, False, False, None)
+            return len(widgets)
+
+        if self._lean is not None:
+            from void_ui.widgets import _set_active_colors
+
+            _set_active_colors(self._colors)
+            _set_sheet(widget, _cached_lean_qss(mode, self._colors, *self._lean))
+            return len(widgets)
+
+        if self._switch_base is None or any(target.universal for target in targets):
+            # Qt restyles the whole tree either way.
+            self.apply(widget, switchable=True)
+            return len(widgets)
+
+        from void_ui.widgets import _set_active_colors
+
+        _set_active_colors(self._colors)
+        for root in _switch_roots(widget):
+            root.setProperty(MODE_PROPERTY, mode.value)
+
+        touched = 0
+        for w in widgets:
+            if any(_matches(w, target) for target in targets):
+                style = w.style()
+                style.unpolish(w)
+                style.polish(w)
+                # Item views overload update() with update(QModelIndex).
+                QWidget.update(w)
+                touched += 1
+        return touched
+
+    def _reinstall(
+        self,
+        widget: QWidget | QApplication | list[QWidget],
+        installed: dict[ThemeMode, Colors],
+    ) -> int:
+        """Re-install the theme on ``widget`` as it was applied, after the
+        schemes it was installed with (``installed``) changed.
+
+        Qt restyles every widget under a sheet whose text changes, so the
+        sheet is only replaced when one of its rules changed. Changes to
+        the other mode of a switchable sheet are installed by the next
+        :meth:`switch`. Returns the number of widgets restyled.
+        """
+        from void_ui.widgets import _set_active_colors
+
+        _set_active_colors(self._colors)
+        mode = self.mode
+        changed = installed[mode] != self._colors
+        if changed and not self.native:
+            old = _cached_qss(mode, installed[mode], SPACING, RADIUS, _typography)
+            changed = bool(_cached_diff(old, self.generate_qss()))
+        switchable = self._switch_base is not None
+        if not changed:
+            other = ThemeMode.LIGHT if mode == ThemeMode.DARK else ThemeMode.DARK
+            if switchable and installed[other] != self._colors_for(other):
+                self._switch_base = None
+            return 0
+
+        if self._lean is not None:
+            _set_sheet(widget, _cached_lean_qss(mode, self._colors, *self._lean))
+        else:
+            self._install(widget, switchable, self._scoped, False, None)
+        return len(_widgets_of(widget))
+
+    def restyle(self, cls: type | None = None, variant: str | None = None) -> int:
+        """Repolish live Void widgets of one class and/or variant.
+
+        Only the widgets tracked by ``void_ui.widgets`` are visited, not
+        the whole application. Returns the number of widgets restyled.
+        """
+        from void_ui.widgets import _repolish, batch_polish, live_widgets
+
+        widgets = live_widgets(cls, variant)
+        with batch_polish():
+            for widget in widgets:
+                _repolish(widget)
+        return len(widgets)
+
+    def tag_window(self, window: QWidget) -> None:
+        """Mark a parentless window with the active mode of a switchable sheet."""
+        window.setProperty(MODE_PROPERTY, self.mode.value)
+
+
+def _set_sheet(widget: QWidget | QApplication, sheet: str) -> None:
+    from PySide6.QtCore import Qt
+    from PySide6.QtWidgets import QWidget
+
+    if (
+        isinstance(widget, QWidget)
+        and not widget.testAttribute(Qt.WA_WState_Polished)
+        and widget.styleSheet()
+    ):
+        # Qt keeps serving the old rules to a widget whose sheet is replaced
+        # before it was first polished; dropping the sheet resets them.
+        widget.setStyleSheet("")
+    widget.setStyleSheet(sheet)
+
+
+# Scoped sheets per scope key.
+_scoped_qss_cache: dict[str, str] = {}
+# Dynamic property of a widget holding a scoped sheet: (its own stylesheet,
+# scope key of the sheet installed after it, the stylesheet installed). It
+# dies with the widget, and a stylesheet set since by the host no longer
+# matches the installed one, so that becomes the widget's own.
+_SCOPE_SHEET_PROPERTY = "_voidScopeSheet"
+
+
+def _scope_sheet(widget: QWidget) -> tuple[str, str | None]:
+    """``widget``'s own stylesheet and the key of the scoped sheet after it."""
+    sheet = widget.styleSheet()
+    entry = widget.property(_SCOPE_SHEET_PROPERTY)
+    if entry is None or entry[2] != sheet:
+        return sheet, None
+    return entry[0], entry[1]
+
+
+def _set_scope_sheet(widget: QWidget, key: str | None, sheet: str = "") -> None:
+    """Install the scoped ``sheet`` of ``key`` after ``widget``'s own stylesheet,
+    replacing any scoped sheet installed before; ``key=None`` removes it."""
+    base, installed_key = _scope_sheet(widget)
+    if key == installed_key:
+        return
+    if key is None:
+        widget.setProperty(_SCOPE_SHEET_PROPERTY, None)
+        widget.setStyleSheet(base)
+        return
+    installed = f"{base}\n{sheet}" if base else sheet
+    widget.setProperty(_SCOPE_SHEET_PROPERTY, (base, key, installed))
+    widget.setStyleSheet(installed)
+
+
+def _shares_scope(parent: QWidget, key: str, roots: list[QWidget]) -> bool:
+    """Whether ``roots``, children of ``parent``, can share one scoped sheet
+    installed on it: ``parent`` has no stylesheet of its own, and no other
+    child relies on a sheet of another key there."""
+    from PySide6.QtCore import Qt
+    from PySide6.QtWidgets import QWidget
+
+    base, installed_key = _scope_sheet(parent)
+    if base:
+        return False
+    if installed_key is None or installed_key == key:
+        return True
+    return not any(
+        child.property(SCOPE_PROPERTY) == installed_key and _scope_sheet(child)[1] is None
+        for child in parent.findChildren(QWidget, options=Qt.FindDirectChildrenOnly)
+        if child not in roots
+    )
+
+
+def _apply_scoped(roots: list[QWidget], key: str, sheet: str) -> None:
+    from void_ui.widgets import _repolish
+
+    roots = list(dict.fromkeys(roots))
+    previous = {root: root.property(SCOPE_PROPERTY) for root in roots}
+    for root in roots:
+        root.setProperty(SCOPE_PROPERTY, key)
+
+    siblings: dict[QWidget | None, list[QWidget]] = {}
+    for root in roots:
+        ancestor = root.parentWidget()
+        while ancestor is not None and ancestor.property(SCOPE_PROPERTY) != key:
+            ancestor = ancestor.parentWidget()
+        if ancestor is None:
+            siblings.setdefault(root.parentWidget(), []).append(root)
+        elif _scope_sheet(root)[1] is not None:
+            # Inside a root themed alike, whose sheet styles it already.
+            _set_scope_sheet(root, None)
+        elif previous[root] != key:
+            # Its descendants match the scoped rules through the ancestor;
+            # only the root's own property selectors need re-resolving.
+            _repolish(root)
+
+    # Sheets go on the themed roots, or once on a parent of several that
+    # has no stylesheet of its own, so Qt parses one copy for all of them.
+    for parent, group in siblings.items():
+        if parent is not None and len(group) > 1 and _shares_scope(parent, key, group):
+            _set_scope_sheet(parent, key, sheet)
+            for root in group:
+                _set_scope_sheet(root, None)
+        else:
+            for root in group:
+                _set_scope_sheet(root, key, sheet)
+
+
+# Widgets that create children of other classes on demand, e.g. popups.
+_IMPLICIT_CLASSES = {
+    "QComboBox": ("QListView",),
+    "QAbstractScrollArea": ("QScrollBar",),
+    "QTabWidget": ("QTabBar",),
+    "QLineEdit": ("QMenu",),
+    "QTextEdit": ("QMenu",),
+    "QPlainTextEdit": ("QMenu",),
+    "QAbstractSpinBox": ("QMenu", "QLineEdit"),
+}
+# Plain QWidgets the universal rule must still reach: scroll area
+# viewports and the widget a QScrollArea scrolls fill their background.
+_IMPLICIT_TARGETS = {
+    "QAbstractScrollArea": (
+        "QWidget#qt_scrollarea_viewport",
+        "QWidget#qt_scrollarea_viewport > QWidget",
+    ),
+}
+
+
+def _meta_chain(meta) -> tuple[str, ...]:
+    names = []
+    while meta is not None and meta.className() != "QObject":
+        names.append(meta.className())
+        meta = meta.superClass()
+    return tuple(names)
+
+
+def _class_chain(cls: type | str) -> tuple[str, ...]:
+    """The Qt class name of ``cls`` and its base classes, most derived first."""
+    from PySide6 import QtWidgets
+
+    if isinstance(cls, str):
+        qt_class = getattr(QtWidgets, cls, None)
+        if qt_class is None:
+            return (cls,)
+        cls = qt_class
+    return _meta_chain(cls.staticMetaObject)
+
+
+def _lean_classes(
+    source: QWidget | QApplication | Iterable[type | str],
+) -> tuple[frozenset[str], tuple[str, ...]]:
+    """Class names a lean sheet must cover, and the ones the universal rule targets."""
+    from PySide6.QtWidgets import QApplication, QWidget
+
+    if isinstance(source, QApplication):
+        chains = {_meta_chain(w.metaObject()) for w in QApplication.allWidgets()}
+    elif isinstance(source, QWidget):
+        chains = {_meta_chain(w.metaObject()) for w in [source, *source.findChildren(QWidget)]}
+    else:
+        chains = {_class_chain(cls) for cls in source}
+
+    targets = {"QToolTip"}
+    for chain in list(chains):
+        for name in chain:
+            chains.update(_class_chain(implied) for implied in _IMPLICIT_CLASSES.get(name, ()))
+            targets.update(_IMPLICIT_TARGETS.get(name, ()))
+    chains.discard(())
+
+    available = {name for chain in chains for name in chain} | {"QToolTip"}
+    leaves = {chain[0] for chain in chains if chain[0] != "QWidget"}
+    # A type selector matches subclasses too; keep only the most general.
+    universal = {
+        chain[0]
+        for chain in chains
+        if chain[0] in leaves and not leaves.intersection(chain[1:])
+    }
+    return frozenset(available), tuple(sorted(universal | targets))
+
+
+def _mode_colors(mode: ThemeMode) -> Colors:
+    return DarkColors if mode == ThemeMode.DARK else LightColors
+
+
+def _widgets_of(widget: QWidget | QApplication | list[QWidget]) -> list[QWidget]:
+    """Every widget of an application, or of the trees of the given roots."""
+    from PySide6.QtWidgets import QApplication, QWidget
+
+    if isinstance(widget, QApplication):
+        return QApplication.allWidgets()
+    roots = list(widget) if isinstance(widget, (list, tuple)) else [widget]
+    widgets: dict[int, QWidget] = {}
+    for root in roots:
+        for w in (root, *root.findChildren(QWidget)):
+            widgets[id(w)] = w
+    return list(widgets.values())
+
+
+def _switch_roots(widget: QWidget | QApplication) -> list[QWidget]:
+    from PySide6.QtWidgets import QApplication
+
+    if isinstance(widget, QApplication):
+        return [w for w in QApplication.topLevelWidgets() if w.parentWidget() is None]
+    return [widget]
+
+
+def _matches(widget: QWidget, target: _qss.SelectorTarget) -> bool:
+    return _matches_type(widget, target) and _matches_attributes(widget, target.attributes)
+
+
+def _matches_type(widget: QWidget, target: _qss.SelectorTarget) -> bool:
+    return target.type_name == "*" or widget.inherits(target.type_name)
+
 
-    def apply(self, widget: QWidget | QApplication) -> None:
-        """Apply theme to a widget or application."""
-        widget.setStyleSheet(self.generate_qss())
+def _matches_attributes(widget: QWidget, attributes: tuple[tuple[str, str], ...]) -> bool:
+    for name, value in attributes:
+        prop = widget.property(name)
+        if prop is None or str(prop) != value:
+            return False
+    return True
 
 
-def apply_theme(widget: QWidget | QApplication, mode: ThemeMode = ThemeMode.DARK) -> Theme:
+def apply_theme(
+    widget: QWidget | QApplication,
+    mode: ThemeMode = ThemeMode.DARK,
+    native: bool = False,
+) -> Theme:
     """Convenience function to apply theme.
 
     Usage:
         from void_ui import apply_theme
         apply_theme(app)
+        apply_theme(app, native=True)  # palette + VoidStyle, no stylesheet
     """
-    theme = Theme(mode)
+    theme = Theme(mode, native=native)
     theme.apply(widget)
     return theme
@@ -0,0 +1,406 @@
+"""Void UI toast notifications.
+
+``ToastManager`` shows ``VoidToast`` notifications stacked in the
+bottom-right corner of a host window. Toast widgets are pooled and reused,
+and every fade and slide is driven by the shared frame clock, which only
+runs while something animates; expiry and rate-limit wakeups share a
+single timer. Bursts are rate-limited and duplicate messages collapse into
+one toast with a count.
+
+Usage:
+    toasts = ToastManager(window)
+    toasts.show("Published 24 shots", variant="success")
+    toasts.show("Farm unreachable", variant="danger", duration=0)  # sticky
+"""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import NamedTuple
+
+try:
+    from PySide6.QtCore import QEvent, QObject, QRect, QRectF, QSize, Qt, QTimer, Signal
+    from PySide6.QtGui import QFontMetrics, QPainter, QPen
+    from PySide6.QtWidgets import QWidget
+    HAS_PYSIDE = True
+except ImportError:
+    HAS_PYSIDE = False
+    QWidget = object
+    QObject = object
+
+from void_ui.animation import ease_out_cubic as _ease_out
+from void_ui.animation import reduced_motion
+from void_ui.clock import frame_clock
+from void_ui.colors import RADIUS, SPACING, Colors, VoidColor
+from void_ui.widgets import _track, active_colors
+
+# Toast variant -> border color token, as in the CSS package (at 40% alpha).
+TOAST_BORDERS = {
+    "default": "border",
+    "success": "moss",
+    "danger": "danger",
+    "warning": "sand",
+}
+
+MIN_WIDTH = 240
+MAX_WIDTH = 360
+CLOSE_SIZE = 24
+
+# Animation timings in seconds.
+ENTER_DURATION = 0.3
+LEAVE_DURATION = 0.2
+MOVE_DURATION = 0.2
+SLIDE_DISTANCE = 8
+
+
+def _progress(now: float, since: float, duration: float) -> float:
+    if reduced_motion():
+        return 1.0
+    return min(1.0, (now - since) / duration)
+
+
+@lru_cache(maxsize=16)
+def _border_color(colors: Colors, variant: str) -> VoidColor:
+    token = TOAST_BORDERS.get(variant, "border")
+    color = colors.color(token)
+    if token == "border":
+        return color
+    return VoidColor.from_rgba(color.red, color.green, color.blue, round(0.4 * 255))
+
+
+class VoidToast(QWidget):
+    """A single painted toast: message, optional count and a dismiss button.
+
+    Toasts are normally created and recycled by :class:`ToastManager`.
+    """
+
+    if HAS_PYSIDE:
+        dismissed = Signal()
+
+    def __init__(self, parent: QWidget | None = None) -> None:
+        if not HAS_PYSIDE:
+            raise ImportError("PySide6 is required: pip install void-ui[pyside]")
+
+        super().__init__(parent)
+        _track(self)
+        self._painted = True
+        self._message = ""
+        self._variant = "default"
+        self._count = 1
+        self._text_rect = QRect()
+        self.opacity = 1.0
+        self.setAttribute(Qt.WA_NoSystemBackground)
+        self.setCursor(Qt.ArrowCursor)
+        self.setAccessibleName("Notification")
+
+        # Animation state, owned by the manager.
+        self.expires_at: float | None = None
+        self.leaving_since: float | None = None
+        self.entered_at = 0.0
+        self.move_from = 0.0
+        self.move_to = 0.0
+        self.move_start = 0.0
+
+    @property
+    def message(self) -> str:
+        return self._message
+
+    @property
+    def variant(self) -> str:
+        return self._variant
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    def set_content(self, message: str, variant: str = "default", count: int = 1) -> None:
+        self._message = message
+        self._variant = variant
+        self._count = count
+        self.setAccessibleDescription(message)
+        self.resize(self._layout())
+        self.update()
+
+    def _display_text(self) -> str:
+        return self._message if self._count == 1 else f"{self._message}  ×{self._count}"
+
+    def _layout(self) -> QSize:
+        pad = SPACING.md
+        gap = 12
+        metrics = QFontMetrics(self.font())
+        chrome = 2 * pad + gap + CLOSE_SIZE
+        text = self._display_text()
+        natural = metrics.horizontalAdvance(text)
+        width = min(max(natural + chrome, MIN_WIDTH), MAX_WIDTH)
+        bounds = metrics.boundingRect(QRect(0, 0, width - chrome, 10_000), Qt.TextWordWrap, text)
+        height = max(bounds.height(), CLOSE_SIZE) + 2 * pad
+        self._text_rect = QRect(pad, pad, width - chrome, height - 2 * pad)
+        return QSize(width, height)
+
+    def _close_rect(self) -> QRect:
+        return QRect(
+            self.width() - SPACING.md - CLOSE_SIZE,
+            (self.height() - CLOSE_SIZE) // 2,
+            CLOSE_SIZE,
+            CLOSE_SIZE,
+        )
+
+    def paintEvent(self, event) -> None:
+        if self.opacity <= 0:
+            return
+        colors = active_colors()
+        painter = QPainter(self)
+        painter.setOpacity(self.opacity)
+        painter.setRenderHint(QPainter.Antialiasing)
+
+        rect = QRectF(self.rect()).adjusted(0.5, 0.5, -0.5, -0.5)
+        painter.setPen(QPen(_border_color(colors, self._variant).qcolor(), 1))
+        painter.setBrush(colors.qbrush("surface"))
+        painter.drawRoundedRect(rect, RADIUS.lg, RADIUS.lg)
+
+        painter.setPen(colors.qcolor("white"))
+        painter.drawText(self._text_rect, Qt.AlignVCenter | Qt.TextWordWrap, self._display_text())
+        painter.setPen(colors.qcolor("muted"))
+        painter.drawText(self._close_rect(), Qt.AlignCenter, "x")
+        painter.end()
+
+    def mouseReleaseEvent(self, event) -> None:
+        if self._close_rect().contains(event.position().toPoint()):
+            self.dismissed.emit()
+        super().mouseReleaseEvent(event)
+
+
+class ToastStats(NamedTuple):
+    shown: int
+    collapsed: int
+    dropped: int
+    queued: int
+    visible: int
+    pooled: int
+
+
+class ToastManager(QObject):
+    """Shows toasts over ``host``, stacked bottom-right.
+
+    At most ``max_visible`` toasts are on screen and new toasts are shown
+    at up to ``rate`` per second (bursts of ``burst``). Excess messages
+    wait in a queue of ``max_queued``, dropping the oldest. A message
+    equal to a visible or queued one (same text and variant) increments
+    its count instead, and restarts a visible toast's duration.
+    """
+
+    def __init__(
+        self,
+        host: QWidget,
+        max_visible: int = 5,
+        rate: float = 4.0,
+        burst: int = 3,
+        max_queued: int = 50,
+        parent: QObject | None = None,
+    ) -> None:
+        if not HAS_PYSIDE:
+            raise ImportError("PySide6 is required: pip install void-ui[pyside]")
+
+        super().__init__(parent or host)
+        self._host = host
+        self.max_visible = max_visible
+        self.rate = rate
+        self.burst = burst
+        self.max_queued = max_queued
+
+        # Bottom-most first.
+        self._visible: list[VoidToast] = []
+        self._pool: list[VoidToast] = []
+        # (message, variant) -> [count, duration]
+        self._queue: OrderedDict[tuple[str, str], list] = OrderedDict()
+        self._tokens = float(burst)
+        self._refilled_at = time.perf_counter()
+        self._shown = self._collapsed = self._dropped = 0
+        self._frame_requested = False
+
+        self._wakeup = QTimer(self)
+        self._wakeup.setSingleShot(True)
+        self._wakeup.timeout.connect(self._on_wakeup)
+        host.installEventFilter(self)
+
+    # -- Public API --
+
+    def show(self, message: str, variant: str = "default", duration: float = 4.0) -> None:
+        """Show ``message``; ``duration`` in seconds, 0 keeps it until dismissed."""
+        key = (message, variant)
+        now = time.perf_counter()
+        for toast in self._visible:
+            if toast.leaving_since is None and (toast.message, toast.variant) == key:
+                toast.set_content(message, variant, toast.count + 1)
+                toast.expires_at = now + duration if duration > 0 else None
+                self._collapsed += 1
+                self._relayout(now)
+                self._schedule(now)
+                return
+
+        queued = self._queue.get(key)
+        if queued is not None:
+            queued[0] += 1
+            queued[1] = duration
+            self._collapsed += 1
+            return
+        if len(self._queue) >= self.max_queued:
+            self._queue.popitem(last=False)
+            self._dropped += 1
+        self._queue[key] = [1, duration]
+        self._drain(now)
+
+    def dismiss(self, toast: VoidToast) -> None:
+        """Fade ``toast`` out."""
+        if toast in self._visible and toast.leaving_since is None:
+            toast.leaving_since = time.perf_counter()
+            self._request_frame()
+
+    def clear(self) -> None:
+        """Dismiss every toast and drop queued messages."""
+        self._queue.clear()
+        for toast in list(self._visible):
+            self.dismiss(toast)
+
+    def stats(self) -> ToastStats:
+        return ToastStats(
+            self._shown,
+            self._collapsed,
+            self._dropped,
+            len(self._queue),
+            len(self._visible),
+            len(self._pool),
+        )
+
+    # -- Internals --
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.burst, self._tokens + (now - self._refilled_at) * self.rate)
+        self._refilled_at = now
+
+    def _drain(self, now: float) -> None:
+        self._refill(now)
+        active = sum(1 for toast in self._visible if toast.leaving_since is None)
+        while self._queue and self._tokens >= 1 and active < self.max_visible:
+            (message, variant), (count, duration) = self._queue.popitem(last=False)
+            self._tokens -= 1
+            self._present(message, variant, count, duration, now)
+            active += 1
+        self._schedule(now)
+
+    def _acquire(self) -> VoidToast:
+        while self._pool:
+            toast = self._pool.pop()
+            if toast.parentWidget() is self._host:
+                return toast
+        toast = VoidToast(self._host)
+        toast.dismissed.connect(lambda t=toast: self.dismiss(t))
+        return toast
+
+    def _present(self, message: str, variant: str, count: int, duration: float, now: float) -> None:
+        toast = self._acquire()
+        toast.set_content(message, variant, count)
+        toast.opacity = 0.0
+        toast.entered_at = now
+        toast.leaving_since = None
+        toast.expires_at = now + duration if duration > 0 else None
+        self._visible.insert(0, toast)
+        self._shown += 1
+        self._relayout(now, entering=toast)
+        toast.show()
+        toast.raise_()
+        self._request_frame()
+
+    def _release(self, toast: VoidToast) -> None:
+        toast.hide()
+        self._visible.remove(toast)
+        self._pool.append(toast)
+
+    def _targets(self) -> list[float]:
+        """Target y of each visible toast, bottom-most first."""
+        y = self._host.height() - SPACING.lg
+        targets = []
+        for toast in self._visible:
+            y -= toast.height()
+            targets.append(y)
+            y -= SPACING.sm
+        return targets
+
+    def _relayout(self, now: float, entering: VoidToast | None = None) -> None:
+        right = self._host.width() - SPACING.lg
+        for toast, target in zip(self._visible, self._targets()):
+            if toast is entering:
+                toast.move_from = toast.move_to = target
+            elif target != toast.move_to:
+                toast.move_from = toast.y()
+                toast.move_to = target
+                toast.move_start = now
+            toast.move(right - toast.width(), toast.y() if toast is not entering else target)
+        self._request_frame()
+
+    def _request_frame(self) -> None:
+        self._frame_requested = True
+        frame_clock().add(self._tick)
+
+    def _tick(self, now: float) -> bool:
+        self._frame_requested = False
+        animating = False
+        for toast in list(self._visible):
+            if toast.leaving_since is not None:
+                t = _progress(now, toast.leaving_since, LEAVE_DURATION)
+                if t >= 1:
+                    self._release(toast)
+                    self._relayout(now)
+                    animating = True
+                    continue
+                opacity, slide = 1 - t, 0.0
+                animating = True
+            else:
+                t = _progress(now, toast.entered_at, ENTER_DURATION)
+                opacity, slide = _ease_out(t), (1 - _ease_out(t)) * SLIDE_DISTANCE
+                animating |= t < 1
+
+            m = _progress(now, toast.move_start, MOVE_DURATION)
+            animating |= m < 1
+            y = toast.move_from + (toast.move_to - toast.move_from) * _ease_out(m)
+            toast.move(toast.x(), round(y + slide))
+            if opacity != toast.opacity:
+                toast.opacity = opacity
+                toast.update()
+
+        if not animating:
+            self._drain(now)
+        return animating or self._frame_requested
+
+    def _schedule(self, now: float) -> None:
+        """Arm the wakeup timer for the next expiry or rate-limit refill."""
+        wake = [
+            t.expires_at
+            for t in self._visible
+            if t.expires_at is not None and t.leaving_since is None
+        ]
+        if self._queue and self._tokens < 1:
+            wake.append(now + (1 - self._tokens) / self.rate)
+        if not wake:
+            self._wakeup.stop()
+            return
+        self._wakeup.start(max(0, round((min(wake) - now) * 1000)))
+
+    def _on_wakeup(self) -> None:
+        now = time.perf_counter()
+        for toast in self._visible:
+            expired = toast.expires_at is not None and toast.expires_at <= now
+            if expired and toast.leaving_since is None:
+                toast.leaving_since = now
+                self._request_frame()
+        self._drain(now)
+
+    def eventFilter(self, watched: QObject, event: QEvent) -> bool:
+        if watched is self._host and event.type() == QEvent.Resize and self._visible:
+            right = self._host.width() - SPACING.lg
+            for toast, target in zip(self._visible, self._targets()):
+                toast.move_from = toast.move_to = target
+                toast.move(right - toast.width(), round(target))
+        return False
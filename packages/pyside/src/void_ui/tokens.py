@@ -0,0 +1,248 @@
+"""Void UI token files and hot reload.
+
+Reads color tokens from JSON, TOML or the ``:root`` custom properties of
+the CSS package's ``tokens.css``, and ``TokenWatcher`` re-applies a theme
+whenever the file is saved.
+
+JSON and TOML files hold either a flat table of tokens, applied to the
+theme's current mode, or ``dark`` and ``light`` tables. Names may use
+``snake_case`` or ``kebab-case``; tokens that are not ``Colors`` fields are
+ignored. In ``tokens.css`` the ``:root`` block is the dark scheme and
+``[data-theme="light"]`` overrides it for the light one; ``var()``
+references and ``color-mix(in srgb, <color> N%, transparent)`` resolve.
+
+A reload renders the sheet for the new tokens and, when any of its rules
+changed, installs it once on the watched target the way the theme was
+applied (plain, switchable, scoped or lean, or the native palette); saves
+that change no rule of the installed sheet restyle nothing.
+
+Usage:
+    from void_ui.tokens import TokenWatcher
+
+    theme = Theme()
+    theme.apply(app)
+    watcher = TokenWatcher(theme, app, "packages/css/src/tokens.css")
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from dataclasses import fields, replace
+from pathlib import Path
+
+try:
+    from PySide6.QtCore import QFileSystemWatcher, QObject, QTimer, Signal
+    from PySide6.QtWidgets import QApplication, QWidget
+    HAS_PYSIDE = True
+except ImportError:
+    HAS_PYSIDE = False
+    QObject = object
+
+from void_ui.colors import Colors, VoidColor
+from void_ui.theme import Theme, ThemeMode
+
+COLOR_TOKENS = frozenset(field.name for field in fields(Colors))
+
+_BLOCK_RE = re.compile(r"([^{}]+)\{([^{}]*)\}")
+_DECLARATION_RE = re.compile(r"--([\w-]+)\s*:\s*([^;]+);")
+_VAR_RE = re.compile(r"var\(\s*--([\w-]+)\s*\)")
+_COLOR_MIX_RE = re.compile(
+    r"color-mix\(\s*in\s+srgb\s*,\s*(.+?)\s+([\d.]+)%\s*,\s*transparent\s*\)$"
+)
+_COMMENT_RE = re.compile(r"/\*.*?\*/", re.DOTALL)
+
+# Per mode, token name -> value. ``None`` holds tokens for the current mode.
+Tokens = dict[ThemeMode | None, dict[str, str]]
+
+
+def _token_name(name: str) -> str:
+    return name.strip().replace("-", "_")
+
+
+def _color_tokens(table: dict) -> dict[str, str]:
+    tokens = {}
+    for name, value in table.items():
+        name = _token_name(name)
+        if name in COLOR_TOKENS and isinstance(value, str):
+            tokens[name] = value.strip()
+    return tokens
+
+
+def _resolve(value: str, variables: dict[str, str], depth: int = 0) -> str:
+    if depth > 16:
+        raise ValueError(f"Circular var() reference in {value!r}")
+    value = _VAR_RE.sub(
+        lambda m: _resolve(variables.get(m.group(1), m.group(0)), variables, depth + 1),
+        value.strip(),
+    )
+    mix = _COLOR_MIX_RE.match(value)
+    if mix:
+        color = VoidColor.parse(mix.group(1).strip())
+        alpha = float(mix.group(2)) / 100 * color.alpha_f
+        return f"rgba({color.red}, {color.green}, {color.blue}, {alpha:g})"
+    return value
+
+
+def parse_css_tokens(text: str) -> Tokens:
+    """Read the dark and light color tokens of a ``tokens.css`` file."""
+    text = _COMMENT_RE.sub("", text)
+    root: dict[str, str] = {}
+    light: dict[str, str] = {}
+    for selector, body in _BLOCK_RE.findall(text):
+        # Skip at-rules such as @import preceding the selector.
+        selector = selector.rsplit(";", 1)[-1].strip()
+        if selector == ":root":
+            target = root
+        elif selector == '[data-theme="light"]':
+            target = light
+        else:
+            continue
+        target.update((name, value.strip()) for name, value in _DECLARATION_RE.findall(body))
+
+    light = {**root, **light}
+    return {
+        ThemeMode.DARK: _color_tokens({name: _resolve(v, root) for name, v in root.items()}),
+        ThemeMode.LIGHT: _color_tokens({name: _resolve(v, light) for name, v in light.items()}),
+    }
+
+
+def _parse_table(data: dict) -> Tokens:
+    modes = {mode.value: mode for mode in ThemeMode}
+    tokens: Tokens = {}
+    flat = {}
+    for name, value in data.items():
+        if name in modes and isinstance(value, dict):
+            tokens[modes[name]] = _color_tokens(value)
+        else:
+            flat[name] = value
+    if flat:
+        tokens[None] = _color_tokens(flat)
+    return tokens
+
+
+def load_tokens(path: str | Path) -> Tokens:
+    """Read color tokens from a ``.json``, ``.toml`` or ``.css`` file."""
+    path = Path(path)
+    suffix = path.suffix.lower()
+    if suffix == ".css":
+        return parse_css_tokens(path.read_text(encoding="utf-8"))
+    if suffix == ".json":
+        return _parse_table(json.loads(path.read_text(encoding="utf-8")))
+    if suffix == ".toml":
+        try:
+            import tomllib
+        except ImportError:  # Python < 3.11, see the tomli dependency
+            import tomli as tomllib
+        return _parse_table(tomllib.loads(path.read_text(encoding="utf-8")))
+    raise ValueError(f"Unsupported token file: {path.name} (expected .json, .toml or .css)")
+
+
+def colors_from_tokens(tokens: dict[str, str], base: Colors) -> Colors:
+    """``base`` with ``tokens`` replaced. Raises ValueError on invalid colors."""
+    return replace(base, **tokens) if tokens else base
+
+
+class TokenWatcher(QObject):
+    """Re-applies ``theme`` to ``target`` whenever the token file at ``path`` changes.
+
+    Saves are debounced by ``debounce`` seconds. Invalid files are
+    reported through ``failed`` and leave the theme unchanged. ``reloaded``
+    carries the number of widgets restyled.
+
+    ``target`` is what ``theme`` was applied to (the roots of a scoped
+    theme); the new sheet is installed there the same way. Changes to the
+    other mode of a switchable sheet are installed by the next
+    ``theme.switch()``.
+    """
+
+    if HAS_PYSIDE:
+        reloaded = Signal(int)
+        failed = Signal(str)
+
+    def __init__(
+        self,
+        theme: Theme,
+        target: QWidget | QApplication | list[QWidget],
+        path: str | Path,
+        debounce: float = 0.15,
+        parent: QObject | None = None,
+    ) -> None:
+        if not HAS_PYSIDE:
+            raise ImportError("PySide6 is required: pip install void-ui[pyside]")
+
+        super().__init__(parent)
+        self._theme = theme
+        self._target = target
+        self._path = Path(path).resolve()
+        # Schemes the file's tokens override; tokens removed from it revert.
+        self._bases = {mode: theme._colors_for(mode) for mode in ThemeMode}
+        # The schemes of the sheet installed on the target.
+        self._installed = self._schemes()
+        self._last_text: str | None = None
+
+        self._debounce = QTimer(self)
+        self._debounce.setSingleShot(True)
+        self._debounce.setInterval(max(0, round(debounce * 1000)))
+        self._debounce.timeout.connect(self.reload)
+
+        # Editors often save by replacing the file, which drops it from the
+        # watcher; watching the directory catches the new file.
+        self._watcher = QFileSystemWatcher(self)
+        self._watcher.addPath(str(self._path.parent))
+        if self._path.exists():
+            self._watcher.addPath(str(self._path))
+        self._watcher.fileChanged.connect(self._on_changed)
+        self._watcher.directoryChanged.connect(self._on_changed)
+        if self._path.exists():
+            self.reload()
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def stop(self) -> None:
+        """Stop watching. Applied tokens stay in effect."""
+        self._debounce.stop()
+        self._watcher.removePaths(self._watcher.files() + self._watcher.directories())
+
+    def _on_changed(self, changed: str) -> None:
+        if self._path.exists() and str(self._path) not in self._watcher.files():
+            self._watcher.addPath(str(self._path))
+        self._debounce.start()
+
+    def reload(self) -> int:
+        """Load the token file and re-apply the theme if its colors changed.
+
+        Returns the number of widgets restyled, or -1 if the file could
+        not be read.
+        """
+        try:
+            text = self._path.read_text(encoding="utf-8")
+            if text == self._last_text:
+                return 0
+            tokens = load_tokens(self._path)
+            theme = self._theme
+            overrides = {mode: dict(tokens.get(mode, {})) for mode in ThemeMode}
+            overrides[theme.mode].update(tokens.get(None, {}))
+            schemes = {
+                mode: colors_from_tokens(values, self._bases[mode])
+                for mode, values in overrides.items()
+            }
+        except (OSError, ValueError, TypeError, ImportError) as exc:
+            self.failed.emit(f"{self._path.name}: {exc}")
+            return -1
+
+        self._last_text = text
+        for mode, colors in schemes.items():
+            theme.set_colors(colors, mode)
+        touched = self._apply()
+        self.reloaded.emit(touched)
+        return touched
+
+    def _schemes(self) -> dict[ThemeMode, Colors]:
+        return {mode: self._theme._colors_for(mode) for mode in ThemeMode}
+
+    def _apply(self) -> int:
+        installed, self._installed = self._installed, self._schemes()
+        return self._theme._reinstall(self._target, installed)
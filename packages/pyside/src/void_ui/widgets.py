@@ -5,7 +5,12 @@ Pre-styled PySide6 widgets matching the design system.
 
 from __future__ import annotations
 
-from typing import Optional
+import sys
+import weakref
+from collections.abc import Iterator
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Any, NamedTuple, Optional
 
 try:
     from PySide6.QtWidgets import (
@@ -16,10 +21,13 @@ try:
         QVBoxLayout,
         QWidget,
         QProgressBar,
-        QGraphicsDropShadowEffect,
+        QStyle,
+        QStyleOptionButton,
+        QStylePainter,
     )
-    from PySide6.QtCore import Qt, Signal
-    from PySide6.QtGui import QColor
+    from PySide6.QtCore import QEvent, QObject, Qt, QRectF, QTimer, Signal
+    from PySide6.QtGui import QPainter
+    import shiboken6
     HAS_PYSIDE = True
 except ImportError:
     HAS_PYSIDE = False
@@ -29,7 +37,198 @@ except ImportError:
     QFrame = object
     QProgressBar = object
 
-from void_ui.colors import DarkColors, RADIUS, SPACING
+from void_ui.animation import animator
+from void_ui.clock import frame_clock
+from void_ui.colors import RADIUS, Colors, DarkColors, VoidColor
+from void_ui.shadow import DropShadow, ShadowSpec
+from void_ui.theme import progress_colors
+
+
+_batch_depth = 0
+_pending_polish: dict[int, QWidget] = {}
+
+
+def _repolish(widget: QWidget) -> None:
+    """Re-resolve stylesheet rules after a style property change.
+
+    Widgets that were never polished pick up their properties on first
+    polish, so construction does not pay for an extra style pass. Inside
+    batch_polish() the widget is queued instead.
+    """
+    if _batch_depth:
+        _pending_polish[id(widget)] = widget
+    elif widget.testAttribute(Qt.WA_WState_Polished):
+        style = widget.style()
+        style.unpolish(widget)
+        style.polish(widget)
+
+
+def _flush_polish() -> None:
+    widgets = list(_pending_polish.values())
+    _pending_polish.clear()
+    for widget in widgets:
+        if shiboken6.isValid(widget):
+            _repolish(widget)
+
+
+# Live Void widgets per class. Entries vanish when the widget is deleted.
+_registry: dict[type, weakref.WeakSet] = {}
+
+
+class WidgetStats(NamedTuple):
+    """Live instances of one Void widget class.
+
+    ``approx_bytes`` covers the Python wrappers, their text and stylesheets
+    and the offscreen buffers of graphics effects (one ARGB32 pixmap of the
+    widget's size each); the C++ objects themselves are not counted.
+    """
+
+    count: int
+    with_effects: int
+    approx_bytes: int
+
+
+def _track(widget: QWidget) -> None:
+    widgets = _registry.get(type(widget))
+    if widgets is None:
+        widgets = _registry[type(widget)] = weakref.WeakSet()
+    widgets.add(widget)
+
+
+def _variant_of(widget: QWidget) -> str | None:
+    for attr in ("_variant", "_label_style", "_color"):
+        value = getattr(widget, attr, None)
+        if value is not None:
+            return value
+    return None
+
+
+def live_widgets(cls: type | None = None, variant: str | None = None) -> list[QWidget]:
+    """Return live Void widgets, optionally of one class and/or variant.
+
+    ``variant`` matches the variant of buttons, badges and cards, the style
+    of labels and the color of progress bars.
+    """
+    widgets = []
+    for widget_cls, instances in list(_registry.items()):
+        if cls is not None and not issubclass(widget_cls, cls):
+            continue
+        for widget in list(instances):
+            if not shiboken6.isValid(widget):
+                continue
+            if variant is None or _variant_of(widget) == variant:
+                widgets.append(widget)
+    return widgets
+
+
+def widget_stats() -> dict[str, WidgetStats]:
+    """Live counts and approximate memory per Void widget class.
+
+    Useful to spot leaks in long-running sessions, e.g. widgets that still
+    hold a graphics effect after their panel was closed.
+    """
+    stats = {}
+    for widget_cls, instances in list(_registry.items()):
+        count = with_effects = approx = 0
+        for widget in list(instances):
+            if not shiboken6.isValid(widget):
+                continue
+            count += 1
+            approx += sys.getsizeof(widget) + len(widget.styleSheet()) * 2
+            text = getattr(widget, "text", None)
+            if callable(text):
+                approx += len(text()) * 2
+            if widget.graphicsEffect() is not None:
+                with_effects += 1
+                size = widget.size() * widget.devicePixelRatioF()
+                approx += size.width() * size.height() * 4
+        if count:
+            stats[widget_cls.__name__] = WidgetStats(count, with_effects, approx)
+    return stats
+
+
+# Colors of the last applied Theme, used by widgets that paint themselves.
+_active_colors: Colors = DarkColors
+
+
+def active_colors() -> Colors:
+    """The color scheme of the most recently applied or switched Theme."""
+    return _active_colors
+
+
+def _set_active_colors(colors: Colors) -> None:
+    global _active_colors
+
+    if colors == _active_colors:
+        return
+    _active_colors = colors
+    for widget in live_widgets():
+        if getattr(widget, "_painted", False):
+            widget.update()
+
+
+@lru_cache(maxsize=8)
+def _progress_chunk_colors(colors: Colors) -> dict[str, VoidColor]:
+    """The parsed chunk color per color of VoidProgress."""
+    return {variant: VoidColor.parse(c) for variant, c in progress_colors(colors).items()}
+
+
+@lru_cache(maxsize=8)
+def _progress_brushes(colors: Colors) -> tuple[Any, dict[str, Any]]:
+    """The groove brush and chunk brush per color of VoidProgress."""
+    chunks = {variant: c.qbrush() for variant, c in _progress_chunk_colors(colors).items()}
+    return colors.qbrush("elevated"), chunks
+
+
+def _paint_bar(
+    painter: QPainter,
+    rect: QRectF,
+    start: float,
+    end: float,
+    groove: Any,
+    chunk: Any,
+) -> None:
+    """Paint a VoidProgress groove with a chunk over ``start``..``end`` (0..1)."""
+    radius = min(RADIUS.sm, rect.height() / 2)
+    painter.setRenderHint(QPainter.Antialiasing)
+    painter.setPen(Qt.NoPen)
+    painter.setBrush(groove)
+    painter.drawRoundedRect(rect, radius, radius)
+    width = rect.width() * (end - start)
+    if width >= 1:
+        painter.setBrush(chunk)
+        painter.drawRoundedRect(
+            QRectF(rect.left() + rect.width() * start, rect.top(), width, rect.height()),
+            radius,
+            radius,
+        )
+
+
+@contextmanager
+def batch_polish(defer: bool = False) -> Iterator[None]:
+    """Coalesce repolishing of Void widgets.
+
+    Variant and style changes made inside the block are queued and each
+    widget is repolished once when the outermost block exits, or on the
+    next event-loop turn with ``defer=True``.
+
+    Usage:
+        with batch_polish():
+            for job in jobs:
+                layout.addWidget(VoidButton(job.name, variant="ghost"))
+    """
+    global _batch_depth
+
+    _batch_depth += 1
+    try:
+        yield
+    finally:
+        _batch_depth -= 1
+        if not _batch_depth and _pending_polish:
+            if defer:
+                QTimer.singleShot(0, _flush_polish)
+            else:
+                _flush_polish()
 
 
 class VoidButton(QPushButton if HAS_PYSIDE else object):
@@ -41,12 +240,19 @@ class VoidButton(QPushButton if HAS_PYSIDE else object):
         - ghost: Transparent
         - danger: Red/destructive
 
+    Hover crossfades between the stylesheet's normal and ``:hover`` looks
+    over ``HOVER_DURATION`` seconds on the shared animator; outside a
+    transition the button paints exactly like a QPushButton, with no
+    Python paint handler involved.
+
     Usage:
         btn = VoidButton("Click me")
         btn = VoidButton("Submit", variant="primary")
         btn = VoidButton("Delete", variant="danger")
     """
 
+    HOVER_DURATION = 0.15
+
     def __init__(
         self,
         text: str = "",
@@ -57,7 +263,10 @@ class VoidButton(QPushButton if HAS_PYSIDE else object):
             raise ImportError("PySide6 is required: pip install void-ui[pyside]")
 
         super().__init__(text, parent)
+        _track(self)
         self._variant = variant
+        # Hover amount (0..1) while a hover transition runs, else None.
+        self._hover: float | None = None
         self._apply_variant()
 
     def _apply_variant(self) -> None:
@@ -70,8 +279,7 @@ class VoidButton(QPushButton if HAS_PYSIDE else object):
         else:
             self.setProperty("class", "")
 
-        self.style().unpolish(self)
-        self.style().polish(self)
+        _repolish(self)
 
     @property
     def variant(self) -> str:
@@ -82,6 +290,75 @@ class VoidButton(QPushButton if HAS_PYSIDE else object):
         self._variant = value
         self._apply_variant()
 
+    def _animate_hover(self, end: float) -> None:
+        start = self._hover
+        if start is None:
+            start = 1.0 - end
+            self.installEventFilter(_hover_painter())
+        animator().animate(
+            self, "hover", start, end, self.HOVER_DURATION, self._set_hover, done=self._end_hover
+        )
+
+    def _set_hover(self, value: float) -> None:
+        self._hover = value
+        self.update()
+
+    def _end_hover(self) -> None:
+        self._hover = None
+        self.removeEventFilter(_hover_painter())
+        self.update()
+
+    def enterEvent(self, event) -> None:
+        if self.isEnabled():
+            self._animate_hover(1.0)
+        super().enterEvent(event)
+
+    def leaveEvent(self, event) -> None:
+        if self.isEnabled():
+            self._animate_hover(0.0)
+        super().leaveEvent(event)
+
+    def _paint_hover(self, hover: float) -> None:
+        # Draw the normal look, then the hover look over it at ``hover``.
+        option = QStyleOptionButton()
+        self.initStyleOption(option)
+        normal = option.state & ~QStyle.State_MouseOver
+        painter = QStylePainter(self)
+        option.state = normal
+        painter.drawControl(QStyle.CE_PushButton, option)
+        painter.setOpacity(hover)
+        option.state = normal | QStyle.State_MouseOver
+        painter.drawControl(QStyle.CE_PushButton, option)
+        painter.end()
+
+
+class _HoverPainter(QObject if HAS_PYSIDE else object):
+    """Paints VoidButton hover crossfades.
+
+    Installed on a button only while its transition runs, so buttons at
+    rest paint in C++ without calling into Python.
+    """
+
+    def eventFilter(self, watched: QObject, event: QEvent) -> bool:
+        if event.type() != QEvent.Paint:
+            return False
+        hover = getattr(watched, "_hover", None)
+        if hover is None:
+            return False
+        watched._paint_hover(hover)
+        return True
+
+
+_hover_painter_instance: _HoverPainter | None = None
+
+
+def _hover_painter() -> _HoverPainter:
+    global _hover_painter_instance
+
+    if _hover_painter_instance is None:
+        _hover_painter_instance = _HoverPainter()
+    return _hover_painter_instance
+
 
 class VoidLabel(QLabel if HAS_PYSIDE else object):
     """Void UI styled label.
@@ -108,6 +385,7 @@ class VoidLabel(QLabel if HAS_PYSIDE else object):
             raise ImportError("PySide6 is required: pip install void-ui[pyside]")
 
         super().__init__(text, parent)
+        _track(self)
         self._label_style = style
         self._apply_style()
 
@@ -121,8 +399,7 @@ class VoidLabel(QLabel if HAS_PYSIDE else object):
         else:
             self.setProperty("class", "")
 
-        self.style().unpolish(self)
-        self.style().polish(self)
+        _repolish(self)
 
 
 class VoidInput(QLineEdit if HAS_PYSIDE else object):
@@ -141,6 +418,7 @@ class VoidInput(QLineEdit if HAS_PYSIDE else object):
             raise ImportError("PySide6 is required: pip install void-ui[pyside]")
 
         super().__init__(parent)
+        _track(self)
         self.setPlaceholderText(placeholder)
         self.setMinimumHeight(36)
 
@@ -148,7 +426,8 @@ class VoidInput(QLineEdit if HAS_PYSIDE else object):
 class VoidCard(QFrame if HAS_PYSIDE else object):
     """Void UI card container.
 
-    A styled container with optional elevation shadow.
+    A styled container with optional elevation shadow. The shadow is drawn
+    by a ``DropShadow`` sibling from a pixmap shared by all elevated cards.
 
     Variants:
         - default: Basic card with border
@@ -164,6 +443,9 @@ class VoidCard(QFrame if HAS_PYSIDE else object):
     if HAS_PYSIDE:
         clicked = Signal()
 
+    # Shadow of the elevated variant, painted from a shared cached pixmap.
+    SHADOW = ShadowSpec(blur=16, offset=(0, 4), color="rgba(0, 0, 0, 0.47)", radius=RADIUS.xl)
+
     def __init__(
         self,
         variant: str = "default",
@@ -173,45 +455,21 @@ class VoidCard(QFrame if HAS_PYSIDE else object):
             raise ImportError("PySide6 is required: pip install void-ui[pyside]")
 
         super().__init__(parent)
+        _track(self)
         self._variant = variant
         self._setup()
 
     def _setup(self) -> None:
-        c = DarkColors
-        r = RADIUS
-        s = SPACING
-
         self.setFrameStyle(QFrame.StyledPanel)
-
-        base_style = f"""
-            VoidCard {{
-                background: {c.surface};
-                border: 1px solid {c.border};
-                border-radius: {r.xl}px;
-                padding: {s.lg}px;
-            }}
-        """
+        self.setProperty("variant", self._variant)
 
         if self._variant == "elevated":
-            shadow = QGraphicsDropShadowEffect()
-            shadow.setBlurRadius(16)
-            shadow.setOffset(0, 4)
-            shadow.setColor(QColor(0, 0, 0, 120))
-            self.setGraphicsEffect(shadow)
-
-            base_style = f"""
-                VoidCard {{
-                    background: {c.raised};
-                    border: none;
-                    border-radius: {r.xl}px;
-                    padding: {s.lg}px;
-                }}
-            """
+            self._shadow = DropShadow(self, self.SHADOW)
 
         elif self._variant == "interactive":
             self.setCursor(Qt.PointingHandCursor)
 
-        self.setStyleSheet(base_style)
+        _repolish(self)
 
     def mousePressEvent(self, event) -> None:
         if self._variant == "interactive":
@@ -246,39 +504,25 @@ class VoidBadge(QLabel if HAS_PYSIDE else object):
             raise ImportError("PySide6 is required: pip install void-ui[pyside]")
 
         super().__init__(text, parent)
+        _track(self)
         self._variant = variant
         self._setup()
 
     def _setup(self) -> None:
-        c = DarkColors
-        r = RADIUS
-
-        colors_map = {
-            "default": (c.elevated, c.gray, "transparent"),
-            "peach": (c.accent_bg, c.peach, "transparent"),
-            "moss": (c.success_bg, c.moss, "transparent"),
-            "sand": (c.warning_bg, c.sand, "transparent"),
-            "blush": ("rgba(212, 165, 165, 0.15)", c.blush, "transparent"),
-            "lilac": (c.info_bg, c.lilac, "transparent"),
-            "danger": (c.danger_bg, c.danger, "transparent"),
-        }
-
-        bg, fg, border = colors_map.get(self._variant, colors_map["default"])
-
-        self.setStyleSheet(f"""
-            VoidBadge {{
-                background: {bg};
-                color: {fg};
-                border: 1px solid {border};
-                border-radius: {r.sm}px;
-                padding: 3px 8px;
-                font-size: 11px;
-                font-weight: 500;
-            }}
-        """)
-
+        self.setProperty("variant", self._variant)
         self.setAlignment(Qt.AlignCenter)
 
+        _repolish(self)
+
+    @property
+    def variant(self) -> str:
+        return self._variant
+
+    @variant.setter
+    def variant(self, value: str) -> None:
+        self._variant = value
+        self._setup()
+
 
 class VoidProgress(QProgressBar if HAS_PYSIDE else object):
     """Void UI progress bar.
@@ -289,48 +533,140 @@ class VoidProgress(QProgressBar if HAS_PYSIDE else object):
         - sand: Yellow/warning
         - danger: Red
 
+    With ``painted=True`` the bar is drawn with QPainter instead of the
+    stylesheet, and ``setValue`` is coalesced: the bar repaints at most
+    once per frame with the latest value (``value()`` returns it right
+    away; ``valueChanged`` fires on the frame). An indeterminate bar
+    (``setRange(0, 0)``) animates on the shared frame clock only while it
+    is visible. Color changes of a painted bar fade over
+    ``COLOR_DURATION`` seconds.
+
     Usage:
         progress = VoidProgress(value=60)
         progress = VoidProgress(value=80, color="moss")
+        progress = VoidProgress(color="moss", painted=True)  # for high-rate updates
     """
 
+    # Indeterminate chunk width (fraction of the bar) and cycle length.
+    BUSY_WIDTH = 0.3
+    BUSY_PERIOD = 1.2
+    COLOR_DURATION = 0.2
+
     def __init__(
         self,
         value: int = 0,
         color: str = "peach",
+        painted: bool = False,
         parent: Optional[QWidget] = None,
     ) -> None:
         if not HAS_PYSIDE:
             raise ImportError("PySide6 is required: pip install void-ui[pyside]")
 
         super().__init__(parent)
+        _track(self)
         self._color = color
-        self.setValue(value)
+        self._painted = painted
+        self._pending_value: int | None = None
+        self._busy_phase = 0.0
+        # Chunk color while a color transition runs, else None.
+        self._chunk_color: VoidColor | None = None
+        super().setValue(value)
         self.setTextVisible(False)
         self.setFixedHeight(8)
         self._apply_color()
 
+    @property
+    def color(self) -> str:
+        return self._color
+
+    @color.setter
+    def color(self, value: str) -> None:
+        previous, self._color = self._color, value
+        if self._painted and previous != value:
+            chunks = _progress_chunk_colors(_active_colors)
+            start = self._chunk_color or chunks.get(previous, chunks["peach"])
+            end = chunks.get(value, chunks["peach"])
+            animator().animate(
+                self, "color", start, end, self.COLOR_DURATION, self._set_chunk_color,
+                done=self._apply_color,
+            )
+        else:
+            self._apply_color()
+
+    def _set_chunk_color(self, color: VoidColor) -> None:
+        self._chunk_color = color
+        self.update()
+
     def _apply_color(self) -> None:
-        c = DarkColors
-        r = RADIUS
-
-        color_map = {
-            "peach": c.peach,
-            "moss": c.moss,
-            "sand": c.sand,
-            "danger": c.danger,
-        }
-
-        bar_color = color_map.get(self._color, c.peach)
-
-        self.setStyleSheet(f"""
-            VoidProgress {{
-                background: {c.elevated};
-                border: none;
-                border-radius: {r.sm}px;
-            }}
-            VoidProgress::chunk {{
-                background: {bar_color};
-                border-radius: {r.sm}px;
-            }}
-        """)
+        self._chunk_color = None
+        self.setProperty("variant", self._color)
+
+        if self._painted:
+            self.update()
+        else:
+            _repolish(self)
+
+    @property
+    def painted(self) -> bool:
+        return self._painted
+
+    def setValue(self, value: int) -> None:
+        if not self._painted:
+            super().setValue(value)
+            return
+        if self._pending_value is None:
+            frame_clock().call_once(self._flush_value)
+        self._pending_value = value
+
+    def value(self) -> int:
+        pending = self._pending_value
+        if pending is not None and self.minimum() <= pending <= self.maximum():
+            return pending
+        return super().value()
+
+    def _flush_value(self, now: float) -> None:
+        value, self._pending_value = self._pending_value, None
+        if value is None or value == super().value():
+            return
+        # QProgressBar repaints synchronously on setValue; with updates
+        # disabled that is skipped and re-enabling queues a single update().
+        self.setUpdatesEnabled(False)
+        try:
+            super().setValue(value)
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def _animate_busy(self, now: float) -> bool:
+        if self.minimum() != self.maximum() or self.visibleRegion().isEmpty():
+            return False
+        self._busy_phase = (now % self.BUSY_PERIOD) / self.BUSY_PERIOD
+        self.update()
+        return True
+
+    def paintEvent(self, event) -> None:
+        if not self._painted:
+            super().paintEvent(event)
+            return
+
+        groove, chunks = _progress_brushes(_active_colors)
+        if self._chunk_color is not None:
+            chunk = self._chunk_color.qbrush()
+        else:
+            chunk = chunks.get(self._color, chunks["peach"])
+        minimum, maximum = self.minimum(), self.maximum()
+        if minimum == maximum:
+            # Sweep a chunk across, entering and leaving at the edges.
+            end = self._busy_phase * (1 + self.BUSY_WIDTH)
+            start, end = max(0.0, end - self.BUSY_WIDTH), min(1.0, end)
+            frame_clock().add(self._animate_busy)
+        else:
+            start, end = 0.0, (super().value() - minimum) / (maximum - minimum)
+
+        painter = QPainter(self)
+        _paint_bar(painter, QRectF(self.rect()), start, max(0.0, min(end, 1.0)), groove, chunk)
+        painter.end()
+
+    def hideEvent(self, event) -> None:
+        if self._painted:
+            frame_clock().remove(self._animate_busy)
+        super().hideEvent(event)
@@ -0,0 +1,46 @@
+"""Shared fixtures: a headless QApplication for widget tests, and a recorder
+of the widgets Qt restyles."""
+
+import os
+import shutil
+import tempfile
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+# Tests wait for nothing in the background.
+os.environ.setdefault("VOID_UI_PREWARM", "0")
+# Never read or fill the user's sheet cache; subprocesses inherit this.
+_CACHE_DIR = tempfile.mkdtemp(prefix="void-ui-test-cache-")
+os.environ["VOID_UI_CACHE_DIR"] = _CACHE_DIR
+
+
+def pytest_unconfigure(config):
+    shutil.rmtree(_CACHE_DIR, ignore_errors=True)
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    qt_widgets = pytest.importorskip("PySide6.QtWidgets")
+    return qt_widgets.QApplication.instance() or qt_widgets.QApplication([])
+
+
+@pytest.fixture
+def restyled(qapp):
+    """Collects the ids of the widgets that receive a style change."""
+    from PySide6.QtCore import QEvent, QObject
+
+    class Restyled(QObject):
+        def __init__(self) -> None:
+            super().__init__()
+            self.widgets: set[int] = set()
+
+        def eventFilter(self, watched: QObject, event: QEvent) -> bool:
+            if event.type() == QEvent.StyleChange and watched.isWidgetType():
+                self.widgets.add(id(watched))
+            return False
+
+    recorder = Restyled()
+    qapp.installEventFilter(recorder)
+    yield recorder
+    qapp.removeEventFilter(recorder)
@@ -0,0 +1,84 @@
+"""Update bus: coalescing posts from worker threads into one batch."""
+
+import threading
+
+import pytest
+
+from void_ui.bus import UpdateBus
+from void_ui.widgets import VoidLabel, VoidProgress
+
+shiboken6 = pytest.importorskip("shiboken6")
+
+THREADS = 8
+POSTS = 500
+
+
+@pytest.fixture
+def bus(qapp):
+    bus = UpdateBus()
+    yield bus
+    bus.deleteLater()
+
+
+def _workers(target, count=THREADS):
+    threads = [threading.Thread(target=target, args=(n,)) for n in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def test_posts_from_threads_coalesce_per_key(bus):
+    bars = [VoidProgress() for _ in range(THREADS)]
+
+    def work(n):
+        for value in range(1, POSTS + 1):
+            bus.post(bars[n], "value", value * 100 // POSTS)
+
+    _workers(work)
+    stats = bus.stats()
+    assert stats.posted == THREADS * POSTS
+    assert stats.pending == THREADS
+    assert stats.coalesced == THREADS * (POSTS - 1)
+    assert stats.applied == 0
+
+    assert bus.flush() == THREADS
+    assert [bar.value() for bar in bars] == [100] * THREADS
+    stats = bus.stats()
+    assert stats.applied == THREADS
+    assert stats.batches == 1
+    assert stats.pending == 0
+
+
+def test_threads_sharing_a_key_apply_once(bus):
+    label = VoidLabel()
+
+    def work(n):
+        for i in range(POSTS):
+            bus.post(label, "text", f"{n}:{i}")
+
+    _workers(work)
+    assert bus.flush() == 1
+    assert label.text().endswith(f":{POSTS - 1}")
+    assert bus.stats().coalesced == THREADS * POSTS - 1
+
+
+def test_worker_posts_flush_on_the_event_loop(bus, qapp):
+    label = VoidLabel()
+    _workers(lambda n: bus.post(label, "text", "done"), count=1)
+
+    assert label.text() == ""
+    qapp.processEvents()
+    assert label.text() == "done"
+    assert bus.stats().batches == 1
+
+
+def test_deleted_widgets_and_full_queue_drop(bus):
+    bus.max_pending = 1
+    kept, deleted = VoidLabel(), VoidLabel()
+    bus.post(deleted, "text", "gone")
+    bus.post(kept, "text", "over the limit")
+    shiboken6.delete(deleted)
+    assert bus.flush() == 0
+    assert bus.stats().dropped == 2
+    assert kept.text() == ""
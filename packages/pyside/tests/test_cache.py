@@ -0,0 +1,91 @@
+"""On-disk sheet cache: corrupt, partial and stale entries, pruning."""
+
+import pytest
+
+from void_ui import cache
+from void_ui.colors import TYPOGRAPHY
+from void_ui.theme import Theme, ThemeMode, clear_qss_cache, disk_cache_key
+
+KEY = "0123456789abcdef"
+OLD_KEY = "fedcba9876543210"
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("VOID_UI_CACHE_DIR", str(tmp_path))
+    # Shipped sheets would be found first.
+    monkeypatch.setattr(cache, "PACKAGE_DIR", tmp_path / "package")
+    clear_qss_cache()
+    yield tmp_path
+    clear_qss_cache()
+
+
+def test_store_and_load_round_trip(cache_dir):
+    cache.store(KEY, "dark", "QWidget { color: red; }")
+    assert cache.load(KEY, "dark") == "QWidget { color: red; }"
+    assert cache.load(OLD_KEY, "dark") is None
+    assert cache.load(KEY, "light") is None
+
+
+@pytest.mark.parametrize(
+    "damage",
+    [
+        lambda data: data[: len(data) // 2],          # partial write
+        lambda data: data.replace(b"red", b"blu"),    # body changed
+        lambda data: data.split(b"\n", 1)[1],         # header missing
+        lambda data: b"\xff\xfe" + data,              # garbage header
+        lambda data: b"",
+    ],
+)
+def test_damaged_entries_are_misses(cache_dir, damage):
+    cache.store(KEY, "dark", "QWidget { color: red; }")
+    path = cache_dir / KEY / "dark.qss"
+    path.write_bytes(damage(path.read_bytes()))
+    assert cache.load(KEY, "dark") is None
+
+
+def test_entry_under_wrong_key_is_a_miss(cache_dir):
+    cache.store(KEY, "dark", "QWidget {}")
+    (cache_dir / OLD_KEY).mkdir()
+    (cache_dir / OLD_KEY / "dark.qss").write_bytes((cache_dir / KEY / "dark.qss").read_bytes())
+    assert cache.load(OLD_KEY, "dark") is None
+
+
+def test_new_key_prunes_other_keys(cache_dir):
+    cache.store(OLD_KEY, "dark", "old")
+    (cache_dir / "unrelated").mkdir()
+    cache.store(KEY, "dark", "new")
+    cache.store(KEY, "light", "new")
+
+    assert not (cache_dir / OLD_KEY).exists()
+    assert (cache_dir / "unrelated").is_dir()
+    assert sorted(p.name for p in (cache_dir / KEY).iterdir()) == ["dark.qss", "light.qss"]
+
+
+def test_disabled_cache_writes_nothing(tmp_path, monkeypatch):
+    monkeypatch.setenv("VOID_UI_CACHE_DIR", "")
+    assert cache.cache_dir() is None
+    cache.store(KEY, "dark", "QWidget {}")
+    assert cache.load(KEY, "dark") is None
+
+
+def test_theme_rebuilds_corrupt_sheet(cache_dir):
+    expected = Theme(ThemeMode.DARK).generate_qss()
+    path = cache_dir / disk_cache_key() / "dark.qss"
+    # The entry holds the stacks as written, whether or not fonts resolve.
+    stored = cache.load(disk_cache_key(), "dark")
+    assert stored is not None
+
+    path.write_bytes(path.read_bytes()[:100])
+    clear_qss_cache()
+    assert Theme(ThemeMode.DARK).generate_qss() == expected
+    # The damaged entry was replaced.
+    assert cache.load(disk_cache_key(), "dark") == stored
+
+
+def test_built_sheets_name_the_stacks_as_written(qapp, cache_dir):
+    # With a QApplication, Theme sheets use the locally installed families.
+    Theme().generate_qss()
+    for path in cache.build(cache_dir / "package"):
+        qss = cache.load(disk_cache_key(), path.stem)
+        assert f"font-family: {TYPOGRAPHY.font_family};" in qss
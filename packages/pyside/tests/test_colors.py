@@ -0,0 +1,63 @@
+"""Color tokens: parsing, interning and the schemes' parsed fields."""
+
+import pytest
+
+from void_ui import colors
+from void_ui.colors import DarkColors, VoidColor
+
+
+@pytest.mark.parametrize(
+    ("text", "rgba"),
+    [
+        ("#e8a87c", 0xE8A87CFF),
+        ("#E8A87C", 0xE8A87CFF),
+        ("#fa0", 0xFFAA00FF),
+        ("#fa08", 0xFFAA0088),
+        ("#e8a87c80", 0xE8A87C80),
+        ("rgb(232, 168, 124)", 0xE8A87CFF),
+        ("rgba(232,168,124,0.12)", 0xE8A87C1F),
+        ("rgba(300, 0, 0, 2)", 0xFF0000FF),
+        (" transparent ", 0x00000000),
+    ],
+)
+def test_parse(text, rgba):
+    assert VoidColor.parse(text).rgba == rgba
+
+
+@pytest.mark.parametrize(
+    "text",
+    ["", "#", "#12", "#12345", "#1234567", "#ggg", "e8a87c", "red", "rgb(1, 2)", "hsl(0, 0, 0)"],
+)
+def test_parse_rejects_invalid_colors(text):
+    with pytest.raises(ValueError, match="Unsupported color"):
+        VoidColor.parse(text)
+
+
+def test_parse_keeps_the_token_text():
+    assert str(VoidColor.parse("rgba(232, 168, 124, 0.12)")) == "rgba(232, 168, 124, 0.12)"
+    assert str(VoidColor.from_rgba(232, 168, 124)) == "#e8a87c"
+    assert str(VoidColor.from_rgba(232, 168, 124, 0)) == "rgba(232, 168, 124, 0.0)"
+
+
+def test_parse_interns_per_text():
+    assert VoidColor.parse("#123456") is VoidColor.parse("#123456")
+    assert VoidColor.parse("#123456") == VoidColor.parse("rgb(18, 52, 86)")
+
+
+def test_scheme_colors_survive_a_sweep_through_the_parse_cache(qapp):
+    brush = DarkColors.qbrush("peach")
+    in_use = VoidColor.parse("#e8a87c")
+    for i in range(colors._PARSED_MAXSIZE + 1):
+        VoidColor.parse(f"#{i:06x}")
+
+    assert DarkColors.color("peach") is in_use
+    assert DarkColors.qbrush("peach") is brush
+
+
+def test_recently_used_tokens_stay_interned():
+    kept = VoidColor.parse("#abcdef")
+    for i in range(colors._PARSED_MAXSIZE * 2):
+        if i % 1000 == 0:
+            VoidColor.parse("#abcdef")
+        VoidColor.parse(f"#{i:06x}")
+    assert VoidColor.parse("#abcdef") is kept
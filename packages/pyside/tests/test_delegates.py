@@ -0,0 +1,68 @@
+"""Item delegates: badge and progress cells painted from model data."""
+
+import pytest
+
+pytest.importorskip("PySide6.QtWidgets")
+
+from PySide6.QtCore import QRect  # noqa: E402
+from PySide6.QtGui import QImage, QPainter, QStandardItem, QStandardItemModel  # noqa: E402
+from PySide6.QtWidgets import QStyleOptionViewItem  # noqa: E402
+
+from void_ui.colors import DarkColors, VoidColor  # noqa: E402
+from void_ui.delegates import VARIANT_ROLE, BadgeDelegate, ProgressDelegate  # noqa: E402
+from void_ui.theme import BADGE_VARIANTS, PROGRESS_COLORS, Theme, badge_colors  # noqa: E402
+
+WIDTH, HEIGHT = 136, 32
+
+
+def _paint(delegate, text: str, variant: str) -> QImage:
+    """One cell painted by ``delegate`` over ``void``."""
+    model = QStandardItemModel()
+    item = QStandardItem(text)
+    item.setData(variant, VARIANT_ROLE)
+    model.appendRow(item)
+
+    image = QImage(WIDTH, HEIGHT, QImage.Format_ARGB32)
+    image.fill(DarkColors.qcolor("void"))
+    option = QStyleOptionViewItem()
+    option.rect = QRect(0, 0, WIDTH, HEIGHT)
+    painter = QPainter(image)
+    delegate.paint(painter, option, model.index(0, 0))
+    painter.end()
+    return image
+
+
+def _over_void(color: str) -> tuple[int, int, int]:
+    fg, bg = VoidColor.parse(color), DarkColors.color("void")
+    a = fg.alpha_f
+    return tuple(
+        round(f * a + b * (1 - a)) for f, b in zip(fg.rgb_tuple()[:3], bg.rgb_tuple()[:3])
+    )
+
+
+def _assert_pixel(image: QImage, x: int, y: int, color: str) -> None:
+    pixel = image.pixelColor(x, y)
+    expected = _over_void(color)
+    actual = (pixel.red(), pixel.green(), pixel.blue())
+    assert all(abs(a - e) <= 1 for a, e in zip(actual, expected)), (actual, expected)
+
+
+@pytest.mark.parametrize("variant", sorted(BADGE_VARIANTS))
+def test_badge_cell_fill(qapp, variant):
+    delegate = BadgeDelegate(Theme())
+    image = _paint(delegate, "queued", variant)
+    background, _ = badge_colors(DarkColors)[variant]
+
+    # Inside the badge's left padding, then past its right edge.
+    _assert_pixel(image, 11, HEIGHT // 2, background)
+    _assert_pixel(image, WIDTH - 2, HEIGHT // 2, DarkColors.void)
+
+
+@pytest.mark.parametrize("color", sorted(PROGRESS_COLORS))
+def test_progress_cell_chunk_and_groove(qapp, color):
+    delegate = ProgressDelegate(Theme())
+    image = _paint(delegate, "50", color)
+
+    _assert_pixel(image, 20, HEIGHT // 2, getattr(DarkColors, color))
+    _assert_pixel(image, WIDTH - 20, HEIGHT // 2, DarkColors.elevated)
+    _assert_pixel(image, WIDTH // 2, 2, DarkColors.void)
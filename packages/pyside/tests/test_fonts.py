@@ -0,0 +1,89 @@
+"""Font stack resolving against the font database."""
+
+import os
+import subprocess
+import sys
+import textwrap
+from dataclasses import replace
+from functools import cache
+
+import pytest
+
+pytest.importorskip("PySide6.QtGui")
+
+from void_ui import fonts  # noqa: E402
+from void_ui.colors import TYPOGRAPHY  # noqa: E402
+
+INSTALLED = frozenset({"Inter", "JetBrains Mono", "Noto Sans JP"})
+SYSTEM = {"general": "System Sans", "fixed": "System Mono"}
+
+
+@pytest.fixture
+def database(qapp, monkeypatch):
+    """A font database holding ``INSTALLED`` and the ``SYSTEM`` fonts."""
+    monkeypatch.setattr(fonts, "_installed", cache(lambda: INSTALLED))
+    monkeypatch.setattr(fonts, "_system_family", cache(SYSTEM.__getitem__))
+    monkeypatch.setattr(fonts, "_enabled", True)
+    fonts.clear_cache()
+    yield
+    fonts.clear_cache()
+
+
+@pytest.mark.parametrize(
+    ("stack", "families"),
+    [
+        ("Inter, sans-serif", ("Inter", "System Sans")),
+        ("'JetBrains Mono', ui-monospace, monospace", ("JetBrains Mono", "System Mono")),
+        ("-apple-system, BlinkMacSystemFont, 'Segoe UI'", ("System Sans",)),
+        ("system-ui, monospace", ("System Sans", "System Mono")),
+    ],
+)
+def test_generic_families_become_system_fonts(database, stack, families):
+    assert fonts.resolve_stack(stack) == families
+
+
+def test_resolved_families_are_unique(database):
+    stack = "Inter, -apple-system, 'Inter', system-ui, sans-serif, \"Inter\""
+    assert fonts.resolve_stack(stack) == ("Inter", "System Sans")
+
+
+@pytest.mark.parametrize("stack", ["'Segoe UI', Roboto", "", " , "])
+def test_stack_with_nothing_installed_resolves_to_the_system_font(database, stack):
+    assert fonts.resolve_stack(stack) == ("System Sans",)
+
+
+def test_resolved_typography_names_installed_families_only(database):
+    resolved = fonts.resolved_typography()
+    assert resolved is not TYPOGRAPHY
+    for name in fonts.STACK_FIELDS:
+        families = fonts.split_stack(getattr(resolved, name))
+        assert families == fonts.resolve_stack(getattr(TYPOGRAPHY, name))
+        assert set(families) <= INSTALLED | set(SYSTEM.values())
+    assert fonts.resolved_typography() is resolved
+
+
+def test_typography_resolving_unchanged_keeps_its_identity(database):
+    typography = replace(
+        TYPOGRAPHY,
+        **{name: fonts.css_stack(("Inter", "JetBrains Mono")) for name in fonts.STACK_FIELDS},
+    )
+    assert fonts.resolved_typography(typography) is typography
+
+
+def test_disabled_resolving_keeps_the_stacks_as_written(database, monkeypatch):
+    monkeypatch.setattr(fonts, "_enabled", False)
+    assert fonts.resolved_typography() is TYPOGRAPHY
+
+
+def test_resolve_fonts_environment_variable_disables_resolving(qapp):
+    script = textwrap.dedent("""
+        from PySide6.QtGui import QGuiApplication
+        app = QGuiApplication([])
+        from void_ui import Theme, fonts
+        from void_ui.colors import TYPOGRAPHY
+        assert not fonts.is_enabled()
+        assert fonts.resolved_typography() is TYPOGRAPHY
+        assert f"font-family: {TYPOGRAPHY.font_family};" in Theme().generate_qss()
+    """)
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path), VOID_UI_RESOLVE_FONTS="0")
+    subprocess.run([sys.executable, "-c", script], check=True, env=env)
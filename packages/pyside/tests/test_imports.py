@@ -0,0 +1,61 @@
+"""Import-time regression tests: token access must not load Qt."""
+
+import os
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+QT_PREFIXES = ("PySide6", "shiboken6")
+
+
+def _loaded_qt_modules(code: str) -> list[str]:
+    script = textwrap.dedent(code) + textwrap.dedent(f"""
+        import sys
+        print(",".join(m for m in sys.modules if m.startswith({QT_PREFIXES!r})))
+    """)
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    out = subprocess.run(
+        [sys.executable, "-c", script], check=True, capture_output=True, text=True, env=env
+    ).stdout
+    return [m for m in out.strip().split(",") if m]
+
+
+@pytest.mark.parametrize(
+    "code",
+    [
+        "import void_ui",
+        "import void_ui.colors",
+        "from void_ui import Colors, DarkColors, LightColors",
+        "from void_ui.colors import SPACING, RADIUS, TYPOGRAPHY",
+    ],
+)
+def test_tokens_do_not_import_qt(code):
+    assert _loaded_qt_modules(code) == []
+
+
+def test_theme_generation_does_not_import_qt():
+    code = """
+        from void_ui import Theme
+        Theme().generate_qss()
+    """
+    assert _loaded_qt_modules(code) == []
+
+
+def test_widget_access_loads_widgets_lazily():
+    pytest.importorskip("PySide6.QtWidgets")
+    code = """
+        import void_ui
+        assert "void_ui.widgets" not in sys.modules
+        void_ui.VoidButton
+        assert "void_ui.widgets" in sys.modules
+    """
+    assert "PySide6.QtWidgets" in _loaded_qt_modules("import sys\n" + textwrap.dedent(code))
+
+
+def test_unknown_attribute_raises():
+    import void_ui
+
+    with pytest.raises(AttributeError):
+        void_ui.NotAWidget
@@ -0,0 +1,61 @@
+"""Palette engine: derived schemes and WCAG contrast checks."""
+
+from dataclasses import fields
+
+import pytest
+
+from void_ui.colors import DarkColors, LightColors
+from void_ui.palette import ContrastFailure, contrast_failures, derive_colors, derive_palettes
+
+pytest.importorskip("numpy")
+
+
+@pytest.mark.parametrize("base", [DarkColors, LightColors])
+def test_base_seeds_reproduce_the_base_scheme(base):
+    assert derive_colors(base.accent, base=base) == base
+
+
+def test_derived_scheme_follows_the_accent():
+    colors = derive_colors("#7cb8e8")
+
+    assert colors.accent == colors.peach == "#7cb8e8"
+    assert colors.accent_hover == "#6ca3db"
+    assert colors.accent_bg == "rgba(124, 184, 232, 0.12)"
+    assert colors.glass_border == "rgba(124, 184, 232, 0.08)"
+    # Seeds not given and tokens not derived from them keep the base values.
+    for name in ("void", "white", "surface", "gray", "moss", "danger", "glass_bg"):
+        assert getattr(colors, name) == getattr(DarkColors, name)
+
+
+def test_derived_surfaces_follow_the_void():
+    colors = derive_colors("#7cb8e8", void="#000814")
+    changed = {
+        field.name
+        for field in fields(DarkColors)
+        if getattr(colors, field.name) != getattr(DarkColors, field.name)
+    }
+    assert {"void", "surface", "raised", "elevated", "border", "glass_bg"} <= changed
+    assert colors.white == DarkColors.white
+
+
+def test_derive_palettes_matches_derive_colors():
+    accents = ["#7cb8e8", "#a5b5a0", "#c9544e"]
+    assert derive_palettes(accents) == [derive_colors(accent) for accent in accents]
+
+
+def test_contrast_failures():
+    assert contrast_failures(DarkColors) == []
+
+    # Near-white text on the pastel fill of primary buttons.
+    (failure,) = contrast_failures(LightColors)
+    assert failure[:2] == ("void", "peach")
+    assert failure.ratio < failure.minimum == 4.5
+
+    dim = derive_colors("#e8a87c", white="#4a4540")
+    failures = contrast_failures([DarkColors, dim])
+    assert failures[0] == []
+    assert {(f.text, f.surface) for f in failures[1]} >= {("white", "void"), ("gray", "void")}
+    assert all(isinstance(f, ContrastFailure) and f.ratio < f.minimum for f in failures[1])
+
+    assert contrast_failures(LightColors, fill_minimums={}) == []
+    assert contrast_failures(DarkColors, {"muted": 4.5})
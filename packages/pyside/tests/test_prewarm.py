@@ -0,0 +1,76 @@
+"""Background pre-warming of both theme modes after the first apply."""
+
+from dataclasses import fields
+
+import pytest
+
+pytest.importorskip("PySide6.QtWidgets")
+
+from void_ui import delegates, prewarm, qss  # noqa: E402
+from void_ui import theme as theme_module  # noqa: E402
+from void_ui.colors import DarkColors, LightColors  # noqa: E402
+from void_ui.theme import Theme, ThemeMode, clear_qss_cache  # noqa: E402
+from void_ui.widgets import VoidButton, VoidProgress, _progress_brushes  # noqa: E402
+
+
+@pytest.fixture
+def warmed(qapp, monkeypatch):
+    """A theme applied to the application, with pre-warming finished."""
+    monkeypatch.setattr(prewarm, "_enabled", True)
+    clear_qss_cache()
+    _progress_brushes.cache_clear()
+    delegates._badge_palette.cache_clear()
+    widgets = [VoidButton("open", variant="primary"), VoidProgress(value=40)]
+
+    theme = Theme()
+    theme.apply(qapp)
+    assert prewarm.wait(timeout=30)
+    yield theme, widgets
+    qapp.setStyleSheet("")
+    clear_qss_cache()
+
+
+@pytest.fixture
+def no_rendering(monkeypatch):
+    """Fail on any sheet rendered, loaded from disk or diffed from now on."""
+
+    def render(*args, **kwargs):
+        raise AssertionError("rendered after pre-warming")
+
+    monkeypatch.setattr(theme_module, "_render_template", render)
+    monkeypatch.setattr(theme_module._cache, "load", render)
+    monkeypatch.setattr(qss, "scope_qss", render)
+    monkeypatch.setattr(qss, "diff_rules", render)
+
+
+@pytest.mark.parametrize("mode", list(ThemeMode))
+def test_sheets_of_both_modes_are_cached(warmed, no_rendering, mode):
+    theme = Theme(mode)
+    assert theme.generate_qss()
+    assert theme.generate_switchable_qss()
+    assert theme.generate_scoped_qss()
+
+
+def test_diffs_in_both_directions_are_cached(warmed, no_rendering):
+    dark, light = Theme(ThemeMode.DARK), Theme(ThemeMode.LIGHT)
+    assert dark.diff(ThemeMode.LIGHT)
+    assert light.diff(ThemeMode.DARK)
+
+
+def test_brushes_of_both_schemes_are_cached(warmed):
+    for colors in (DarkColors, LightColors):
+        assert all(colors._parsed[field.name]._qbrush is not None for field in fields(colors))
+    info = _progress_brushes.cache_info()
+    assert (info.misses, info.currsize) == (2, 2)
+    _progress_brushes(DarkColors)
+    _progress_brushes(LightColors)
+    assert _progress_brushes.cache_info().hits == info.hits + 2
+    assert delegates._badge_palette.cache_info().currsize == 2
+
+
+def test_first_switch_renders_nothing(qapp, warmed, no_rendering):
+    theme, widgets = warmed
+    assert theme.switch(qapp) > 0
+    assert theme.mode == ThemeMode.LIGHT
+    assert theme.switch(qapp) > 0
+    assert theme.mode == ThemeMode.DARK
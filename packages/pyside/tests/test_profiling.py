@@ -0,0 +1,37 @@
+"""Profiler: timing paints without changing what is painted."""
+
+import pytest
+
+pytest.importorskip("PySide6.QtWidgets")
+
+from void_ui import profiling  # noqa: E402
+from void_ui.widgets import VoidButton, VoidProgress  # noqa: E402
+
+
+def _frames() -> list:
+    """A button at rest and halfway through its hover crossfade, and a painted bar."""
+    button = VoidButton("Open", variant="primary")
+    button.resize(120, 32)
+    rest = button.grab().toImage()
+    button._animate_hover(1.0)
+    button._set_hover(0.5)
+    halfway = button.grab().toImage()
+    button._end_hover()
+
+    bar = VoidProgress(60, color="moss", painted=True)
+    bar.resize(200, 8)
+    return [rest, halfway, bar.grab().toImage()]
+
+
+def test_profiled_frames_are_identical(qapp):
+    plain = _frames()
+    assert plain[0] != plain[1]
+
+    profiling.reset()
+    with profiling.profile(lag=False):
+        profiled = _frames()
+    assert profiled == plain
+
+    stats = profiling.stats()
+    assert stats["VoidButton.paintEvent"].count == 2
+    assert stats["VoidProgress.paintEvent"].count == 1
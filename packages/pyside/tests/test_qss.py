@@ -0,0 +1,133 @@
+"""Stylesheet utilities: parsing, diffing, scoping and pruning rules."""
+
+import pytest
+
+from void_ui import qss
+from void_ui.qss import QssRule, SelectorTarget
+
+SHEET = """
+/* QPushButton { color: red; } */
+QWidget {
+    background: transparent;
+}
+
+QPushButton, QPushButton[class="primary"]:hover {
+    color: #f5f0eb;
+}
+
+QScrollBar::handle:vertical { background: #2a2521; }
+QTabWidget > QTabBar QToolButton { border: none; }
+"""
+
+
+def test_parse_rules_splits_selectors_and_drops_comments():
+    rules = qss.parse_rules(SHEET)
+    assert [rule.selectors for rule in rules] == [
+        ("QWidget",),
+        ("QPushButton", 'QPushButton[class="primary"]:hover'),
+        ("QScrollBar::handle:vertical",),
+        ("QTabWidget > QTabBar QToolButton",),
+    ]
+    assert " ".join(rules[1].body.split()) == "color: #f5f0eb;"
+    assert str(rules[2]) == "QScrollBar::handle:vertical { background: #2a2521; }"
+
+
+def test_parse_rules_keeps_commas_inside_attribute_values():
+    (rule,) = qss.parse_rules('QLabel[text="a, b"], QLabel { color: red; }')
+    assert rule.selectors == ('QLabel[text="a, b"]', "QLabel")
+
+
+def test_parse_rules_rejects_unbalanced_braces():
+    with pytest.raises(ValueError, match="Unbalanced"):
+        qss.parse_rules("QWidget { color: red;")
+
+
+def test_diff_rules_ignores_whitespace_and_reports_removed_rules():
+    old = "QLabel { color: red; }\nQLineEdit { border: none; }\nQMenu { color: red; }"
+    new = "QLabel {\n    color:  red;\n}\nQLineEdit { border: 1px; }\nQFrame { color: red; }"
+    assert qss.diff_rules(old, new) == [
+        QssRule(("QLineEdit",), " border: 1px; "),
+        QssRule(("QFrame",), " color: red; "),
+        QssRule(("QMenu",), " color: red; "),
+    ]
+    assert qss.diff_rules(old, old) == []
+
+
+def test_diff_rules_matches_repeated_selectors_in_order():
+    old = "VoidBadge { border: none; }\nVoidBadge { color: red; }"
+    assert qss.diff_rules(old, old) == []
+    new = "VoidBadge { border: none; }\nVoidBadge { color: blue; }"
+    assert qss.diff_rules(old, new) == [QssRule(("VoidBadge",), " color: blue; ")]
+    assert qss.diff_rules(old, "VoidBadge { border: none; }") == [
+        QssRule(("VoidBadge",), " color: red; ")
+    ]
+
+
+@pytest.mark.parametrize(
+    ("selector", "target"),
+    [
+        ("QWidget", SelectorTarget("QWidget")),
+        ("*", SelectorTarget("*")),
+        ("QScrollBar::handle:hover", SelectorTarget("QScrollBar")),
+        (
+            'QPushButton[class="primary"]:hover',
+            SelectorTarget("QPushButton", (("class", "primary"),)),
+        ),
+        ("QTabWidget > QTabBar QToolButton", SelectorTarget("QToolButton")),
+        ('[voidMode="light"] QLabel', SelectorTarget("QLabel")),
+        ('*[voidMode="light"]', SelectorTarget("*", (("voidMode", "light"),))),
+    ],
+)
+def test_selector_target(selector, target):
+    assert qss.selector_target(selector) == target
+
+
+def test_universal_targets():
+    assert SelectorTarget("QWidget").universal
+    assert SelectorTarget("*").universal
+    assert not SelectorTarget("QWidget", (("class", "card"),)).universal
+    assert not SelectorTarget("QFrame").universal
+
+
+def test_scope_selector_scopes_descendants_and_the_root_itself():
+    assert qss.scope_selector("QLabel:hover", "voidScope", "dark-1") == [
+        '*[voidScope="dark-1"] QLabel:hover',
+        'QLabel[voidScope="dark-1"]:hover',
+    ]
+    # A compound selector's subject is never the tagged root.
+    assert qss.scope_selector("QFrame > QLabel", "voidScope", "dark-1") == [
+        '*[voidScope="dark-1"] QFrame > QLabel',
+    ]
+
+
+def test_scope_qss_scopes_every_selector():
+    scoped = qss.scope_qss(SHEET, "voidScope", "k")
+    rules = qss.parse_rules(scoped)
+    assert len(rules) == len(qss.parse_rules(SHEET))
+    for rule in rules:
+        assert all('[voidScope="k"]' in selector for selector in rule.selectors)
+
+
+def test_prune_qss_keeps_available_types_and_retargets_universal_rules():
+    pruned = qss.prune_qss(
+        SHEET,
+        available={"QWidget", "QPushButton", "QAbstractButton"},
+        universal=("QPushButton", "QLabel"),
+    )
+    assert [rule.selectors for rule in qss.parse_rules(pruned)] == [
+        ("QPushButton", "QLabel"),
+        ("QPushButton", 'QPushButton[class="primary"]:hover'),
+    ]
+
+
+def test_prune_qss_drops_universal_rules_without_targets():
+    assert qss.prune_qss("QWidget { color: red; }", set(), ()) == ""
+
+
+def test_minify_qss():
+    assert qss.minify_qss(SHEET) == (
+        "QWidget{background:transparent}"
+        'QPushButton,QPushButton[class="primary"]:hover{color:#f5f0eb}'
+        "QScrollBar::handle:vertical{background:#2a2521}"
+        "QTabWidget > QTabBar QToolButton{border:none}"
+    )
@@ -0,0 +1,79 @@
+"""Cached drop shadows: the nine-patch sibling follows its card."""
+
+import math
+
+import pytest
+
+pytest.importorskip("PySide6.QtWidgets")
+
+from PySide6.QtCore import QCoreApplication, QEvent, QRect  # noqa: E402
+from PySide6.QtWidgets import QWidget  # noqa: E402
+
+from void_ui.shadow import DropShadow  # noqa: E402
+from void_ui.widgets import VoidCard  # noqa: E402
+
+MARGIN = math.ceil(VoidCard.SHADOW.blur)
+DX, DY = VoidCard.SHADOW.offset
+
+
+def _expected(card: VoidCard) -> QRect:
+    return card.geometry().translated(DX, DY).adjusted(-MARGIN, -MARGIN, MARGIN, MARGIN)
+
+
+@pytest.fixture
+def window(qapp):
+    window = QWidget()
+    window.resize(400, 300)
+    window.show()
+    yield window
+    window.close()
+    window.deleteLater()
+
+
+def test_shadow_follows_the_card(window):
+    card = VoidCard("elevated")
+    shadow = card._shadow
+    assert shadow.isHidden()
+
+    # Parented later, e.g. by a layout.
+    card.setParent(window)
+    card.setGeometry(20, 30, 100, 60)
+    card.show()
+    assert shadow.parentWidget() is window
+    assert shadow.isVisible()
+    assert shadow.geometry() == _expected(card)
+
+    card.move(80, 90)
+    assert shadow.geometry() == _expected(card)
+    card.resize(160, 40)
+    assert shadow.geometry() == _expected(card)
+
+    card.hide()
+    assert shadow.isHidden()
+    card.show()
+    assert shadow.isVisible()
+
+
+def test_shadow_paints_around_the_card(window):
+    card = VoidCard("elevated", parent=window)
+    card.setGeometry(40, 40, 120, 80)
+    card.show()
+    image = window.grab().toImage()
+    background = image.pixelColor(5, 5)
+
+    # Below the card the offset shadow darkens the window; far away it does not.
+    below = image.pixelColor(100, 40 + 80 + DY)
+    assert below.lightness() < background.lightness()
+    assert image.pixelColor(300, 250) == background
+
+
+def test_shadow_is_deleted_with_the_card(window):
+    card = VoidCard("elevated", parent=window)
+    card.show()
+    assert window.findChildren(DropShadow)
+
+    card.deleteLater()
+    # The card, then the shadow it schedules for deletion.
+    for _ in range(2):
+        QCoreApplication.sendPostedEvents(None, QEvent.DeferredDelete)
+    assert not window.findChildren(DropShadow)
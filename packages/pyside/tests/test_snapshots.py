@@ -0,0 +1,53 @@
+"""Snapshot runner: the golden set, cases and perceptual diffs."""
+
+from pathlib import Path
+
+import pytest
+
+from void_ui import snapshots
+from void_ui.theme import ThemeMode
+
+GOLDEN = Path(__file__).parent / "snapshots"
+
+
+def test_cases_cover_every_variant_in_both_modes():
+    matrix = snapshots.cases()
+    assert {case.widget for case in matrix} == set(snapshots.VARIANTS)
+    assert len(matrix) == 2 * sum(len(v) for v in snapshots.VARIANTS.values())
+    assert snapshots.cases(["VoidCard"], [ThemeMode.DARK])[0].name == "VoidCard-default-dark"
+    with pytest.raises(ValueError, match="VoidSlider"):
+        snapshots.cases(["VoidSlider"])
+
+
+def test_every_case_has_a_golden():
+    names = {path.stem for path in GOLDEN.glob("*.png")}
+    assert names == {case.name for case in snapshots.cases()}
+
+
+def test_snapshots_match_goldens(qapp, tmp_path):
+    results = snapshots.run(golden=GOLDEN, output=tmp_path, jobs=1, repeat=1)
+
+    assert {result.widget for result in results} == set(snapshots.VARIANTS)
+    failed = [f"{r.name}: {r.status} {r.diff_fraction:.2%}" for r in results if r.status != "match"]
+    assert not failed, failed
+    assert (tmp_path / "report.json").is_file()
+    assert not list(tmp_path.glob("*.png"))
+
+
+def test_perceptual_diff(qapp):
+    from PySide6.QtGui import QColor, QImage
+
+    golden = QImage(10, 10, QImage.Format_RGB32)
+    golden.fill(QColor("#0f0d0b"))
+    actual = golden.copy()
+    # Anti-aliasing noise stays under the threshold.
+    actual.setPixelColor(0, 0, QColor("#110f0d"))
+    assert snapshots.perceptual_diff(actual, golden).pixels == 0
+
+    actual.setPixelColor(5, 5, QColor("#e8a87c"))
+    diff = snapshots.perceptual_diff(actual, golden)
+    assert diff.pixels == 1
+    assert diff.fraction == pytest.approx(0.01)
+    assert diff.image.pixelColor(5, 5) == QColor(255, 0, 0)
+
+    assert snapshots.perceptual_diff(QImage(5, 5, QImage.Format_RGB32), golden).fraction == 1.0
@@ -0,0 +1,124 @@
+"""Virtualized table: chunk eviction, streaming and column sampling."""
+
+import sqlite3
+
+import pytest
+
+from void_ui.table import IterableSource, SqliteSource, VoidTable, VoidTableModel
+
+COLUMNS = ["id", "shot", "frames"]
+
+
+class CountingSource:
+    """Random-access source that records every fetch."""
+
+    columns = COLUMNS
+
+    def __init__(self, rows: int) -> None:
+        self.rows = rows
+        self.fetches: list[int] = []
+
+    def row_count(self) -> int:
+        return self.rows
+
+    def fetch(self, start: int, count: int) -> list[tuple]:
+        self.fetches.append(start)
+        stop = min(start + count, self.rows)
+        return [(i, f"sh{i:04d}", i * 2) for i in range(start, stop)]
+
+
+@pytest.fixture
+def connection():
+    connection = sqlite3.connect(":memory:")
+    connection.execute("CREATE TABLE jobs (id INTEGER PRIMARY KEY, shot TEXT, frames INTEGER)")
+    connection.executemany(
+        "INSERT INTO jobs VALUES (?, ?, ?)", ((i, f"sh{i:04d}", i * 2) for i in range(10_000))
+    )
+    yield connection
+    connection.close()
+
+
+def _queries(connection):
+    queries: list[str] = []
+    connection.set_trace_callback(queries.append)
+    return queries
+
+
+def test_random_access_keeps_at_most_max_chunks(qapp):
+    source = CountingSource(1_000)
+    model = VoidTableModel(source, chunk_size=10, max_chunks=3)
+
+    for index in range(0, 1_000, 10):
+        assert model.row(index)[0] == index
+    assert len(model._chunks) == 3
+    assert list(model._chunks) == [97, 98, 99]
+
+
+def test_least_recently_used_chunk_is_evicted(qapp):
+    source = CountingSource(100)
+    model = VoidTableModel(source, chunk_size=10, max_chunks=2)
+
+    model.row(0)
+    model.row(10)
+    model.row(5)        # chunk 0 is now the most recent
+    model.row(20)       # evicts chunk 1
+    assert list(model._chunks) == [0, 2]
+
+    source.fetches.clear()
+    model.row(1)
+    model.row(11)
+    assert source.fetches == [10]
+
+
+def test_row_past_the_end_is_none(qapp):
+    model = VoidTableModel(CountingSource(15), chunk_size=10)
+    assert model.row(14)[0] == 14
+    assert model.row(15) is None
+
+
+def test_streaming_source_fetches_in_chunks(qapp):
+    rows = ((i, f"sh{i:04d}", i * 2) for i in range(25))
+    model = VoidTableModel(IterableSource(rows, COLUMNS), chunk_size=10)
+
+    assert model.streaming
+    assert model.rowCount() == 0
+    while model.canFetchMore():
+        model.fetchMore()
+    assert model.rowCount() == 25
+    assert model.row(24)[0] == 24
+
+
+def test_sample_rows_issues_at_most_one_query(qapp, connection):
+    source = SqliteSource(connection, "SELECT * FROM jobs ORDER BY id")
+    source.row_count()
+    model = VoidTableModel(source, chunk_size=256)
+    queries = _queries(connection)
+
+    sample = model.sample_rows(200)
+    assert len(queries) == 1
+    assert len(sample) == 200
+    assert sample[0][0] == 0
+
+    model.sample_rows(200)
+    assert len(queries) == 1
+
+
+def test_sample_rows_spreads_over_fetched_rows(qapp):
+    source = CountingSource(1_000)
+    model = VoidTableModel(source, chunk_size=100)
+    model.row(0)
+    model.row(500)
+
+    sample = model.sample_rows(4)
+    assert [row[0] for row in sample] == [0, 50, 500, 550]
+    assert source.fetches == [0, 500]
+
+
+def test_table_sizes_columns_from_one_chunk(qapp, connection):
+    queries = _queries(connection)
+    table = VoidTable(SqliteSource(connection, "SELECT * FROM jobs ORDER BY id"))
+
+    assert table.model().rowCount() == 10_000
+    # The column probe, the count and a single page for the sample.
+    assert len(queries) == 3
+    assert table.columnWidth(1) > 0
@@ -0,0 +1,232 @@
+"""Theme application and incremental mode switching."""
+
+import pytest
+
+pytest.importorskip("PySide6.QtWidgets")
+
+from PySide6.QtWidgets import QCheckBox, QFrame, QLineEdit, QVBoxLayout, QWidget  # noqa: E402
+
+from void_ui import VoidBadge, VoidButton, VoidLabel, VoidProgress, qss, widgets  # noqa: E402
+from void_ui.theme import (  # noqa: E402
+    MODE_PROPERTY,
+    Theme,
+    ThemeMode,
+    clear_qss_cache,
+    qss_cache_info,
+)
+
+
+def _panel() -> QWidget:
+    """A panel of styled widgets inside plain containers."""
+    root = QWidget()
+    layout = QVBoxLayout(root)
+    for i in range(10):
+        row = QFrame()
+        row_layout = QVBoxLayout(row)
+        for widget in (
+            VoidLabel(f"row {i}"),
+            VoidButton("open", variant="primary"),
+            VoidBadge("ok", variant="moss"),
+            VoidProgress(value=i * 10),
+            QCheckBox("check"),
+            QLineEdit("edit"),
+        ):
+            row_layout.addWidget(widget)
+        layout.addWidget(row)
+    return root
+
+
+def _count(root: QWidget) -> int:
+    return 1 + len(root.findChildren(QWidget))
+
+
+HOST_SHEET = "QPushButton { background: #303030; }"
+
+
+def _host(panels: int = 3) -> tuple[QWidget, list[QWidget]]:
+    """A host window with its own sheet, holding ``panels`` panels."""
+    host = QWidget()
+    host.setStyleSheet(HOST_SHEET)
+    layout = QVBoxLayout(host)
+    roots = [_panel() for _ in range(panels)]
+    for root in roots:
+        layout.addWidget(root)
+    return host, roots
+
+
+def test_builtin_modes_differ_in_no_universal_rule():
+    targets = qss.rule_targets(Theme().diff(ThemeMode.LIGHT))
+    assert targets
+    assert not any(target.universal for target in targets)
+
+
+def test_cache_hit_returns_the_same_interned_sheet():
+    clear_qss_cache()
+    assert qss_cache_info() == (0, 0, 32, 0)
+
+    sheet = Theme().generate_qss()
+    assert qss_cache_info() == (0, 1, 32, 1)
+    assert Theme().generate_qss() is sheet
+    assert qss_cache_info() == (1, 1, 32, 1)
+
+    clear_qss_cache()
+    assert qss_cache_info() == (0, 0, 32, 0)
+    # Rendered again, the sheet interns to the string still in use.
+    assert Theme().generate_qss() is sheet
+    assert qss_cache_info().misses == 1
+
+
+def test_switch_repolishes_fewer_widgets_than_apply(qapp):
+    root = _panel()
+    theme = Theme()
+    theme.apply(root, switchable=True)
+    switchable_sheet = root.styleSheet()
+
+    touched = theme.switch(root)
+
+    assert 0 < touched < _count(root)
+    assert theme.mode == ThemeMode.LIGHT
+    assert root.property(MODE_PROPERTY) == ThemeMode.LIGHT.value
+    # The two-mode sheet stays installed for the next switch.
+    assert root.styleSheet() == switchable_sheet
+    assert theme.switch(root) == touched
+    assert theme.mode == ThemeMode.DARK
+
+
+def test_switch_to_current_mode_installs_switchable_sheet(qapp):
+    root = _panel()
+    theme = Theme()
+    theme.apply(root)
+
+    assert theme.switch(root, theme.mode) == _count(root)
+    assert root.styleSheet() == theme.generate_switchable_qss()
+    assert theme.switch(root, theme.mode) == 0
+
+
+def test_scoped_apply_leaves_the_host_alone(qapp, restyled):
+    host, roots = _host()
+    restyled.widgets.clear()
+    theme = Theme()
+    theme.apply(roots, scoped=True)
+
+    assert host.styleSheet() == HOST_SHEET
+    for root in roots:
+        assert root.styleSheet() == theme.generate_scoped_qss()
+    assert id(host) not in restyled.widgets
+    assert len(restyled.widgets) <= sum(_count(root) for root in roots)
+
+    restyled.widgets.clear()
+    theme.apply(roots, scoped=True)
+    assert not restyled.widgets
+
+
+def test_scoped_sheets_do_not_grow_across_toggles(qapp):
+    host, roots = _host()
+    theme = Theme()
+    theme.apply(roots, scoped=True)
+    sizes = {theme.mode: len(roots[0].styleSheet())}
+
+    for _ in range(4):
+        theme.toggle()
+        theme.apply(roots, scoped=True)
+        sizes.setdefault(theme.mode, len(roots[0].styleSheet()))
+        assert len(roots[0].styleSheet()) == sizes[theme.mode]
+        for root in roots:
+            assert root.styleSheet() == theme.generate_scoped_qss()
+    assert host.styleSheet() == HOST_SHEET
+
+
+def test_scoped_root_keeps_its_own_sheet(qapp):
+    host, roots = _host(1)
+    roots[0].setStyleSheet("QLineEdit { border: none; }")
+    theme = Theme()
+    theme.apply(roots, scoped=True)
+    theme.toggle()
+    theme.apply(roots, scoped=True)
+
+    assert roots[0].styleSheet() == (
+        "QLineEdit { border: none; }\n" + theme.generate_scoped_qss()
+    )
+
+
+def test_panels_inside_a_scoped_container_install_no_sheet(qapp, monkeypatch, restyled):
+    container, roots = _host()
+    container.setStyleSheet("")
+    container.show()
+    theme = Theme()
+    theme.apply(container, scoped=True)
+    qapp.processEvents()
+
+    repolished = []
+    monkeypatch.setattr(widgets, "_repolish", repolished.append)
+    restyled.widgets.clear()
+    theme.apply(roots, scoped=True)
+    assert all(root.styleSheet() == "" for root in roots)
+    # Already styled by the container's sheet: only the roots re-resolve
+    # their own property.
+    assert repolished == roots
+    assert not restyled.widgets
+
+    repolished.clear()
+    theme.apply(roots, scoped=True)
+    assert not repolished
+
+
+def test_sibling_panels_share_one_sheet_on_a_plain_parent(qapp, restyled):
+    parent, roots = _host()
+    parent.setStyleSheet("")
+    theme = Theme()
+    theme.apply(roots, scoped=True)
+
+    assert parent.styleSheet() == theme.generate_scoped_qss()
+    assert all(root.styleSheet() == "" for root in roots)
+
+    theme.toggle()
+    theme.apply(roots, scoped=True)
+    assert parent.styleSheet() == theme.generate_scoped_qss()
+    assert all(root.styleSheet() == "" for root in roots)
+
+    restyled.widgets.clear()
+    theme.apply(roots, scoped=True)
+    assert not restyled.widgets
+
+
+def test_sibling_themed_alone_leaves_the_shared_sheet_to_the_others(qapp):
+    parent, roots = _host()
+    parent.setStyleSheet("")
+    theme = Theme()
+    theme.apply(roots, scoped=True)
+    shared = parent.styleSheet()
+
+    theme.toggle()
+    theme.apply(roots[:2], scoped=True)
+    assert parent.styleSheet() == shared
+    assert all(root.styleSheet() == theme.generate_scoped_qss() for root in roots[:2])
+    assert roots[2].styleSheet() == ""
+
+
+def test_sheet_set_by_the_host_after_apply_is_kept(qapp):
+    host, roots = _host(1)
+    theme = Theme()
+    theme.apply(roots, scoped=True)
+    roots[0].setStyleSheet("QLineEdit { border: none; }")
+    theme.toggle()
+    theme.apply(roots, scoped=True)
+
+    assert roots[0].styleSheet() == (
+        "QLineEdit { border: none; }\n" + theme.generate_scoped_qss()
+    )
+
+
+@pytest.mark.parametrize("how", ["native", "lean"])
+def test_switch_without_a_full_sheet_computes_no_diff(qapp, monkeypatch, how):
+    root = _panel()
+    theme = Theme(native=how == "native")
+    theme.apply(root, lean=how == "lean")
+
+    def diff(mode):
+        raise AssertionError("diffed the full sheets")
+
+    monkeypatch.setattr(theme, "diff", diff)
+    assert theme.switch(root) == _count(root)
+    assert theme.mode == ThemeMode.LIGHT
@@ -0,0 +1,77 @@
+"""Toast manager: collapsing duplicates, rate limiting and pooled widgets."""
+
+import time
+
+import pytest
+
+pytest.importorskip("PySide6.QtWidgets")
+
+from PySide6.QtWidgets import QWidget  # noqa: E402
+
+from void_ui.toast import LEAVE_DURATION, ToastManager  # noqa: E402
+
+
+@pytest.fixture
+def host(qapp):
+    host = QWidget()
+    host.resize(800, 600)
+    yield host
+    host.deleteLater()
+
+
+def _settle(toasts: ToastManager, after: float = 1.0) -> None:
+    """Run the frame ``after`` seconds from now, past every animation."""
+    toasts._tick(time.perf_counter() + after)
+
+
+def test_duplicates_collapse_into_one_toast(host):
+    toasts = ToastManager(host, rate=1e-6, burst=1)
+    toasts.show("Render done", variant="success")
+    toasts.show("Render done", variant="success")
+    toasts.show("Render done", variant="danger")
+    toasts.show("Render done", variant="danger")
+
+    (toast,) = toasts._visible
+    assert (toast.message, toast.count) == ("Render done", 2)
+    assert toast._display_text() == "Render done  ×2"
+    # The other variant waits, counted, behind the rate limit.
+    assert toasts._queue[("Render done", "danger")][0] == 2
+    stats = toasts.stats()
+    assert (stats.shown, stats.collapsed, stats.queued, stats.visible) == (1, 2, 1, 1)
+
+
+def test_token_bucket_queues_the_burst_and_drops_the_overflow(host):
+    toasts = ToastManager(host, max_visible=10, rate=1e-6, burst=3, max_queued=2)
+    for i in range(7):
+        toasts.show(f"job {i}")
+
+    assert [toast.message for toast in toasts._visible] == ["job 2", "job 1", "job 0"]
+    # The oldest queued messages make way for newer ones.
+    assert [message for message, _ in toasts._queue] == ["job 5", "job 6"]
+    stats = toasts.stats()
+    assert (stats.shown, stats.dropped, stats.queued) == (3, 2, 2)
+
+    # Once tokens refill, the queue drains.
+    toasts.rate = 1000.0
+    toasts._drain(time.perf_counter() + 1)
+    assert [toast.message for toast in toasts._visible][:2] == ["job 6", "job 5"]
+    assert toasts.stats().queued == 0
+
+
+def test_dismissed_toast_widget_is_reused(host):
+    toasts = ToastManager(host)
+    toasts.show("first")
+    (first,) = toasts._visible
+
+    toasts.dismiss(first)
+    _settle(toasts, LEAVE_DURATION + 1)
+    assert toasts._visible == []
+    assert toasts.stats().pooled == 1
+    assert first.isHidden()
+
+    toasts.show("second", variant="warning")
+    (second,) = toasts._visible
+    assert second is first
+    assert (second.message, second.variant, second.count) == ("second", "warning", 1)
+    assert second.leaving_since is None
+    assert toasts.stats().pooled == 0
@@ -0,0 +1,222 @@
+"""Token files: JSON, TOML and tokens.css parsing, and TokenWatcher reloads."""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+from void_ui.colors import DarkColors, LightColors
+from void_ui.theme import SCOPE_PROPERTY, Theme, ThemeMode
+from void_ui.tokens import TokenWatcher, load_tokens, parse_css_tokens
+
+TOKENS_CSS = Path(__file__).parents[2] / "css" / "src" / "tokens.css"
+
+
+def test_json_flat_table_is_for_the_current_mode(tmp_path):
+    path = tmp_path / "tokens.json"
+    path.write_text(json.dumps({"accent": "#ff0000", "accent-hover": " #aa0000 ", "radius": 4}))
+    assert load_tokens(path) == {None: {"accent": "#ff0000", "accent_hover": "#aa0000"}}
+
+
+def test_toml_mode_tables(tmp_path):
+    path = tmp_path / "tokens.toml"
+    path.write_text(
+        'accent = "#ff0000"\n'
+        "[dark]\n"
+        'void = "#000000"\n'
+        "[light]\n"
+        'void = "#ffffff"\n'
+        'not_a_color = "#123456"\n'
+    )
+    assert load_tokens(path) == {
+        ThemeMode.DARK: {"void": "#000000"},
+        ThemeMode.LIGHT: {"void": "#ffffff"},
+        None: {"accent": "#ff0000"},
+    }
+
+
+def test_unsupported_suffix(tmp_path):
+    with pytest.raises(ValueError, match="Unsupported token file"):
+        load_tokens(tmp_path / "tokens.yaml")
+
+
+def test_css_resolves_vars_and_color_mix():
+    tokens = parse_css_tokens(
+        "@import url('x.css');\n"
+        "/* :root { --void: #111111; } */\n"
+        ":root { --peach: #e8a87c; --accent: var(--peach); "
+        "--accent-bg: color-mix(in srgb, var(--peach) 12%, transparent); --void: #0f0d0b; }\n"
+        '[data-theme="light"] { --peach: #c0703c; --void: #faf8f5; }\n'
+        ".button { --accent: #000000; }\n"
+    )
+    assert tokens[ThemeMode.DARK] == {
+        "accent": "#e8a87c",
+        "accent_bg": "rgba(232, 168, 124, 0.12)",
+        "peach": "#e8a87c",
+        "void": "#0f0d0b",
+    }
+    # Light overrides the variables the dark values were derived from.
+    assert tokens[ThemeMode.LIGHT]["accent"] == "#c0703c"
+    assert tokens[ThemeMode.LIGHT]["void"] == "#faf8f5"
+
+
+def test_css_circular_reference():
+    with pytest.raises(ValueError, match="Circular"):
+        parse_css_tokens(":root { --accent: var(--peach); --peach: var(--accent); }")
+
+
+@pytest.mark.skipif(not TOKENS_CSS.is_file(), reason="CSS package not checked out")
+def test_shipped_tokens_css_matches_the_built_in_schemes():
+    tokens = load_tokens(TOKENS_CSS)
+    for mode, colors in ((ThemeMode.DARK, DarkColors), (ThemeMode.LIGHT, LightColors)):
+        for name in ("void", "surface", "accent", "white", "gray"):
+            assert tokens[mode][name].lower() == getattr(colors, name).lower()
+
+
+@pytest.fixture
+def panel(qapp):
+    from PySide6.QtWidgets import QVBoxLayout, QWidget
+
+    from void_ui.widgets import VoidButton, VoidLabel
+
+    root = QWidget()
+    layout = QVBoxLayout(root)
+    layout.addWidget(VoidButton("Render", variant="primary"))
+    layout.addWidget(VoidLabel("Status"))
+    yield root
+    root.deleteLater()
+
+
+def test_reload_installs_one_sheet_on_the_target(tmp_path, panel):
+    from void_ui.widgets import VoidButton
+
+    theme = Theme()
+    theme.apply(panel)
+    path = tmp_path / "tokens.json"
+    path.write_text(json.dumps({"dark": {"peach": "#ff0000"}}))
+    watcher = TokenWatcher(theme, panel, path)
+
+    assert theme.colors.peach == "#ff0000"
+    assert panel.styleSheet() == theme.generate_qss()
+    assert all(not w.styleSheet() for w in panel.findChildren(VoidButton))
+    button = panel.findChild(VoidButton)
+    image = button.grab().toImage()
+    assert image.pixelColor(image.width() // 2, 2).name() == "#ff0000"
+
+    # Only the other mode changed: the plain sheet stays.
+    sheet = panel.styleSheet()
+    path.write_text(json.dumps({"dark": {"peach": "#ff0000"}, "light": {"peach": "#00ff00"}}))
+    assert watcher.reload() == 0
+    assert panel.styleSheet() == sheet
+
+    path.write_text("{ not json")
+    failures = []
+    watcher.failed.connect(failures.append)
+    assert watcher.reload() == -1
+    assert failures and theme.colors.peach == "#ff0000"
+    watcher.stop()
+
+
+def _count(root) -> int:
+    from PySide6.QtWidgets import QWidget
+
+    return 1 + len(root.findChildren(QWidget))
+
+
+def _watch(theme, target, tmp_path, tokens=None):
+    path = tmp_path / "tokens.json"
+    path.write_text(json.dumps(tokens or {}))
+    return path, TokenWatcher(theme, target, path)
+
+
+def test_reload_returns_the_widgets_restyled(tmp_path, panel, restyled):
+    from void_ui.widgets import active_colors
+
+    theme = Theme()
+    theme.apply(panel)
+    path, watcher = _watch(theme, panel, tmp_path)
+
+    restyled.widgets.clear()
+    path.write_text(json.dumps({"dark": {"peach": "#ff0000"}}))
+    assert watcher.reload() == len(restyled.widgets) == _count(panel)
+
+    # No rule uses ``clay``: nothing is restyled, painted widgets follow it.
+    restyled.widgets.clear()
+    path.write_text(json.dumps({"dark": {"peach": "#ff0000", "clay": "#00ff00"}}))
+    assert watcher.reload() == 0
+    assert not restyled.widgets
+    assert active_colors().clay == "#00ff00"
+    watcher.stop()
+
+
+def test_reload_keeps_a_scoped_root_scoped(tmp_path, panel):
+    panel.setStyleSheet("QLineEdit { border: none; }")
+    theme = Theme()
+    theme.apply([panel], scoped=True)
+    _, watcher = _watch(theme, [panel], tmp_path, {"dark": {"peach": "#ff0000"}})
+
+    assert theme.colors.peach == "#ff0000"
+    assert panel.property(SCOPE_PROPERTY) == theme.scope_key()
+    assert panel.styleSheet() == "QLineEdit { border: none; }\n" + theme.generate_scoped_qss()
+    watcher.stop()
+
+
+def test_reload_keeps_a_lean_sheet_lean(tmp_path, panel):
+    theme = Theme()
+    theme.apply(panel, lean=True)
+    classes = theme._lean
+    _, watcher = _watch(theme, panel, tmp_path, {"dark": {"peach": "#ff0000"}})
+
+    assert theme._lean == classes
+    assert panel.styleSheet() == theme.generate_lean_qss(panel)
+    assert "#ff0000" in panel.styleSheet()
+    assert len(panel.styleSheet()) < len(theme.generate_qss()) // 2
+    watcher.stop()
+
+
+def test_reload_of_the_other_mode_waits_for_the_switch(tmp_path, panel):
+    theme = Theme()
+    theme.apply(panel, switchable=True)
+    sheet = panel.styleSheet()
+    path, watcher = _watch(theme, panel, tmp_path)
+
+    path.write_text(json.dumps({"light": {"peach": "#00ff00"}}))
+    assert watcher.reload() == 0
+    assert panel.styleSheet() == sheet
+
+    theme.switch(panel)
+    assert theme.colors.peach == "#00ff00"
+    assert panel.styleSheet() == theme.generate_switchable_qss()
+
+    path.write_text(json.dumps({"light": {"peach": "#0000ff"}}))
+    assert watcher.reload() == _count(panel)
+    assert panel.styleSheet() == theme.generate_switchable_qss()
+    assert "#0000ff" in panel.styleSheet()
+    watcher.stop()
+
+
+def test_reload_reinstalls_the_native_palette(tmp_path, panel):
+    from PySide6.QtGui import QPalette
+
+    theme = Theme(native=True)
+    theme.apply(panel)
+    _, watcher = _watch(theme, panel, tmp_path, {"dark": {"void": "#101010"}})
+
+    assert panel.palette().color(QPalette.Window).name() == "#101010"
+    assert panel.styleSheet() == ""
+    watcher.stop()
+
+
+def test_missing_toml_parser_is_reported(tmp_path, panel, monkeypatch):
+    monkeypatch.setitem(sys.modules, "tomllib", None)
+    monkeypatch.setitem(sys.modules, "tomli", None)
+    path = tmp_path / "tokens.toml"
+    watcher = TokenWatcher(Theme(), panel, path)
+    failures = []
+    watcher.failed.connect(failures.append)
+
+    path.write_text('accent = "#ff0000"\n')
+    assert watcher.reload() == -1
+    assert failures and failures[0].startswith("tokens.toml:")
+    watcher.stop()
@@ -0,0 +1,137 @@
+"""Void widgets: hover transitions, painted progress bars, batched polishing
+and the live registry."""
+
+import pytest
+from PySide6.QtCore import QEvent, QObject
+from PySide6.QtWidgets import QProxyStyle
+
+from void_ui.animation import animator
+from void_ui.clock import frame_clock
+from void_ui.widgets import (
+    VoidBadge,
+    VoidButton,
+    VoidProgress,
+    batch_polish,
+    live_widgets,
+    widget_stats,
+)
+
+shiboken6 = pytest.importorskip("shiboken6")
+
+
+class _CountingStyle(QProxyStyle):
+    """Counts polish() calls per widget."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.polished: dict[int, int] = {}
+
+    def polish(self, widget, *args) -> None:
+        if not args:
+            self.polished[id(widget)] = self.polished.get(id(widget), 0) + 1
+        super().polish(widget, *args)
+
+
+class _Paints(QObject):
+    """Counts the paint events of the widgets it filters."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.count = 0
+
+    def eventFilter(self, watched: QObject, event: QEvent) -> bool:
+        if event.type() == QEvent.Paint:
+            self.count += 1
+        return False
+
+
+def test_button_at_rest_has_no_python_paint_handler(qapp):
+    assert "paintEvent" not in VoidButton.__dict__
+
+
+def test_hover_transition_paints_then_hands_back(qapp):
+    button = VoidButton("Open", variant="primary")
+    button.resize(120, 32)
+    rest = button.grab().toImage()
+
+    button._animate_hover(1.0)
+    button._set_hover(0.5)
+    halfway = button.grab().toImage()
+    assert halfway != rest
+
+    animator().finish_all()
+    assert button._hover is None
+    assert button.grab().toImage() == rest
+
+
+def test_painted_progress_repaints_once_per_frame(qapp):
+    bar = VoidProgress(painted=True)
+    bar.resize(200, 8)
+    bar.show()
+    qapp.processEvents()
+    paints = _Paints()
+    bar.installEventFilter(paints)
+
+    for value in range(1, 101):
+        bar.setValue(value)
+    clock = frame_clock()
+    clock._timer.stop()  # tick by hand below
+    qapp.processEvents()
+    assert paints.count == 0
+    assert bar.value() == 100
+
+    clock._tick()
+    qapp.processEvents()
+    assert paints.count == 1
+    assert bar.value() == 100
+    bar.hide()
+
+
+def test_batch_polish_repolishes_each_widget_once(qapp):
+    style = _CountingStyle()
+    buttons = [VoidButton("Open") for _ in range(5)]
+    for button in buttons:
+        button.setStyle(style)
+        button.ensurePolished()
+    style.polished.clear()
+
+    with batch_polish():
+        for button in buttons:
+            button.variant = "primary"
+            button.variant = "ghost"
+        with batch_polish():
+            buttons[0].variant = "primary"
+        assert not style.polished
+
+    assert style.polished == {id(button): 1 for button in buttons}
+
+
+def test_deferred_batch_polishes_on_the_event_loop(qapp):
+    style = _CountingStyle()
+    button = VoidButton("Open")
+    button.setStyle(style)
+    button.ensurePolished()
+    style.polished.clear()
+
+    with batch_polish(defer=True):
+        button.variant = "primary"
+    assert not style.polished
+    qapp.processEvents()
+    assert style.polished == {id(button): 1}
+
+
+def test_registry_counts_drop_when_widgets_are_deleted(qapp):
+    before = widget_stats().get("VoidBadge")
+    before = before.count if before else 0
+    badges = [VoidBadge("ok", variant="moss") for _ in range(4)]
+    others = [VoidBadge("late", variant="lilac") for _ in range(2)]
+
+    assert widget_stats()["VoidBadge"].count == before + 6
+    assert all(badge in live_widgets(VoidBadge, variant="moss") for badge in badges)
+    assert not any(badge in live_widgets(VoidButton) for badge in badges)
+
+    for badge in badges:
+        shiboken6.delete(badge)
+    del badges
+    assert widget_stats()["VoidBadge"].count == before + 2
+    assert all(badge in live_widgets(VoidBadge, variant="lilac") for badge in others)